@@ -0,0 +1,149 @@
+"""
+Solve a level within a time or node budget, for interactive use.
+
+    result = solve_within(level, Budget(seconds=0.5), on_progress=print)
+    results = await asyncio.gather(*(solve_async(level, Budget(seconds=0.5)) for level in levels))
+
+The search is the one of PropagatingSolver, walked one node at a time (see PropagatingSolver.walk), so it stops
+as soon as the budget runs out or its CancellationToken is cancelled. It then returns the partial tiling with the
+most tiles it saw and the status UNKNOWN. On an event loop the search hands control back every progress_every
+nodes, so one loop runs many searches at once.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterator
+
+from solver import PropagatingSolver
+from tiling import Tiling
+
+SOLVED = "solved"
+UNSOLVABLE = "unsolvable"
+UNKNOWN = "unknown"
+
+
+@dataclass
+class Budget:
+    """
+    The most time and nodes a search may use, None for no limit.
+    """
+    seconds: float | None = None
+    nodes: int | None = None
+
+
+class CancellationToken:
+    def __init__(self):
+        """
+        Stops the searches it is given when it is cancelled, also from another thread.
+        """
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+@dataclass
+class Progress:
+    nodes: int
+    depth: int
+    # The estimated part of the search tree that is finished, from 0 to 1.
+    fraction: float
+    seconds: float
+
+
+@dataclass
+class SolveResult:
+    status: str
+    # The solution, or when the status is UNKNOWN the partial tiling with the most tiles, if any.
+    tiling: Tiling | None
+    progress: Progress
+
+    @property
+    def solved(self) -> bool:
+        return self.status == SOLVED
+
+
+class AnytimeSearch:
+    def __init__(self, level, budget: Budget | None = None, token: CancellationToken | None = None,
+                 progress_every: int = 1000):
+        """
+        :param progress_every: The number of nodes between progress events, and between handing back control to
+            the event loop in run_async
+        """
+        self.solver = PropagatingSolver(level)
+        self.budget = budget or Budget()
+        self.token = token
+        self.progress_every = progress_every
+        self.result: SolveResult | None = None
+
+    def steps(self) -> Iterator[Progress]:
+        """
+        Run the search, with a progress event every progress_every nodes and one at the end. The outcome is in
+        result when the generator is done.
+        """
+        start = time.perf_counter()
+        deadline = None if self.budget.seconds is None else start + self.budget.seconds
+        best, best_depth = None, -1
+        progress = Progress(0, 0, 0.0, 0.0)
+        status, tiling = UNSOLVABLE, None
+        number_of_tiles = len(self.solver.tiles)
+        for state, fraction, solution in self.solver.walk():
+            depth = number_of_tiles - sum(state.remaining)
+            progress = Progress(self.solver.nodes, depth, fraction, time.perf_counter() - start)
+            if solution is not None:
+                status, tiling = SOLVED, solution
+                break
+            if depth > best_depth:
+                best, best_depth = self.solver.partial_tiling(), depth
+            if self._stopped(progress, deadline):
+                status, tiling = UNKNOWN, best
+                break
+            if progress.nodes % self.progress_every == 0:
+                yield progress
+        if status == UNSOLVABLE:
+            progress.fraction = 1.0
+        self.result = SolveResult(status, tiling, progress)
+        yield progress
+
+    def _stopped(self, progress: Progress, deadline: float | None) -> bool:
+        return (self.token is not None and self.token.cancelled) or \
+            (self.budget.nodes is not None and progress.nodes >= self.budget.nodes) or \
+            (deadline is not None and time.perf_counter() >= deadline)
+
+    def run(self, on_progress: Callable[[Progress], None] | None = None) -> SolveResult:
+        for progress in self.steps():
+            if on_progress is not None:
+                on_progress(progress)
+        return self.result
+
+    async def run_async(self, on_progress: Callable[[Progress], None] | None = None) -> SolveResult:
+        async for progress in self.progress_events():
+            if on_progress is not None:
+                on_progress(progress)
+        return self.result
+
+    async def progress_events(self) -> AsyncIterator[Progress]:
+        """
+        The progress events of steps, handing back control to the event loop after each.
+        """
+        for progress in self.steps():
+            yield progress
+            await asyncio.sleep(0)
+
+
+def solve_within(level, budget: Budget | None = None, token: CancellationToken | None = None,
+                 on_progress: Callable[[Progress], None] | None = None, progress_every: int = 1000) -> SolveResult:
+    return AnytimeSearch(level, budget, token, progress_every).run(on_progress)
+
+
+async def solve_async(level, budget: Budget | None = None, token: CancellationToken | None = None,
+                      on_progress: Callable[[Progress], None] | None = None,
+                      progress_every: int = 1000) -> SolveResult:
+    return await AnytimeSearch(level, budget, token, progress_every).run_async(on_progress)
@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+
+from anytimeSolving import AnytimeSearch, Budget, CancellationToken, solve_async, solve_within, \
+    SOLVED, UNSOLVABLE, UNKNOWN
+from board import BoardObjective, PathObjective, Point
+from defaultLevels import level48, DEFAULT_TILE_1
+from level import Level
+from tileComponents import COVERED
+from tiling import Tile
+
+
+class TestAnytimeSolvingMethods(unittest.TestCase):
+    # Eight dominoes and a single cell do not fit on a 4x4 board, but it takes a long search to find out.
+    TOO_MANY_TILES_LEVEL = Level(BoardObjective([], shape=(4, 4)),
+                                 [Tile([[COVERED, COVERED]])] * 8 + [Tile([[COVERED]])])
+
+    def test_solved(self):
+        result = solve_within(level48, Budget(seconds=10))
+        self.assertEqual(result.status, SOLVED)
+        self.assertTrue(result.solved)
+        self.assertIsNone(level48.raise_exception_if_tiling_invalid(result.tiling))
+        self.assertTrue(0 <= result.progress.fraction <= 1)
+
+    def test_unsolvable(self):
+        level = Level(BoardObjective([PathObjective.from_points([Point((0, 0)), Point((0, 1))],
+                                                               mandatory_planes=(0, 1))], shape=(2, 2)),
+                      [DEFAULT_TILE_1])
+        result = solve_within(level)
+        self.assertEqual(result.status, UNSOLVABLE)
+        self.assertIsNone(result.tiling)
+        self.assertEqual(result.progress.fraction, 1.0)
+
+    def test_node_budget(self):
+        result = solve_within(self.TOO_MANY_TILES_LEVEL, Budget(nodes=50))
+        self.assertEqual(result.status, UNKNOWN)
+        self.assertEqual(result.progress.nodes, 50)
+        self.assertLess(result.progress.fraction, 1)
+        self.assertGreater(len(result.tiling.tiles), 0)
+
+    def test_time_budget(self):
+        result = self.TOO_MANY_TILES_LEVEL.solve_within(seconds=0)
+        self.assertEqual(result.status, UNKNOWN)
+        self.assertEqual(result.progress.nodes, 1)
+
+    def test_cancelled(self):
+        token = CancellationToken()
+        token.cancel()
+        result = solve_within(self.TOO_MANY_TILES_LEVEL, token=token)
+        self.assertEqual(result.status, UNKNOWN)
+        self.assertEqual(result.progress.nodes, 1)
+
+    def test_progress_events(self):
+        events = []
+        search = AnytimeSearch(self.TOO_MANY_TILES_LEVEL, Budget(nodes=100), progress_every=10)
+        result = search.run(events.append)
+        self.assertEqual([event.nodes for event in events], list(range(10, 100, 10)) + [100])
+        fractions = [event.fraction for event in events]
+        self.assertEqual(fractions, sorted(fractions))
+        self.assertIs(events[-1], result.progress)
+
+    def test_many_searches_on_one_event_loop(self):
+        token = CancellationToken()
+
+        async def cancel_soon():
+            await asyncio.sleep(0)
+            token.cancel()
+
+        async def solve_both():
+            return await asyncio.gather(
+                solve_async(self.TOO_MANY_TILES_LEVEL, token=token, progress_every=10),
+                level48.solve_async(),
+                cancel_soon())
+
+        long_search, short_search, _ = asyncio.run(solve_both())
+        self.assertEqual(long_search.status, UNKNOWN)
+        self.assertEqual(short_search.status, SOLVED)
+
+
+if __name__ == '__main__':
+    unittest.main()
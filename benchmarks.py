@@ -0,0 +1,162 @@
+"""
+Benchmarks for validation, tiling construction and solving on synthetic boards.
+
+    python benchmarks.py --output results.json --baseline benchmarkBaseline.json
+
+Every benchmark is timed on square boards of the given sizes. The results are written as JSON and, when a
+baseline is given, compared against it; the exit code is 1 if some benchmark got slower than the tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable
+
+from board import BoardObjective, PathObjective, Point
+from level import Level
+from tileComponents import COVERED, WEST_FACING_PLANE
+from tiling import Tile, Tiling
+
+DEFAULT_SIZES = (4, 8, 16, 32, 64)
+MAX_SOLVING_SIZE = 16
+DOMINO = Tile([[COVERED, WEST_FACING_PLANE]])
+
+
+def serpentine_points(size: int) -> list[Point]:
+    """
+    The corners of a path that snakes through every row of a size x size board.
+    """
+    points = []
+    for row in range(size):
+        columns = (0, size - 1) if row % 2 == 0 else (size - 1, 0)
+        points += [Point((row, columns[0])), Point((row, columns[1]))]
+    return points
+
+
+def serpentine_string(size: int) -> str:
+    """
+    The same snaking path in the format of BoardObjective.from_string.
+    """
+    rows = []
+    for row in range(size):
+        if row % 2 == 0:
+            cells = ['>'] * (size - 1) + ['v']
+        else:
+            cells = ['v'] + ['<'] * (size - 1)
+        rows.append(cells)
+    rows[0][0] = 'e' if size > 1 else 's'
+    last_row = size - 1
+    rows[last_row][size - 1 if last_row % 2 == 0 else 0] = 'f'
+    return '\n'.join(''.join(cells) for cells in rows)
+
+
+def row_level(size: int) -> Level:
+    """
+    A level with one straight path per row, to be filled with dominoes whose planes all fly along the rows.
+    """
+    paths = [PathObjective.from_points([Point((row, 0)), Point((row, size - 1))]) for row in range(size)]
+    return Level(BoardObjective(paths, shape=(size, size)), [DOMINO] * (size * size // 2))
+
+
+def row_tiling(size: int) -> Tiling:
+    corners = [(row, column) for row in range(size) for column in range(0, size, 2)]
+    return Tiling(corners, [DOMINO] * len(corners), shape=(size, size))
+
+
+def benchmarks(size: int) -> dict[str, Callable[[], object]]:
+    """
+    The benchmarks for one board size, by name. Setup that should not be timed happens here.
+    """
+    points = serpentine_points(size)
+    board_string = serpentine_string(size)
+    level = row_level(size)
+    tiling = row_tiling(size)
+    corners = list(tiling.top_left_corners)
+    tiles = list(tiling.tiles)
+
+    cases = {
+        "path_objective_construction": lambda: PathObjective.from_points(points),
+        "board_objective_from_string": lambda: BoardObjective.from_string(board_string),
+        "tiling_construction": lambda: Tiling(corners, tiles, shape=(size, size)),
+        "tiling_validation": lambda: level.raise_exception_if_tiling_invalid(tiling),
+    }
+    if size <= MAX_SOLVING_SIZE:
+        cases["solving"] = lambda: level.solve()
+    return cases
+
+
+def time_call(function: Callable[[], object], repeat: int) -> float:
+    """
+    The fastest of several runs, in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes=DEFAULT_SIZES, repeat: int = 3) -> dict:
+    results = {}
+    for size in sizes:
+        for name, function in benchmarks(size).items():
+            results[f"{name}[{size}x{size}]"] = {"benchmark": name, "size": size,
+                                                 "seconds": time_call(function, repeat)}
+    return {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 1.25) -> list[str]:
+    """
+    :return: A line for every benchmark that is slower than tolerance times its baseline
+    """
+    regressions = []
+    for key, result in results["results"].items():
+        baseline_result = baseline["results"].get(key)
+        if baseline_result is None:
+            continue
+        ratio = result["seconds"] / baseline_result["seconds"]
+        result["baseline_ratio"] = ratio
+        if ratio > tolerance:
+            regressions.append(f"{key}: {ratio:.2f}x slower than baseline "
+                               f"({result['seconds']:.6f}s vs {baseline_result['seconds']:.6f}s)")
+    return regressions
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the results as JSON to this file instead of standard output")
+    parser.add_argument("--baseline", help="JSON file with earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="Slowdown relative to the baseline that counts as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to the baseline file")
+    arguments = parser.parse_args(arguments)
+
+    results = run(arguments.sizes, arguments.repeat)
+    regressions = []
+    if arguments.baseline and not arguments.save_baseline:
+        with open(arguments.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), arguments.tolerance)
+
+    if arguments.save_baseline:
+        with open(arguments.baseline or "benchmarkBaseline.json", "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import unittest
+
+from benchmarks import serpentine_points, serpentine_string, row_level, row_tiling, run, compare
+from board import BoardObjective, PathObjective
+
+
+class TestSyntheticBoards(unittest.TestCase):
+    def test_serpentine_string_matches_points(self):
+        for size in (2, 4, 6):
+            board = BoardObjective.from_string(serpentine_string(size))
+            self.assertEqual(board.paths, [PathObjective.from_points(serpentine_points(size))])
+            self.assertEqual(len(board.paths[0]), size * size)
+
+    def test_row_tiling_solves_row_level(self):
+        for size in (4, 8):
+            self.assertIsNone(row_level(size).raise_exception_if_tiling_invalid(row_tiling(size)))
+
+
+class TestBenchmarkMethods(unittest.TestCase):
+    def test_run(self):
+        results = run(sizes=(4,), repeat=1)
+        self.assertIn("solving[4x4]", results["results"])
+        self.assertGreater(results["results"]["tiling_validation[4x4]"]["seconds"], 0)
+
+    def test_compare(self):
+        baseline = {"results": {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}}}
+        results = {"results": {"a": {"seconds": 1.1}, "b": {"seconds": 2.0}, "c": {"seconds": 5.0}}}
+        regressions = compare(results, baseline, tolerance=1.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("b:"))
+        self.assertAlmostEqual(results["results"]["a"]["baseline_ratio"], 1.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from cardinalDirections import *
+from tileComponents import Plane, PLANES, UNCOVERED
+from errorsAndExceptions import TileLocationError
+
+
+def location_bit(location, shape: tuple[int, int]) -> int:
+    """
+    The single bit mask of a location, cells are numbered row by row.
+    """
+    return 1 << (int(location[0]) * shape[1] + int(location[1]))
+
+
+def mask_locations(mask: int, shape: tuple[int, int]):
+    """
+    Yield the (row, column) of every bit set in the mask, lowest bit first.
+    """
+    while mask:
+        lowest_bit = mask & -mask
+        yield divmod(lowest_bit.bit_length() - 1, shape[1])
+        mask ^= lowest_bit
+
+
+@dataclass
+class TileMasks:
+    """
+    The cells covered by a tile and its planes per direction, for a tile whose top left corner is at (0, 0).
+    """
+    height: int
+    width: int
+    covered: int
+    planes: dict[CardinalDirection, int]
+
+
+def tile_masks(tile, width: int) -> TileMasks:
+    """
+    The masks of a tile with its top left corner at (0, 0) on a board of the given width.
+    """
+    height, tile_width = tile.content.shape
+    covered = 0
+    planes = {direction: 0 for direction in DIRECTIONS}
+    for (i, j), component in tile.enumerate_components():
+        if component is UNCOVERED:
+            continue
+        bit = 1 << (i * width + j)
+        covered |= bit
+        if isinstance(component, Plane):
+            planes[component.direction] |= bit
+    return TileMasks(height, tile_width, covered, planes)
+
+
+class Bitboard:
+    def __init__(self, shape: tuple[int, int]):
+        """
+        A board stored as integer bit masks: one for the covered cells and one per plane direction.
+        """
+        self.shape = shape
+        self.covered = 0
+        self.planes = {direction: 0 for direction in DIRECTIONS}
+
+    @classmethod
+    def from_tiling(cls, tiling) -> Bitboard:
+        bitboard = cls(tiling.shape)
+        for top_left_corner, tile in zip(tiling.top_left_corners, tiling.tiles):
+            bitboard.add_tile(top_left_corner, tile)
+        return bitboard
+
+    @classmethod
+    def from_filling(cls, board_filling) -> Bitboard:
+        bitboard = cls(board_filling.shape)
+        for (i, j), component in np.ndenumerate(board_filling.filling):
+            if component is UNCOVERED:
+                continue
+            bit = location_bit((i, j), bitboard.shape)
+            bitboard.covered |= bit
+            if component in PLANES:
+                bitboard.planes[component.direction] |= bit
+        return bitboard
+
+    @property
+    def all_planes(self) -> int:
+        return self.planes[NORTH] | self.planes[WEST] | self.planes[SOUTH] | self.planes[EAST]
+
+    def placement_masks(self, top_left_corner: tuple[int, int], tile) -> tuple[int, dict[CardinalDirection, int]]:
+        """
+        The masks of a tile placed at the given top left corner.
+        :raises TileLocationError: If the tile does not fit on the board.
+        """
+        masks = tile.bit_masks(self.shape[1])
+        i, j = top_left_corner
+        if i < 0 or j < 0 or i + masks.height > self.shape[0] or j + masks.width > self.shape[1]:
+            raise TileLocationError("Tile lies outside the board.")
+        shift = i * self.shape[1] + j
+        return masks.covered << shift, {direction: mask << shift for direction, mask in masks.planes.items()}
+
+    def add_tile(self, top_left_corner: tuple[int, int], tile):
+        covered, planes = self.placement_masks(top_left_corner, tile)
+        overlap = self.covered & covered
+        if overlap:
+            raise TileLocationError(f"The tiles overlap at location {next(mask_locations(overlap, self.shape))}.")
+        self.covered |= covered
+        for direction in DIRECTIONS:
+            self.planes[direction] |= planes[direction]
+
+    def remove_tile(self, top_left_corner: tuple[int, int], tile):
+        """
+        Undo add_tile of the same tile at the same corner.
+        """
+        covered, planes = self.placement_masks(top_left_corner, tile)
+        self.covered &= ~covered
+        for direction in DIRECTIONS:
+            self.planes[direction] &= ~planes[direction]
+
+
+@dataclass
+class PathMasks:
+    cells: int
+    corners: int
+    mandatory: int
+    directions: dict[CardinalDirection, int]
+
+    def forward_planes(self, bitboard: Bitboard) -> int:
+        mask = 0
+        for direction, cells in self.directions.items():
+            mask |= bitboard.planes[direction] & cells
+        return mask
+
+    def backward_planes(self, bitboard: Bitboard) -> int:
+        mask = 0
+        for direction, cells in self.directions.items():
+            mask |= bitboard.planes[direction.opposite_direction()] & cells
+        return mask
+
+
+@dataclass
+class ObjectiveMasks:
+    shape: tuple[int, int]
+    allowed_planes: int
+    corners: int
+    mandatory: int
+    paths: list[PathMasks]
+
+    @classmethod
+    def from_objective(cls, objective) -> ObjectiveMasks:
+        shape = objective.shape
+        path_masks = []
+        for path in objective.paths:
+            cells = 0
+            directions = {direction: 0 for direction in DIRECTIONS}
+            for location, direction in zip(path.locations, path.directions):
+                bit = location_bit(location, shape)
+                cells |= bit
+                directions[direction] |= bit
+            corners = 0
+            for corner in path.corners:
+                corners |= location_bit(corner, shape)
+            mandatory = 0
+            for i in path.mandatory_planes:
+                mandatory |= location_bit(path.locations[i], shape)
+            path_masks.append(PathMasks(cells, corners, mandatory, directions))
+
+        allowed, corners, mandatory = 0, 0, 0
+        for masks in path_masks:
+            allowed |= masks.cells
+            corners |= masks.corners
+            mandatory |= masks.mandatory
+        return cls(shape, allowed, corners, mandatory, path_masks)
@@ -0,0 +1,101 @@
+import unittest
+
+from board import *
+from bitboard import Bitboard, location_bit, mask_locations
+from tileComponents import NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE, COVERED, \
+    UNCOVERED
+from tiling import Tile, Tiling
+from errorsAndExceptions import *
+
+
+class TestBitboardMethods(unittest.TestCase):
+    DEFAULT_TILE = Tile([[COVERED, UNCOVERED],
+                         [COVERED, EAST_FACING_PLANE]])
+
+    def test_mask_locations(self):
+        mask = location_bit((0, 1), (3, 3)) | location_bit((2, 2), (3, 3))
+        self.assertEqual(list(mask_locations(mask, (3, 3))), [(0, 1), (2, 2)])
+
+    def test_add_tile(self):
+        bitboard = Bitboard((3, 3))
+        bitboard.add_tile((1, 1), self.DEFAULT_TILE)
+        self.assertEqual(set(mask_locations(bitboard.covered, (3, 3))), {(1, 1), (2, 1), (2, 2)})
+        self.assertEqual(list(mask_locations(bitboard.planes[EAST], (3, 3))), [(2, 2)])
+        self.assertEqual(bitboard.planes[NORTH], 0)
+
+    def test_overlap(self):
+        bitboard = Bitboard((3, 3))
+        bitboard.add_tile((0, 0), self.DEFAULT_TILE)
+        with self.assertRaises(TileLocationError):
+            bitboard.add_tile((1, 0), self.DEFAULT_TILE)
+
+    def test_uncovered_cells_do_not_overlap(self):
+        bitboard = Bitboard((3, 3))
+        bitboard.add_tile((0, 0), self.DEFAULT_TILE)
+        bitboard.add_tile((0, 1), Tile([[COVERED]]))
+        self.assertEqual(bin(bitboard.covered).count('1'), 4)
+
+    def test_outside_board(self):
+        bitboard = Bitboard((3, 3))
+        for top_left_corner in ((2, 0), (0, 2), (-1, 0)):
+            with self.assertRaises(TileLocationError):
+                bitboard.add_tile(top_left_corner, self.DEFAULT_TILE)
+
+    def test_from_tiling_matches_from_filling(self):
+        tiling = Tiling([(0, 0), (1, 1)], [self.DEFAULT_TILE, self.DEFAULT_TILE.rotation(1)], shape=(3, 3))
+        from_filling = Bitboard.from_filling(tiling.filling)
+        self.assertEqual(tiling.bitboard.covered, from_filling.covered)
+        self.assertEqual(tiling.bitboard.planes, from_filling.planes)
+
+
+class TestBitboardValidation(unittest.TestCase):
+    DEFAULT_BOARD = BoardObjective([PathObjective.from_points([Point((1, 1)), Point((1, 3)), Point((3, 3))])],
+                                   shape=(4, 4))
+
+    def assert_same_verdict(self, board: BoardObjective, filling: BoardFilling):
+        try:
+            board.raise_exception_if_filling_invalid(filling)
+            expected = None
+        except InvalidFillingException as exception:
+            expected = type(exception)
+
+        if expected is None:
+            self.assertIsNone(board.raise_exception_if_bitboard_invalid(Bitboard.from_filling(filling)))
+        else:
+            with self.assertRaises(expected):
+                board.raise_exception_if_bitboard_invalid(Bitboard.from_filling(filling))
+
+    def test_masks(self):
+        masks = self.DEFAULT_BOARD.masks
+        self.assertEqual(set(mask_locations(masks.allowed_planes, (4, 4))),
+                         {location.coordinates for location in self.DEFAULT_BOARD.allowed_plane_locations})
+        self.assertEqual(list(mask_locations(masks.corners, (4, 4))), [(1, 3)])
+
+    def test_same_verdict_as_filling_validation(self):
+        plane_options = [COVERED, NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE]
+        boards = [self.DEFAULT_BOARD,
+                  BoardObjective([PathObjective.from_points([Point((3, 3)), Point((1, 3)), Point((1, 1))],
+                                                            flying_forward_mandatory=True, mandatory_planes=(1,))],
+                                 shape=(4, 4))]
+        for board in boards:
+            for location in [(1, 1), (1, 2), (1, 3), (2, 3), (3, 3), (0, 0)]:
+                for component in plane_options:
+                    filling = [[COVERED] * 4 for _ in range(4)]
+                    filling[location[0]][location[1]] = component
+                    self.assert_same_verdict(board, BoardFilling(filling))
+
+    def test_planes_in_different_directions(self):
+        filling = BoardFilling([[COVERED, COVERED, COVERED, COVERED],
+                                [COVERED, WEST_FACING_PLANE, COVERED, COVERED],
+                                [COVERED, COVERED, COVERED, NORTH_FACING_PLANE],
+                                [COVERED, COVERED, COVERED, COVERED]])
+        with self.assertRaises(PlaneDirectionException):
+            self.DEFAULT_BOARD.raise_exception_if_bitboard_invalid(Bitboard.from_filling(filling))
+
+    def test_wrong_shape(self):
+        with self.assertRaises(FillingShapeError):
+            self.DEFAULT_BOARD.raise_exception_if_bitboard_invalid(Bitboard((4, 5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
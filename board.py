@@ -1,24 +1,57 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Iterable
+from collections.abc import Sequence, Set
+from typing import Iterable, Iterator
 import unittest
 import itertools
 import numpy as np
 
 from cardinalDirections import *
-from tileComponents import Plane
-from errorsAndExceptions import MissingPlaneException, PlaneLocationException, PlaneDirectionException, \
-    FillingShapeError
+from tileComponents import Plane, PLANES
+from errorsAndExceptions import InvalidFillingException, MissingPlaneException, PlaneLocationException, \
+    PlaneDirectionException, FillingShapeError
+from bitboard import Bitboard, ObjectiveMasks, mask_locations
+from encodedBoards import EncodedBoardObjective, DIRECTION_CODES
+from cellPathIndex import CellPathIndex
+from boardParser import encode_grid, encode_lines, trace_path, trace_paths
+
+# Points are frozen, their one attribute is set around Point.__setattr__.
+_set_attribute = object.__setattr__
+
 
-@dataclass(frozen=True)
 class Point:
-    coordinates: tuple[int, int]
+    __slots__ = ("coordinates",)
+
+    def __init__(self, coordinates: tuple[int, int]):
+        """
+        An immutable (row, column) location.
+        """
+        _set_attribute(self, "coordinates", coordinates if coordinates.__class__ is tuple else tuple(coordinates))
+
     def __add__(self, other):
-        return Point((self[0] + other[0], self[1]+other[1]))
+        row, column = self.coordinates
+        return Point((row + other[0], column + other[1]))
 
     def __getitem__(self, item):
         return self.coordinates[item]
 
+    def __eq__(self, other):
+        if other.__class__ is Point:
+            return self.coordinates == other.coordinates
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.coordinates)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __repr__(self):
+        return f"Point(coordinates={self.coordinates!r})"
+
+    def __reduce__(self):
+        return Point, (self.coordinates,)
+
 @dataclass
 class Segment:
     direction: CardinalDirection
@@ -74,7 +107,7 @@ class PathFilling:
 
     def enumerate_just_the_planes(self):
         for i, content in enumerate(self.filling):
-            if isinstance(content, Plane):
+            if content in PLANES:
                 yield i, content
 
     def __getitem__(self, item):
@@ -84,45 +117,184 @@ class PathFilling:
         return len(self.filling)
 
 
+# The step of one cell in every direction, indexed by DIRECTION_CODES.
+UNIT_STEPS = np.array([{NORTH: (-1, 0), WEST: (0, 1), SOUTH: (1, 0), EAST: (0, -1)}[direction]
+                       for direction in DIRECTIONS], dtype=np.int8)
+
+
+class ReadOnlyList(Sequence):
+    """
+    A read only list made from an array. Concatenating and copying give plain lists, as for the list it replaces.
+    """
+    def copy(self) -> list:
+        return list(self)
+
+    def __add__(self, other) -> list:
+        return list(self) + list(other)
+
+    def __radd__(self, other) -> list:
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class LocationView(ReadOnlyList):
+    def __init__(self, locations: np.ndarray):
+        """
+        The rows of an (N, 2) array of locations as a read only list of Points, made when they are asked for.
+        """
+        self.array = locations
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [Point(coordinates) for coordinates in map(tuple, self.array[item].tolist())]
+        row, column = self.array[item].tolist()
+        return Point((row, column))
+
+    def __len__(self):
+        return len(self.array)
+
+    def __iter__(self):
+        return (Point(coordinates) for coordinates in map(tuple, self.array.tolist()))
+
+    def __contains__(self, location):
+        return bool(((self.array[:, 0] == location[0]) & (self.array[:, 1] == location[1])).any())
+
+    def index(self, location, *args):
+        matches = np.flatnonzero((self.array[:, 0] == location[0]) & (self.array[:, 1] == location[1]))
+        if not matches.size:
+            raise ValueError(f"{location} is not on the path")
+        return int(matches[0])
+
+
+class LocationSet(Set):
+    def __init__(self, cells: np.ndarray):
+        """
+        The True cells of a boolean (H, W) array as a read only set of Points, made when they are asked for.
+        """
+        self.array = cells
+
+    def __contains__(self, location):
+        i, j = location[0], location[1]
+        return 0 <= i < self.array.shape[0] and 0 <= j < self.array.shape[1] and bool(self.array[i, j])
+
+    def __len__(self):
+        return int(np.count_nonzero(self.array))
+
+    def __iter__(self):
+        # One row at a time, so a large board never has all its Points at once.
+        for i, row in enumerate(self.array):
+            for j in np.flatnonzero(row).tolist():
+                yield Point((i, j))
+
+    @classmethod
+    def _from_iterable(cls, iterable) -> set:
+        # The operators of Set build their results with this, they give plain sets as the set this replaces did.
+        return set(iterable)
+
+    def copy(self) -> set:
+        return set(self)
+
+    def union(self, *others) -> set:
+        return set(self).union(*others)
+
+    def intersection(self, *others) -> set:
+        return set(self).intersection(*others)
+
+    def difference(self, *others) -> set:
+        return set(self).difference(*others)
+
+    def symmetric_difference(self, other) -> set:
+        return set(self).symmetric_difference(other)
+
+    def issubset(self, other) -> bool:
+        return set(self).issubset(other)
+
+    def issuperset(self, other) -> bool:
+        return all(location in self for location in other)
+
+    def __repr__(self):
+        return repr(set(self))
+
+
+class DirectionView(ReadOnlyList):
+    def __init__(self, codes: np.ndarray):
+        """
+        A uint8 array of DIRECTION_CODES as a read only list of the CardinalDirections.
+        """
+        self.array = codes
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [DIRECTIONS[code] for code in self.array[item].tolist()]
+        return DIRECTIONS[self.array[item]]
+
+    def __len__(self):
+        return len(self.array)
+
+    def __iter__(self):
+        return (DIRECTIONS[code] for code in self.array.tolist())
+
+
 class Path:
     def __init__(self, start: Point, segments: list[Segment]):
         """
         Creates a path that goes from point to point in straight vertical or horizontal segments.
+        The cells are stored as arrays: location_array (N, 2) and direction_codes (N,) with the DIRECTION_CODES,
+        locations and directions give the same cells as Points and CardinalDirections.
         """
-        self.corners: list[Point] = []
-        self.directions: list[CardinalDirection] = []
-        self.locations: list[Point] = []
         self.segments = segments
-        current_location = start
-        for segment in segments:
-            self.directions += [segment.direction] * segment.length
-            self.locations += segment.locations(current_location)
-            current_location += segment.displacement()
-            self.corners.append(current_location)
-
-        self.corners.pop()
+        lengths = np.array([segment.length for segment in segments], dtype=np.intp)
+        segment_codes = np.array([DIRECTION_CODES[segment.direction] for segment in segments], dtype=np.uint8)
+        self.direction_codes = np.repeat(segment_codes, lengths)
+        # Column major, so each coordinate is built in place from int8 steps and a long path needs little memory
+        # besides its locations.
+        self.location_array = np.empty((len(self.direction_codes), 2), dtype=np.intp, order='F')
+        if len(self.direction_codes):
+            self.location_array[0] = start.coordinates
+            for axis in (0, 1):
+                coordinates = self.location_array[1:, axis]
+                coordinates[:] = UNIT_STEPS[self.direction_codes[:-1], axis]
+                np.cumsum(coordinates, out=coordinates)
+            self.location_array[1:] += start.coordinates
+        self.locations = LocationView(self.location_array)
+        self.directions = DirectionView(self.direction_codes)
+
+        # A corner is the first cell of every segment after the first.
+        corner_indices = np.cumsum(lengths)[:-1]
+        self.corner_index_array = corner_indices[corner_indices < len(self.direction_codes)]
+        self.corner_indices = frozenset(self.corner_index_array.tolist())
+        self.corners: list[Point] = [self.locations[i] for i in self.corner_index_array]
 
     @classmethod
     def from_points(cls, points: list[Point]):
-        start = points[0]
+        return cls(points[0], cls._segments_between(points))
+
+    @staticmethod
+    def _segments_between(points: list[Point]) -> list[Segment]:
         segments = []
         for i in range(len(points) - 1):
             segments.append(Segment.from_points(points[i], points[i + 1]))
 
         segments[-1].length += 1
 
-        return cls(start, segments)
+        return segments
 
     def __len__(self):
-        return len(self.locations)
+        return len(self.location_array)
 
     def __eq__(self, other):
-        return set(self.locations) == set(other.locations)
+        return set(map(tuple, self.location_array.tolist())) == set(map(tuple, other.location_array.tolist()))
 
 class PathObjective(Path):
     FORWARD = "FORWARD"
     BACKWARD = "BACKWARD"
     OUT = "OUT"
+    _DIRECTION_CLASSES = (FORWARD, OUT, BACKWARD, OUT)
 
     def __init__(self, start: Point, segments: list[Segment], flying_forward_mandatory: bool=False,
                  mandatory_planes: tuple[int, ...]=()):
@@ -137,97 +309,89 @@ class PathObjective(Path):
     @classmethod
     def from_points(cls, points: list[Point], flying_forward_mandatory: bool = False,
                     mandatory_planes: tuple[int, ...] = ()):
-        path = Path.from_points(points)
-        return cls(path.locations[0], path.segments, flying_forward_mandatory, mandatory_planes)
+        return cls(points[0], Path._segments_between(points), flying_forward_mandatory, mandatory_planes)
 
     @classmethod
     def from_grid(cls, grid: np.ndarray[str], start: Point, flying_forward_mandatory: bool = False,
                     mandatory_planes: tuple[int, ...] = ()):
-        current_location = start
-        previous_direction = 'undirected'
-        points = []
-        unit_steps = {'>': (0, 1), 'v': (1, 0), '^': (-1, 0), '<': (0, -1),
-                      'e': (0, 1), 's': (1, 0), 'n': (-1, 0), 'w': (0, -1)}
-        while True:
-            current_direction = grid[current_location.coordinates]
-
-            if current_direction != previous_direction:
-                points.append(current_location)
-
-            if current_direction == 'f':
-                break
-
-            current_location += unit_steps[current_direction]
+        """
+        Follow the path starting at start through a grid of characters in the format of BoardObjective.from_string.
+        :raise BoardFormatError: If the path loops or is not terminated by an f
+        """
+        points = trace_path(encode_grid(grid), tuple(start.coordinates))
+        return PathObjective.from_points([Point(point) for point in points], flying_forward_mandatory,
+                                         mandatory_planes)
 
-        return PathObjective.from_points(points, flying_forward_mandatory, mandatory_planes)
+    def new_state(self) -> PathState:
+        """
+        An empty incremental state of this path, see PathState.
+        """
+        return PathState(self)
 
     def raise_exception_if_filling_invalid(self, filling: PathFilling):
-        self._check_filling_shape(filling)
-        self._check_all_mandatory_planes_present(filling)
-        self._check_no_planes_on_corners(filling)
-        self._check_all_planes_along_path(filling)
+        violation = next(self._violations(filling), None)
+        if violation is not None:
+            raise violation.exception()
 
-        if self.flying_forward_mandatory:
-            self._check_planes_fly_in_forward_direction(filling)
-        else:
-            self._check_planes_fly_in_same_direction(filling)
+    def check_filling(self, filling: PathFilling, fast: bool = False) -> FillingCheck | bool:
+        """
+        Check a filling without raising.
+        :param fast: Stop at the first broken rule and only return whether the filling is valid
+        :return: Every broken rule, in the order raise_exception_if_filling_invalid checks them, or a bool if fast
+        """
+        if fast:
+            return next(self._violations(filling), None) is None
+        return FillingCheck(list(self._violations(filling)))
 
-    def _check_filling_shape(self, filling):
+    def _violations(self, filling: PathFilling) -> Iterator[Violation]:
         if len(filling) != len(self):
-            raise FillingShapeError(f"The filling does not have the right length. Filling length is {len(filling)}, should be {len(self.locations)}.")
+            yield Violation(FillingShapeError, f"The filling does not have the right length. Filling length is "
+                                               f"{len(filling)}, should be {len(self.locations)}.")
+            return
+        yield from self._missing_plane_violations(filling)
+        yield from self._corner_violations(filling)
+
+        direction_classes = [(i, self._forward_backward_or_out(i, plane.direction))
+                             for i, plane in filling.enumerate_just_the_planes()]
+        yield from self._out_of_path_violations(direction_classes)
+        if self.flying_forward_mandatory:
+            yield from self._backward_violations(direction_classes)
+        else:
+            yield from self._direction_change_violations(direction_classes)
 
-    def _check_all_mandatory_planes_present(self, filling: PathFilling):
+    def _missing_plane_violations(self, filling: PathFilling) -> Iterator[Violation]:
         for mandatory_plane in self.mandatory_planes:
-            self._check_mandatory_plane_present(filling, mandatory_plane)
-
-    @staticmethod
-    def _check_mandatory_plane_present(filling: PathFilling, mandatory_plane: int):
-        if not isinstance(filling[mandatory_plane], Plane):
-            raise MissingPlaneException(f"Plane missing at index {mandatory_plane}")
-
-    def _check_no_planes_on_corners(self, filling: PathFilling):
-        for corner in self.corners:
-            self._check_no_plane_on_corner(corner, filling)
-
-    def _check_no_plane_on_corner(self, corner: Point, filling: PathFilling):
-        index = self.locations.index(corner)
-        if isinstance(filling[index], Plane):
-            raise PlaneLocationException
-
-    def _check_all_planes_along_path(self, filling: PathFilling):
-        for i, plane in filling.enumerate_just_the_planes():
-            if self._forward_backward_or_out(i, plane.direction) == self.OUT:
-                raise PlaneDirectionException(f"Plane at index {i} not along path")
-
-    def _check_planes_fly_in_forward_direction(self, filling: PathFilling):
-        for i, plane in filling.enumerate_just_the_planes():
-            if self._forward_backward_or_out(i, plane.direction) != self.FORWARD:
-                raise PlaneDirectionException(f"Plane at index {i} not flying forward")
-
-    def _check_planes_fly_in_same_direction(self, filling: PathFilling):
-        previous_direction = None
-
-        for i, plane in filling.enumerate_just_the_planes():
-
-            if previous_direction is None:
-                previous_direction = self._forward_backward_or_out(i, plane.direction)
-                prev_i = i
-                continue
-
-            current_direction = self._forward_backward_or_out(i, plane.direction)
-            if previous_direction != current_direction:
-                raise PlaneDirectionException(f"Planes at indices {prev_i} and {i} are going in different directions.")
-
-            prev_i = i
-            previous_direction = current_direction
+            if filling[mandatory_plane] not in PLANES:
+                yield Violation(MissingPlaneException, f"Plane missing at index {mandatory_plane}",
+                                self.locations[mandatory_plane])
+
+    def _corner_violations(self, filling: PathFilling) -> Iterator[Violation]:
+        for index in self.corner_index_array.tolist():
+            if filling[index] in PLANES:
+                yield Violation(PlaneLocationException, f"Plane on the corner at index {index}", self.locations[index])
+
+    def _out_of_path_violations(self, direction_classes: list[tuple[int, str]]) -> Iterator[Violation]:
+        for i, direction_class in direction_classes:
+            if direction_class == self.OUT:
+                yield Violation(PlaneDirectionException, f"Plane at index {i} not along path", self.locations[i])
+
+    def _backward_violations(self, direction_classes: list[tuple[int, str]]) -> Iterator[Violation]:
+        for i, direction_class in direction_classes:
+            if direction_class == self.BACKWARD:
+                yield Violation(PlaneDirectionException, f"Plane at index {i} not flying forward", self.locations[i])
+
+    def _direction_change_violations(self, direction_classes: list[tuple[int, str]]) -> Iterator[Violation]:
+        # Planes that fly out of the path are reported on their own, they do not choose a direction.
+        along_path = [(i, direction_class) for i, direction_class in direction_classes if direction_class != self.OUT]
+        for (previous_i, previous_class), (i, direction_class) in zip(along_path, along_path[1:]):
+            if previous_class != direction_class:
+                yield Violation(PlaneDirectionException,
+                                f"Planes at indices {previous_i} and {i} are going in different directions.",
+                                self.locations[i])
 
     def _forward_backward_or_out(self, location, direction):
-        if self.directions[location] is direction:
-            return self.FORWARD
-        elif self.directions[location] is direction.opposite_direction():
-            return self.BACKWARD
-        else:
-            return self.OUT
+        # Indexed by how many quarter turns the direction is from the direction of the path at the location.
+        return self._DIRECTION_CLASSES[(direction.code - int(self.direction_codes[location])) % 4]
 
     def __eq__(self, other):
         return super().__eq__(other) \
@@ -235,98 +399,334 @@ class PathObjective(Path):
                 and self.flying_forward_mandatory == other.flying_forward_mandatory \
                 and (self.locations[0] == other.locations[0] or not self.flying_forward_mandatory)
 
+class PathState:
+    def __init__(self, path: PathObjective):
+        """
+        The planes on a path while it is being filled one cell at a time. Changing a cell costs constant time
+        and a broken rule is reported as soon as the change that breaks it is made.
+        """
+        self.path = path
+        self.forward = 0
+        self.backward = 0
+        self.out = 0
+        self.planes_on_corners = 0
+        self.unfilled_mandatory_planes = set(path.mandatory_planes)
+        self._mandatory_planes = frozenset(path.mandatory_planes)
+        self._direction_classes: list[str | None] = [None] * len(path)
+
+    def set_cell(self, index: int, component) -> InvalidFillingException | None:
+        """
+        Put a component, or None for an empty cell, at an index of the path.
+        :return: The rule the path breaks after the change, see violation
+        """
+        previous_class = self._direction_classes[index]
+        if previous_class is not None:
+            self._count(index, previous_class, -1)
+
+        if component in PLANES:
+            direction_class = self.path._forward_backward_or_out(index, component.direction)
+            self._direction_classes[index] = direction_class
+            self._count(index, direction_class, 1)
+        else:
+            self._direction_classes[index] = None
+        return self.violation()
+
+    def _count(self, index: int, direction_class: str, sign: int):
+        if direction_class == PathObjective.FORWARD:
+            self.forward += sign
+        elif direction_class == PathObjective.BACKWARD:
+            self.backward += sign
+        else:
+            self.out += sign
+
+        if index in self.path.corner_indices:
+            self.planes_on_corners += sign
+        if index in self._mandatory_planes:
+            if sign > 0:
+                self.unfilled_mandatory_planes.discard(index)
+            else:
+                self.unfilled_mandatory_planes.add(index)
+
+    @property
+    def direction_class(self) -> str | None:
+        """
+        FORWARD or BACKWARD once the planes on the path have chosen a direction, None before that.
+        """
+        if self.forward:
+            return PathObjective.FORWARD
+        if self.backward:
+            return PathObjective.BACKWARD
+        return None
+
+    def violation(self) -> InvalidFillingException | None:
+        """
+        The first broken rule that can not be repaired by filling more cells, in the order in which
+        PathObjective checks them. Missing mandatory planes do not count, the path may not be complete yet.
+        """
+        if self.planes_on_corners:
+            return PlaneLocationException("Plane on a corner of the path.")
+        if self.out:
+            return PlaneDirectionException("Plane not along path.")
+        if self.path.flying_forward_mandatory and self.backward:
+            return PlaneDirectionException("Plane not flying forward.")
+        if self.forward and self.backward:
+            return PlaneDirectionException("Planes are going in different directions.")
+        return None
+
+    def is_valid(self) -> bool:
+        return not self.unfilled_mandatory_planes and self.violation() is None
+
+
 @dataclass
 class BoardFilling:
     def __init__(self, filling: Iterable[Iterable[...]]):
         self.filling = np.array(filling)
 
         self.shape = self.filling.shape
+        self._planes: dict[tuple[int, int], Plane] | None = None
 
         if len(self.filling.shape) != 2:
             raise ValueError("Filling is not a rectangle.")
 
+    @classmethod
+    def view(cls, filling: np.ndarray, planes: dict[tuple[int, int], Plane] | None = None) -> BoardFilling:
+        """
+        A read-only filling that shares the array instead of copying it, so it shows later changes to the array.
+        :param planes: The plane of every cell that has one, by (i, j), kept up to date by the owner of the array.
+            The planes are then enumerated in time in the number of planes instead of the number of cells.
+        """
+        if filling.ndim != 2:
+            raise ValueError("Filling is not a rectangle.")
+        board_filling = cls.__new__(cls)
+        board_filling.filling = filling.view()
+        board_filling.filling.flags.writeable = False
+        board_filling.shape = filling.shape
+        board_filling._planes = planes
+        return board_filling
+
     def __getitem__(self, item: Point):
         if not isinstance(item, Point):
             raise ValueError(item)
         return self.filling[item.coordinates]
 
     def restrict_to_path(self, path: Path):
-        return PathFilling([self[location] for location in path.locations])
+        return PathFilling(list(self.filling[path.location_array[:, 0], path.location_array[:, 1]]))
 
     def enumerate_just_the_planes(self):
+        """
+        Every plane with its location, in row major order.
+        """
+        if self._planes is not None:
+            for i, j in sorted(self._planes):
+                yield Point((i, j)), self._planes[(i, j)]
+            return
         for i, row in enumerate(self.filling):
             for j, content in enumerate(row):
-                if isinstance(content, Plane):
+                if content in PLANES:
                     yield Point((i, j)), content
 
 
+@dataclass
+class Violation:
+    """
+    A broken rule of a filling, as a value instead of an exception.
+    :param error: The exception type the raise_exception_if_* methods raise for it
+    :param location: The first cell that breaks the rule, if there is one
+    :param path: The index of the path whose rule is broken, if it is the rule of a single path
+    """
+    error: type[Exception]
+    message: str = ""
+    location: Point | None = None
+    path: int | None = None
+
+    @property
+    def code(self) -> str:
+        return self.error.__name__
+
+    def exception(self) -> Exception:
+        return self.error(self.message)
+
+
+@dataclass
+class FillingCheck:
+    """
+    The result of check_filling: every rule the filling breaks. It is truthy when the filling is valid.
+    """
+    violations: list[Violation]
+
+    @property
+    def valid(self) -> bool:
+        return not self.violations
+
+    def __bool__(self):
+        return self.valid
+
+    def raise_first(self):
+        if self.violations:
+            raise self.violations[0].exception()
+
+
 class BoardObjective:
     def __init__(self, paths: list[PathObjective, ...], shape: tuple[int, int]):
         self.shape = shape
         self.paths = paths
 
         self._raise_error_if_paths_outside_board()
-        self.allowed_plane_locations = set([location for path in paths for location in path.locations])
-
+        on_path = np.zeros(shape, dtype=bool)
+        for path in paths:
+            on_path[path.location_array[:, 0], path.location_array[:, 1]] = True
+        self.allowed_plane_locations = LocationSet(on_path)
+        self._masks = None
+        self._encoded = None
+        self._cell_index = None
 
     def _raise_error_if_paths_outside_board(self):
         for path in self.paths:
-            for location in itertools.chain([path.locations[0], path.locations[-1]], path.corners):
-                if location[0] < 0 or location[1] < 0 or location[0] >= self.shape[0] or location[1] >= self.shape[1]:
-                    raise ValueError("Paths do not fit within width of board." + f"{path.locations} {path.segments}")
+            locations = path.location_array
+            if len(locations) and ((locations < 0).any() or (locations >= self.shape).any()):
+                raise ValueError("Paths do not fit within width of board." + f"{path.locations} {path.segments}")
 
     @classmethod
     def from_string(cls, board_objective_str: str):
         """
-        Create a board objective from a string. Does not support overlapping path.
+        Create a board objective from a string.
         A path starts with w, s, n, e for the direction to go into and then is continued using
-        >, v, ^, < to indicate continuation of the same path, ending with an f
+        >, v, ^, < to indicate continuation of the same path, ending with an f. Two paths cross at a +, where
+        both go straight on.
         :param board_objective_str:
         :return:
         """
-        paths = []
-        board_objective_arr = np.array([list(row) for row in board_objective_str.split('\n')])
-        for loc, char in np.ndenumerate(board_objective_arr):
-            if char in ('n', 'w', 's', 'e'):
-                paths.append(PathObjective.from_grid(board_objective_arr, Point(loc)))
-        return cls(paths, shape=board_objective_arr.shape)
-    @staticmethod
-    def _create_path_objective_from_arr(board_objective_arr, start: Point) -> PathObjective:
-        current_location = start
-        previous_direction = 'undirected'
-        points = []
-        unit_steps = {'>': (0,1), 'v': (1,0), '^': (-1,0), '<': (0,-1),
-                      'e': (0, 1), 's': (1, 0), 'n': (-1, 0), 'w': (0, -1)}
-        while True:
-            current_direction = board_objective_arr[current_location]
+        return cls.from_lines(board_objective_str.splitlines())
 
-            if current_direction != previous_direction:
-                points.append(current_location)
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]):
+        """
+        Create a board objective from the rows of the format of from_string, for example an open text file.
+        The rows are encoded as they are read, so the text of the whole board is never held in memory.
+        :raise BoardFormatError: If a path loops or is not terminated by an f
+        """
+        codes = encode_lines(lines)
+        paths = [PathObjective.from_points([Point(point) for point in points]) for points in trace_paths(codes)]
+        return cls(paths, shape=codes.shape)
 
-            if current_direction == 'f':
-                break
+    @classmethod
+    def from_file(cls, file):
+        """
+        :param file: A path or an open text file in the format of from_string
+        """
+        if hasattr(file, 'read'):
+            return cls.from_lines(file)
+        with open(file) as opened_file:
+            return cls.from_lines(opened_file)
+
+    def raise_exception_if_filling_invalid(self, board_filling: BoardFilling):
+        violation = next(self._violations(board_filling), None)
+        if violation is not None:
+            raise violation.exception()
 
-            current_location += unit_steps[current_direction]
+    def check_filling(self, board_filling: BoardFilling, fast: bool = False) -> FillingCheck | bool:
+        """
+        Check a filling without raising, see PathObjective.check_filling. The violations of a path carry its index.
+        """
+        if fast:
+            return next(self._violations(board_filling), None) is None
+        return FillingCheck(list(self._violations(board_filling)))
 
-        return PathObjective.from_points(points)
+    def _violations(self, board_filling: BoardFilling) -> Iterator[Violation]:
+        if board_filling.shape != self.shape:
+            yield Violation(FillingShapeError, "Filling does not have the same shape as the board.")
+            return
+        for location, plane in board_filling.enumerate_just_the_planes():
+            if location not in self.allowed_plane_locations:
+                yield Violation(PlaneLocationException, f"Plane at {location} is outside the allowed paths.",
+                                location)
 
+        for i, path in enumerate(self.paths):
+            for violation in path._violations(board_filling.restrict_to_path(path)):
+                violation.path = i
+                yield violation
 
-    def raise_exception_if_filling_invalid(self, board_filling: BoardFilling):
-        self._check_filling_dimensions(board_filling)
-        self._check_all_planes_on_path(board_filling)
+    @property
+    def masks(self) -> ObjectiveMasks:
+        """
+        Bit masks of the allowed plane locations, corners, mandatory planes and path directions.
+        """
+        if self._masks is None:
+            self._masks = ObjectiveMasks.from_objective(self)
+        return self._masks
 
-        for path in self.paths:
-            path_filling = board_filling.restrict_to_path(path)
-            path.raise_exception_if_filling_invalid(path_filling)
+    @property
+    def encoded(self) -> EncodedBoardObjective:
+        """
+        Index arrays of the objective for validating int8 encoded fillings, see encodedBoards.py.
+        """
+        if self._encoded is None:
+            self._encoded = EncodedBoardObjective(self)
+        return self._encoded
 
-    def _check_filling_dimensions(self, board_filling):
-        if board_filling.shape != self.shape:
-            raise FillingShapeError("Filling does not have the same shape as the board.")
+    @property
+    def cell_index(self) -> CellPathIndex:
+        """
+        The paths through every cell, with the position of the cell on each of them, see cellPathIndex.py.
+        """
+        if self._cell_index is None:
+            self._cell_index = CellPathIndex(self)
+        return self._cell_index
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_masks'] = None
+        state['_encoded'] = None
+        state['_cell_index'] = None
+        return state
+
+    def raise_exception_if_bitboard_invalid(self, bitboard: Bitboard):
+        """
+        Same checks as raise_exception_if_filling_invalid, but using only bit operations on the bitboard.
+        """
+        violation = self.bitboard_violation(bitboard)
+        if violation is not None:
+            raise violation.exception()
 
-    def _check_all_planes_on_path(self, filling: BoardFilling):
-        for location, plane in filling.enumerate_just_the_planes():
-            if location not in self.allowed_plane_locations:
-                raise PlaneLocationException(f"Plane at {location} is outside the allowed paths.")
+    def bitboard_violation(self, bitboard: Bitboard) -> Violation | None:
+        """
+        The first rule the bitboard breaks, in the order of raise_exception_if_filling_invalid, or None.
+        """
+        if tuple(bitboard.shape) != tuple(self.shape):
+            return Violation(FillingShapeError, "Filling does not have the same shape as the board.")
+
+        masks = self.masks
+        planes = bitboard.all_planes
+        if planes & ~masks.allowed_planes:
+            location = self._first_location(planes & ~masks.allowed_planes)
+            return Violation(PlaneLocationException, f"Plane at {location} is outside the allowed paths.", location)
+
+        for i, (path, path_masks) in enumerate(zip(self.paths, masks.paths)):
+            missing = path_masks.mandatory & ~planes
+            if missing:
+                location = self._first_location(missing)
+                return Violation(MissingPlaneException, f"Plane missing at {location}", location, i)
+            if planes & path_masks.corners:
+                location = self._first_location(planes & path_masks.corners)
+                return Violation(PlaneLocationException, f"Plane on the corner {location}", location, i)
+
+            forward = path_masks.forward_planes(bitboard)
+            backward = path_masks.backward_planes(bitboard)
+            out = planes & path_masks.cells & ~(forward | backward)
+            if out:
+                location = self._first_location(out)
+                return Violation(PlaneDirectionException, f"Plane at {location} not along path", location, i)
+            if path.flying_forward_mandatory and backward:
+                location = self._first_location(backward)
+                return Violation(PlaneDirectionException, f"Plane at {location} not flying forward", location, i)
+            if forward and backward:
+                location = self._first_location(backward)
+                return Violation(PlaneDirectionException, "Planes on the path are going in different directions.",
+                                 location, i)
+        return None
+
+    def _first_location(self, mask: int) -> Point:
+        return Point(next(mask_locations(mask, self.shape)))
 
     def __eq__(self, other):
         for path in self.paths:
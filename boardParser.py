@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from errorsAndExceptions import BoardFormatError
+
+# The text format of BoardObjective.from_string, encoded as one int8 per cell. The arrows continue a path and the
+# letters start one; both are (code - 1) % 4 for the step they take, the letters are offset by 4. A + is a cell
+# where two paths cross, each path goes straight through it.
+EMPTY_CODE = 0
+START_CODE = 5
+FINISH_CODE = 9
+CROSSING_CODE = 10
+STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+CHARACTER_CODES = np.zeros(256, dtype=np.int8)
+for _code, _character in enumerate('>v<^eswn', start=1):
+    CHARACTER_CODES[ord(_character)] = _code
+CHARACTER_CODES[ord('f')] = FINISH_CODE
+CHARACTER_CODES[ord('+')] = CROSSING_CODE
+
+# Runs of cells going the same way are found in windows of growing size, so a long straight stretch costs a few
+# numpy calls and a short one does not scan to the edge of the board.
+FIRST_WINDOW = 16
+
+
+def encode_line(line: str) -> np.ndarray:
+    """
+    Encode one row of the text format. Characters that are not part of a path become EMPTY_CODE.
+    """
+    return CHARACTER_CODES[np.frombuffer(line.encode('latin-1', errors='replace'), dtype=np.uint8)]
+
+
+def encode_lines(lines: Iterable[str]) -> np.ndarray:
+    """
+    Encode the text format one line at a time, so only a single line is held as a string. Shorter rows are padded
+    with empty cells up to the longest one.
+    """
+    rows = [encode_line(line.rstrip('\r\n')) for line in lines]
+    width = max((len(row) for row in rows), default=0)
+    codes = np.zeros((len(rows), width), dtype=np.int8)
+    for i, row in enumerate(rows):
+        codes[i, :len(row)] = row
+    return codes
+
+
+def encode_grid(grid: np.ndarray) -> np.ndarray:
+    """
+    Encode a 2d array of single characters.
+    """
+    grid = np.asarray(grid, dtype=str)
+    return CHARACTER_CODES[np.array([ord(character[:1] or ' ') % 256 for character in grid.ravel()],
+                                    dtype=np.uint8)].reshape(grid.shape)
+
+
+def path_starts(codes: np.ndarray) -> list[tuple[int, int]]:
+    """
+    :return: The first cell of every path, in row major order
+    """
+    return [(int(i), int(j)) for i, j in np.argwhere((codes >= START_CODE) & (codes < FINISH_CODE))]
+
+
+def trace_path(codes: np.ndarray, start: tuple[int, int], number_of_path_cells: int | None = None) \
+        -> list[tuple[int, int]]:
+    """
+    Follow the path starting at start through an encoded grid.
+    :param number_of_path_cells: The number of non empty cells, with the crossings counted twice, which bounds the
+        length of a path without a loop, see _number_of_path_cells
+    :return: The start, every corner and the finish of the path, as for PathObjective.from_points
+    """
+    if number_of_path_cells is None:
+        number_of_path_cells = _number_of_path_cells(codes)
+    height, width = codes.shape
+    points = [start]
+    i, j = start
+    length = 0
+    while True:
+        code = codes[i, j]
+        if code == FINISH_CODE:
+            points.append((i, j))
+            return points
+        if code == EMPTY_CODE:
+            raise BoardFormatError(f"The path starting at {start} is not terminated: it reaches the empty cell "
+                                   f"{(i, j)} without an f")
+        if length > 0:
+            points.append((i, j))
+
+        step = (code - 1) % 4
+        run = _run_length(codes, i, j, step)
+        di, dj = STEPS[step]
+        i, j = i + di * (run + 1), j + dj * (run + 1)
+        length += run + 1
+        if length > number_of_path_cells:
+            raise BoardFormatError(f"The path starting at {start} loops back onto itself")
+        if not (0 <= i < height and 0 <= j < width):
+            raise BoardFormatError(f"The path starting at {start} is not terminated: it runs off the board after "
+                                   f"{(i - di, j - dj)}")
+
+
+def trace_paths(codes: np.ndarray) -> list[list[tuple[int, int]]]:
+    number_of_path_cells = _number_of_path_cells(codes)
+    return [trace_path(codes, start, number_of_path_cells) for start in path_starts(codes)]
+
+
+def _number_of_path_cells(codes: np.ndarray) -> int:
+    return int(np.count_nonzero(codes)) + int(np.count_nonzero(codes == CROSSING_CODE))
+
+
+def _run_length(codes: np.ndarray, i: int, j: int, step: int) -> int:
+    """
+    :return: The number of cells after (i, j) that continue in the same direction, crossings included
+    """
+    if step == 0:
+        line = codes[i, j + 1:]
+    elif step == 1:
+        line = codes[i + 1:, j]
+    elif step == 2:
+        line = codes[i, j - 1::-1] if j > 0 else codes[i, :0]
+    else:
+        line = codes[i - 1::-1, j] if i > 0 else codes[:0, j]
+
+    run = 0
+    window = FIRST_WINDOW
+    while run < len(line):
+        cells = line[run:run + window]
+        other = np.flatnonzero((cells == EMPTY_CODE) | (cells == FINISH_CODE) |
+                               ((cells != CROSSING_CODE) & ((cells - 1) % 4 != step)))
+        if other.size:
+            return run + int(other[0])
+        run += len(cells)
+        window *= 2
+    return run
@@ -1,8 +1,20 @@
 import unittest
 from board import *
-from tileComponents import NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE, COVERED
+from tileComponents import NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE, COVERED, \
+    UNCOVERED
 from errorsAndExceptions import *
 
+class TestPointMethods(unittest.TestCase):
+    def test_point(self):
+        point = Point((1, 2))
+        self.assertEqual(point + (1, -1), Point((2, 1)))
+        self.assertEqual(point[1], 2)
+        self.assertEqual(hash(point), hash(Point([1, 2])))
+        self.assertNotEqual(point, (1, 2))
+        with self.assertRaises(AttributeError):
+            point.coordinates = (0, 0)
+
+
 class TestSegmentMethods(unittest.TestCase):
     def test_from_points_length(self):
         for i, j in itertools.product(range(10), range(10)):
@@ -54,6 +66,35 @@ class TestPathObjectiveMethods(unittest.TestCase):
         path = PathObjective.from_points([Point(c) for c in ((1, 1), (3, 1), (3, 2), (1, 2))])
         self.assertEqual(path.locations, [Point(c) for c in ((1, 1), (2, 1), (3, 1), (3, 2), (2, 2), (1, 2))])
 
+    def test_path_arrays(self):
+        path = PathObjective.from_points([Point(c) for c in ((1, 1), (3, 1), (3, 2), (1, 2))])
+        self.assertEqual(path.location_array.tolist(), [[1, 1], [2, 1], [3, 1], [3, 2], [2, 2], [1, 2]])
+        self.assertEqual(path.direction_codes.tolist(), [2, 2, 1, 0, 0, 0])
+        self.assertEqual(path.corner_index_array.tolist(), [2, 3])
+        self.assertEqual(path.corners, [Point((3, 1)), Point((3, 2))])
+
+    def test_location_and_direction_views(self):
+        path = PathObjective.from_points([Point(c) for c in ((1, 1), (3, 1), (3, 2), (1, 2))])
+        self.assertEqual(path.locations[-1], Point((1, 2)))
+        self.assertEqual(path.locations[1:3], [Point((2, 1)), Point((3, 1))])
+        self.assertIn(Point((3, 2)), path.locations)
+        self.assertNotIn(Point((0, 0)), path.locations)
+        self.assertEqual(path.locations.index(Point((2, 2))), 4)
+        self.assertIs(path.directions[0], SOUTH)
+        self.assertEqual(list(path.directions), [SOUTH, SOUTH, WEST, NORTH, NORTH, NORTH])
+
+    def test_views_concatenate_and_copy_as_lists(self):
+        path = PathObjective.from_points([Point(c) for c in ((1, 1), (3, 1))])
+        locations = [Point((1, 1)), Point((2, 1)), Point((3, 1))]
+        self.assertEqual(path.locations + [Point((4, 1))], locations + [Point((4, 1))])
+        self.assertEqual([Point((0, 1))] + path.locations, [Point((0, 1))] + locations)
+        copy = path.locations.copy()
+        self.assertIsInstance(copy, list)
+        copy.append(Point((4, 1)))
+        self.assertEqual(len(path.locations), 3)
+        self.assertEqual(path.directions + [WEST], [SOUTH, SOUTH, SOUTH, WEST])
+        self.assertEqual(path.directions.copy(), [SOUTH, SOUTH, SOUTH])
+
     def test_good_filling_gets_accepted(self):
         path = PathObjective.from_points([Point(c) for c in ((1, 1), (3, 1), (3, 2), (1, 2))])
         filling = PathFilling([COVERED, NORTH_FACING_PLANE, COVERED, COVERED, SOUTH_FACING_PLANE, COVERED])
@@ -131,6 +172,65 @@ class TestPathObjectiveMethods(unittest.TestCase):
         with self.assertRaises(FillingShapeError):
             path.raise_exception_if_filling_invalid(filling)
 
+class TestPathStateMethods(unittest.TestCase):
+    DEFAULT_PATH = PathObjective.from_points([Point(c) for c in ((1, 1), (1, 4), (3, 4))], mandatory_planes=(1,))
+
+    def test_corner_indices(self):
+        self.assertEqual(self.DEFAULT_PATH.corner_indices, {3})
+
+    def test_empty_state(self):
+        state = self.DEFAULT_PATH.new_state()
+        self.assertIsNone(state.violation())
+        self.assertFalse(state.is_valid())
+        self.assertEqual(state.unfilled_mandatory_planes, {1})
+
+    def test_mandatory_plane_filled_and_emptied(self):
+        state = self.DEFAULT_PATH.new_state()
+        self.assertIsNone(state.set_cell(1, WEST_FACING_PLANE))
+        self.assertTrue(state.is_valid())
+        self.assertEqual(state.direction_class, PathObjective.FORWARD)
+        state.set_cell(1, COVERED)
+        self.assertFalse(state.is_valid())
+        self.assertIsNone(state.direction_class)
+
+    def test_different_directions_reported_immediately(self):
+        state = self.DEFAULT_PATH.new_state()
+        state.set_cell(1, WEST_FACING_PLANE)
+        self.assertIsInstance(state.set_cell(4, NORTH_FACING_PLANE), PlaneDirectionException)
+        self.assertIsNone(state.set_cell(4, SOUTH_FACING_PLANE))
+
+    def test_plane_on_corner(self):
+        state = self.DEFAULT_PATH.new_state()
+        self.assertIsInstance(state.set_cell(3, SOUTH_FACING_PLANE), PlaneLocationException)
+        self.assertIsNone(state.set_cell(3, None))
+
+    def test_plane_not_along_path(self):
+        state = self.DEFAULT_PATH.new_state()
+        self.assertIsInstance(state.set_cell(0, SOUTH_FACING_PLANE), PlaneDirectionException)
+
+    def test_forward_mandatory(self):
+        path = PathObjective.from_points([Point(c) for c in ((1, 1), (1, 4), (3, 4))], flying_forward_mandatory=True)
+        state = path.new_state()
+        self.assertIsNone(state.set_cell(5, SOUTH_FACING_PLANE))
+        self.assertIsInstance(state.set_cell(0, EAST_FACING_PLANE), PlaneDirectionException)
+
+    def test_agrees_with_filling_validation(self):
+        path = PathObjective.from_points([Point(c) for c in ((1, 1), (1, 4), (3, 4))], mandatory_planes=(1,))
+        components = [COVERED, NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE]
+        state = path.new_state()
+        filling = [COVERED] * len(path)
+        for step in range(200):
+            index, component = (step * 7) % len(path), components[(step * 3) % len(components)]
+            state.set_cell(index, component)
+            filling[index] = component
+            try:
+                path.raise_exception_if_filling_invalid(PathFilling(filling))
+                valid = True
+            except InvalidFillingException:
+                valid = False
+            self.assertEqual(state.is_valid(), valid)
+
+
 class TestBoardFillingMethods(unittest.TestCase):
     def test_indexing(self):
         filling = BoardFilling([[COVERED, WEST_FACING_PLANE, COVERED, SOUTH_FACING_PLANE],
@@ -148,6 +248,22 @@ class TestBoardFillingMethods(unittest.TestCase):
         path = Path.from_points([Point((0,0)), Point((0,3))])
         self.assertEqual(filling.restrict_to_path(path), PathFilling([WEST_FACING_PLANE, WEST_FACING_PLANE, COVERED, COVERED]))
 
+    def test_view(self):
+        array = np.array([[COVERED, WEST_FACING_PLANE], [UNCOVERED, COVERED]])
+        filling = BoardFilling.view(array)
+        self.assertTrue(np.shares_memory(filling.filling, array))
+        with self.assertRaises(ValueError):
+            filling.filling[0, 0] = UNCOVERED
+        array[1, 0] = SOUTH_FACING_PLANE
+        self.assertEqual(list(filling.enumerate_just_the_planes()),
+                         [(Point((0, 1)), WEST_FACING_PLANE), (Point((1, 0)), SOUTH_FACING_PLANE)])
+
+    def test_view_with_plane_index(self):
+        array = np.array([[COVERED, WEST_FACING_PLANE], [SOUTH_FACING_PLANE, COVERED]])
+        filling = BoardFilling.view(array, {(1, 0): SOUTH_FACING_PLANE, (0, 1): WEST_FACING_PLANE})
+        self.assertEqual(list(filling.enumerate_just_the_planes()),
+                         list(BoardFilling(array).enumerate_just_the_planes()))
+
 class TestBoardObjectiveMethods(unittest.TestCase):
     DEFAULT_BOARD = BoardObjective([PathObjective.from_points([Point((1, 1)), Point((1, 3)), Point((3, 3))])], shape=(4, 4))
     def test_good_filling_passes(self):
@@ -161,6 +277,36 @@ class TestBoardObjectiveMethods(unittest.TestCase):
                                 [COVERED, COVERED, COVERED, COVERED]])
         self.assertIsNone(board.raise_exception_if_filling_invalid(filling))
 
+    def test_check_filling(self):
+        board = BoardObjective(
+            [PathObjective.from_points([Point((1, 1)), Point((1, 3)), Point((3, 3))]),
+             PathObjective.from_points([Point((0,0)), Point((0,3))])],
+            shape=(4, 4))
+        filling = BoardFilling([[WEST_FACING_PLANE, WEST_FACING_PLANE, COVERED, COVERED],
+                                [COVERED, WEST_FACING_PLANE, COVERED, COVERED],
+                                [COVERED, COVERED, COVERED, SOUTH_FACING_PLANE],
+                                [COVERED, COVERED, COVERED, COVERED]])
+        self.assertTrue(board.check_filling(filling))
+        self.assertIs(board.check_filling(filling, fast=True), True)
+
+        filling = BoardFilling([[WEST_FACING_PLANE, EAST_FACING_PLANE, COVERED, COVERED],
+                                [COVERED, WEST_FACING_PLANE, COVERED, NORTH_FACING_PLANE],
+                                [NORTH_FACING_PLANE, COVERED, COVERED, SOUTH_FACING_PLANE],
+                                [COVERED, COVERED, COVERED, COVERED]])
+        check = board.check_filling(filling)
+        self.assertFalse(check)
+        self.assertIs(board.check_filling(filling, fast=True), False)
+        self.assertEqual([(violation.error, violation.location, violation.path) for violation in check.violations],
+                         [(PlaneLocationException, Point((2, 0)), None),
+                          (PlaneLocationException, Point((1, 3)), 0),
+                          (PlaneDirectionException, Point((1, 3)), 0),
+                          (PlaneDirectionException, Point((2, 3)), 0),
+                          (PlaneDirectionException, Point((0, 1)), 1)])
+        with self.assertRaises(PlaneLocationException):
+            check.raise_first()
+        with self.assertRaises(PlaneLocationException):
+            board.raise_exception_if_filling_invalid(filling)
+
     def test_crossing_paths(self):
         board = BoardObjective(
             [PathObjective.from_points([Point((0,1)), Point((2,1))]),PathObjective.from_points([Point((1,0)), Point((1,2))])],
@@ -331,6 +477,86 @@ class TestBoardObjectiveMethods(unittest.TestCase):
         print(board_from_str.paths[0].locations)
         self.assertEqual(board, board_from_str)
 
+    def test_from_string_corners(self):
+        board = BoardObjective.from_string(" e>v\n"
+                                           "   v\n"
+                                           "   f")
+        self.assertEqual(board.paths[0].corners, [Point((0, 3))])
+
+    def test_from_file(self):
+        import io
+        text = "    \n e>v\n   v\n   f\n"
+        self.assertEqual(BoardObjective.from_file(io.StringIO(text)), BoardObjective.from_string(text))
+
+    def test_from_string_ragged_rows(self):
+        board = BoardObjective.from_string("ef\n"
+                                           "\n"
+                                           "e>>f")
+        self.assertEqual(board.shape, (3, 4))
+        self.assertEqual(len(board.paths), 2)
+
+    def test_from_string_loop(self):
+        with self.assertRaises(BoardFormatError):
+            BoardObjective.from_string("e>v\n"
+                                       "^<<")
+
+    def test_from_string_unterminated(self):
+        with self.assertRaises(BoardFormatError):
+            BoardObjective.from_string("e>> \n")
+        with self.assertRaises(BoardFormatError):
+            BoardObjective.from_string("e>>>")
+        with self.assertRaises(BoardFormatError):
+            BoardObjective.from_string("n>f")
+
+    def test_from_string_start_letters(self):
+        self.assertEqual(list(BoardObjective.from_string("ef").paths[0].locations), [Point((0, 0)), Point((0, 1))])
+        self.assertEqual(list(BoardObjective.from_string("s\nf").paths[0].locations), [Point((0, 0)), Point((1, 0))])
+        self.assertEqual(list(BoardObjective.from_string("fw").paths[0].locations), [Point((0, 1)), Point((0, 0))])
+        self.assertEqual(list(BoardObjective.from_string("f\nn").paths[0].locations), [Point((1, 0)), Point((0, 0))])
+
+    def test_allowed_plane_locations(self):
+        board = BoardObjective.from_string(" e>v\n"
+                                           "   v\n"
+                                           "   f")
+        locations = board.allowed_plane_locations
+        self.assertEqual(locations, set(board.paths[0].locations))
+        self.assertEqual(len(locations), 5)
+        self.assertIn(Point((0, 1)), locations)
+        self.assertIn((2, 3), locations)
+        self.assertNotIn(Point((0, 0)), locations)
+        self.assertNotIn(Point((-1, 3)), locations)
+        self.assertNotIn(Point((0, 4)), locations)
+
+    def test_allowed_plane_locations_set_operations(self):
+        board = BoardObjective.from_string(" e>v\n"
+                                           "   v\n"
+                                           "   f")
+        locations = board.allowed_plane_locations
+        difference = locations - {Point((0, 1))}
+        self.assertEqual(len(difference), 4)
+        self.assertNotIn(Point((0, 1)), difference)
+        self.assertIn(Point((2, 3)), difference)
+        union = locations | {Point((0, 0))}
+        self.assertEqual(len(union), 6)
+        self.assertIn(Point((0, 0)), union)
+        intersection = locations & {Point((0, 0)), Point((0, 1))}
+        self.assertEqual(intersection, {Point((0, 1))})
+        self.assertEqual({Point((0, 0)), Point((0, 1))} - locations, {Point((0, 0))})
+        self.assertEqual(locations.difference({Point((0, 1))}), difference)
+        self.assertEqual(locations.union({Point((0, 0))}), union)
+        self.assertEqual(locations.intersection({Point((0, 0)), Point((0, 1))}), intersection)
+        self.assertIsInstance(difference, set)
+
+    def test_from_string_crossing(self):
+        board = BoardObjective.from_string(" s  \n"
+                                           "e+>f\n"
+                                           " v  \n"
+                                           " f  ")
+        self.assertEqual(len(board.paths), 2)
+        self.assertEqual(list(board.paths[0].locations), [Point((i, 1)) for i in range(4)])
+        self.assertEqual(list(board.paths[1].locations), [Point((1, j)) for j in range(4)])
+        self.assertEqual(board.paths[0].corners, [])
+
     def test_eq(self):
         self.assertEqual(BoardObjective(
                              [PathObjective.from_points([Point((1, 1)), Point((1, 3)), Point((3, 3))]),
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import numpy as np
+
+from cardinalDirections import *
+from tileComponents import TileComponent, Plane, plane_facing
+from board import BoardObjective, PathObjective, Segment, Point
+from tiling import Tile, Tiling, content_key
+from level import Level
+
+UNIT_STEPS = {NORTH: (-1, 0), SOUTH: (1, 0), WEST: (0, 1), EAST: (0, -1)}
+
+
+class BoardTransform:
+    def __init__(self, rotations: int, flipped: bool):
+        """
+        One of the 8 rotations and reflections of a board. It moves the cells like np.rot90 (after np.fliplr
+        if flipped) moves the entries of an array, and turns the directions of the paths and planes with them.
+        Applying the same transform to a board objective, its tiles and a tiling keeps the tiling valid.
+        """
+        self.rotations = rotations % 4
+        self.flipped = flipped
+
+        grid = self.array(np.arange(9).reshape(3, 3))
+        self._directions = {}
+        for direction, (di, dj) in UNIT_STEPS.items():
+            new_location = np.argwhere(grid == (1 + di) * 3 + 1 + dj)[0]
+            step = (int(new_location[0]) - 1, int(new_location[1]) - 1)
+            self._directions[direction] = next(d for d, unit_step in UNIT_STEPS.items() if unit_step == step)
+        self._location_maps: dict[tuple[int, int], np.ndarray] = {}
+
+    def array(self, array: np.ndarray) -> np.ndarray:
+        """
+        Transform the first two axes of an array.
+        """
+        if self.flipped:
+            array = np.fliplr(array)
+        return np.rot90(array, self.rotations)
+
+    def shape(self, shape: tuple[int, int]) -> tuple[int, int]:
+        return (shape[1], shape[0]) if self.rotations % 2 else (shape[0], shape[1])
+
+    def location(self, location, shape: tuple[int, int]) -> tuple[int, int]:
+        """
+        Where a cell of a board of the given shape ends up.
+        """
+        if shape not in self._location_maps:
+            new_board = self.array(np.arange(shape[0] * shape[1]).reshape(shape))
+            new_positions = np.argsort(new_board.ravel())
+            new_width = new_board.shape[1]
+            self._location_maps[shape] = np.stack(np.divmod(new_positions, new_width), axis=1)
+        row, column = self._location_maps[shape][int(location[0]) * shape[1] + int(location[1])]
+        return int(row), int(column)
+
+    def direction(self, direction: CardinalDirection) -> CardinalDirection:
+        return self._directions[direction]
+
+    def component(self, component: TileComponent) -> TileComponent:
+        if isinstance(component, Plane):
+            return plane_facing(self.direction(component.direction))
+        return component
+
+    def tile_content(self, content: np.ndarray) -> np.ndarray:
+        new_content = self.array(content)
+        return np.array([[self.component(component) for component in row] for row in new_content], dtype=object)
+
+    def placement(self, top_left_corner: tuple[int, int], content: np.ndarray,
+                  shape: tuple[int, int]) -> tuple[tuple[int, int], np.ndarray]:
+        """
+        Transform a tile with the given content placed at top_left_corner on a board of the given shape.
+        :return: The new top left corner and the new content
+        """
+        height, width = content.shape
+        i, j = top_left_corner
+        corners = [self.location((i + a, j + b), shape) for a in (0, height - 1) for b in (0, width - 1)]
+        new_top_left_corner = (min(corner[0] for corner in corners), min(corner[1] for corner in corners))
+        return new_top_left_corner, self.tile_content(content)
+
+    def tile(self, tile: Tile) -> Tile:
+        return Tile(self.tile_content(tile.content))
+
+    def objective(self, objective: BoardObjective) -> BoardObjective:
+        paths = []
+        for path in objective.paths:
+            start = Point(self.location(path.locations[0], objective.shape))
+            segments = [Segment(self.direction(segment.direction), segment.length) for segment in path.segments]
+            paths.append(PathObjective(start, segments, path.flying_forward_mandatory, path.mandatory_planes))
+        return BoardObjective(paths, shape=self.shape(objective.shape))
+
+    def level(self, level: Level) -> Level:
+        return Level(self.objective(level.objective), [self.tile(tile) for tile in level.tiles])
+
+    def tiling(self, tiling: Tiling) -> Tiling:
+        """
+        Transform a tiling of a level into the matching tiling of the transformed level. Every placed tile
+        becomes a rotation of the transformed tile.
+        """
+        top_left_corners, tiles = [], []
+        for top_left_corner, tile in zip(tiling.top_left_corners, tiling.tiles):
+            new_top_left_corner, _ = self.placement(top_left_corner, tile.content, tiling.shape)
+            unrotated_tile = self.tile(tile.rotation(-tile.has_been_rotated_by))
+            top_left_corners.append(new_top_left_corner)
+            tiles.append(unrotated_tile.rotation(self.tile_rotation(tile.has_been_rotated_by)))
+        return Tiling(top_left_corners, tiles, shape=self.shape(tiling.shape))
+
+    def tile_rotation(self, k: int) -> int:
+        """
+        A tile rotated by k and then transformed is the transformed tile rotated by tile_rotation(k).
+        """
+        return -k % 4 if self.flipped else k % 4
+
+    def then(self, other: BoardTransform) -> BoardTransform:
+        """
+        The transform that applies this transform and then the other one.
+        """
+        test_array = np.arange(6).reshape(2, 3)
+        expected = other.array(self.array(test_array))
+        return next(transform for transform in D4 if np.array_equal(transform.array(test_array), expected))
+
+    def inverse(self) -> BoardTransform:
+        return next(transform for transform in D4 if self.then(transform).is_identity())
+
+    def is_identity(self) -> bool:
+        return self.rotations == 0 and not self.flipped
+
+    def __eq__(self, other):
+        return isinstance(other, BoardTransform) and (self.rotations, self.flipped) == (other.rotations, other.flipped)
+
+    def __hash__(self):
+        return hash((self.rotations, self.flipped))
+
+    def __repr__(self):
+        return f"BoardTransform(rotations={self.rotations}, flipped={self.flipped})"
+
+
+D4 = [BoardTransform(rotations, flipped) for flipped in (False, True) for rotations in range(4)]
+IDENTITY = D4[0]
+
+
+def level_symmetries(level: Level) -> list[BoardTransform]:
+    """
+    The transforms that map a level onto itself: every path onto a path with the same rules, traversed in the
+    same order, and every tile onto a rotation of itself. They map every solution of the level to a solution.
+    Levels with two different tiles that are rotations of each other are treated as having no symmetry.
+    :return: The symmetries, IDENTITY first
+    """
+    tiles = set(level.tiles)
+    classes = [_rotation_class(tile.content) for tile in tiles]
+    if len(set(classes)) < len(classes):
+        return [IDENTITY]
+
+    objective = level.objective
+    paths = _path_descriptions(IDENTITY, objective)
+    symmetries = []
+    for transform in D4:
+        if transform.shape(objective.shape) != tuple(objective.shape):
+            continue
+        if _path_descriptions(transform, objective) != paths:
+            continue
+        if all(_rotation_class(transform.tile_content(tile.content)) == rotation_class
+               for tile, rotation_class in zip(tiles, classes)):
+            symmetries.append(transform)
+    return symmetries
+
+
+def _rotation_class(content: np.ndarray) -> tuple:
+    return min(content_key(rotated_tile.content) for rotated_tile in Tile(content).distinct_rotations())
+
+
+def _path_descriptions(transform: BoardTransform, objective: BoardObjective) -> list[tuple]:
+    descriptions = []
+    for path in objective.paths:
+        descriptions.append((tuple(transform.location(location, objective.shape) for location in path.locations),
+                             tuple(transform.direction(direction).code for direction in path.directions),
+                             tuple(path.corner_index_array.tolist()),
+                             tuple(int(i) for i in path.mandatory_planes),
+                             bool(path.flying_forward_mandatory)))
+    return sorted(descriptions)
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from defaultLevels import level7, level48
+from boardTransforms import D4, IDENTITY, BoardTransform, level_symmetries
+from benchmarks import row_level
+from board import BoardObjective
+from level import Level
+from tileComponents import COVERED
+from tiling import Tile
+from cardinalDirections import NORTH, WEST, SOUTH, EAST
+
+
+class TestBoardTransformMethods(unittest.TestCase):
+    def test_inverse(self):
+        array = np.arange(12).reshape(3, 4)
+        for transform in D4:
+            self.assertTrue(np.array_equal(transform.inverse().array(transform.array(array)), array))
+
+    def test_location_matches_array(self):
+        array = np.arange(12).reshape(3, 4)
+        for transform in D4:
+            transformed_array = transform.array(array)
+            for (i, j), value in np.ndenumerate(array):
+                self.assertEqual(transformed_array[transform.location((i, j), (3, 4))], value)
+
+    def test_quarter_turn_directions(self):
+        transform = BoardTransform(1, False)
+        self.assertEqual([transform.direction(d) for d in (NORTH, EAST, SOUTH, WEST)], [EAST, SOUTH, WEST, NORTH])
+
+    def test_identity(self):
+        self.assertTrue(IDENTITY.is_identity())
+        self.assertEqual(IDENTITY.then(BoardTransform(3, True)), BoardTransform(3, True))
+
+    def test_transformed_solutions_are_valid(self):
+        for level in (level7, level48):
+            solutions = list(level.solutions())
+            for transform in D4:
+                transformed_level = transform.level(level)
+                for tiling in solutions:
+                    self.assertIsNone(transformed_level.raise_exception_if_tiling_invalid(transform.tiling(tiling)))
+                self.assertEqual(transformed_level.count_solutions(), len(solutions))
+
+    def test_level_symmetries(self):
+        self.assertEqual(level_symmetries(level7), [IDENTITY])
+        self.assertEqual(level_symmetries(row_level(4)), [IDENTITY, BoardTransform(2, True)])
+        self.assertEqual(len(level_symmetries(Level(BoardObjective([], shape=(3, 3)), [Tile([[COVERED]])]))), 8)
+        self.assertEqual(len(level_symmetries(Level(BoardObjective([], shape=(2, 3)), [Tile([[COVERED]])]))), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
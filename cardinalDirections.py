@@ -1,37 +1,69 @@
+from __future__ import annotations
+
 class CardinalDirection:
     __match_args__ = tuple("direction")
+    __slots__ = ("direction", "code", "unit_step", "_hash", "_rotations")
+    _instances: dict[str, CardinalDirection] = {}
 
-    def __init__(self, direction):
+    def __new__(cls, direction):
+        """
+        There is one instance per direction, CardinalDirection("NORTH") is NORTH. The rotations and the unit step
+        are filled in once all four exist, see _fill_lookup_tables.
+        """
+        if direction in cls._instances:
+            return cls._instances[direction]
         if direction not in "NORTH SOUTH WEST EAST".split():
             raise ValueError(f"{direction} is not a cardinal direction.")
+        self = super().__new__(cls)
         self.direction = direction
+        self._hash = hash(direction)
+        cls._instances[direction] = self
+        return self
 
     def opposite_direction(self):
-        if self.direction == "NORTH":
-            return SOUTH
-        elif self.direction == "WEST":
-            return EAST
-        elif self.direction == "SOUTH":
-            return NORTH
-        elif self.direction == "EAST":
-            return WEST
-
-    def __key(self):
-        return self.direction
+        return self._rotations[2]
+
+    def rotate(self, k: int):
+        """
+        The direction k quarter turns counterclockwise from this one, in the order of DIRECTIONS.
+        """
+        return self._rotations[k % 4]
 
     def __hash__(self):
-        return hash(self.__key())
+        return self._hash
 
     def __eq__(self, other):
         if isinstance(other, CardinalDirection):
-            return self.__key() == other.__key()
+            return self is other
         return NotImplemented
 
     def __repr__(self):
-        return repr(self.__key())
+        return repr(self.direction)
+
+    def __reduce__(self):
+        # Unpickle to the module level singleton, the code compares directions with `is`.
+        return direction_named, (self.direction,)
+
+
+def direction_named(name: str) -> CardinalDirection:
+    return CardinalDirection._instances[name]
 
 
 NORTH = CardinalDirection("NORTH")
 WEST = CardinalDirection("WEST")
 SOUTH = CardinalDirection("SOUTH")
 EAST = CardinalDirection("EAST")
+
+# Ordered counterclockwise, like the planes in tileComponents.py, so that index + k is a rotation by k.
+DIRECTIONS = (NORTH, WEST, SOUTH, EAST)
+
+
+def _fill_lookup_tables():
+    unit_steps = {NORTH: (-1, 0), WEST: (0, 1), SOUTH: (1, 0), EAST: (0, -1)}
+    for code, direction in enumerate(DIRECTIONS):
+        direction.code = code
+        direction.unit_step = unit_steps[direction]
+        direction._rotations = tuple(DIRECTIONS[(code + k) % 4] for k in range(4))
+
+
+_fill_lookup_tables()
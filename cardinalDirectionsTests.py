@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from cardinalDirections import CardinalDirection, NORTH, SOUTH, WEST, EAST
@@ -8,5 +9,22 @@ class TestCardinalDirections(unittest.TestCase):
         with self.assertRaises(ValueError):
             CardinalDirection("NORTHWEST")
 
+    def test_unpickled_direction_is_singleton(self):
+        for direction in (NORTH, SOUTH, WEST, EAST):
+            self.assertIs(pickle.loads(pickle.dumps(direction)), direction)
+        self.assertIs(pickle.loads(pickle.dumps(CardinalDirection("WEST"))), WEST)
+
+    def test_directions_are_interned(self):
+        self.assertIs(CardinalDirection("NORTH"), NORTH)
+
+    def test_lookup_tables(self):
+        self.assertIs(NORTH.opposite_direction(), SOUTH)
+        self.assertIs(WEST.opposite_direction(), EAST)
+        self.assertIs(NORTH.rotate(1), WEST)
+        self.assertIs(EAST.rotate(1), NORTH)
+        self.assertIs(SOUTH.rotate(-1), WEST)
+        self.assertEqual(WEST.unit_step, (0, 1))
+        self.assertEqual(NORTH.unit_step, (-1, 0))
+
 if __name__ == '__main__':
     unittest.main()
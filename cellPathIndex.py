@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import numpy as np
+
+# One path through a cell: the index of the path in the objective, the position of the cell on the path, whether
+# the cell is a corner of the path and the direction code (see DIRECTION_CODES) the path goes in at the cell.
+ENTRY = np.dtype([('path', np.int32), ('position', np.int32), ('corner', np.bool_), ('direction', np.int8)])
+NO_ENTRY = (-1, -1, False, -1)
+
+
+class CellPathIndex:
+    def __init__(self, objective):
+        """
+        The paths through every cell of the board of an objective, as dense arrays. entries has shape
+        (H, W, depth) with an entry for every path through a cell, in the order of the paths, padded with NO_ENTRY;
+        counts has shape (H, W) and holds the number of entries of each cell. Crossing and overlapping paths, and a
+        path that crosses itself, give a cell several entries.
+        """
+        self.shape = tuple(objective.shape)
+        height, width = self.shape
+        paths = objective.paths
+        # Every cell of every path, in the order of the paths. The empty arrays keep this working without paths.
+        cells = np.concatenate([np.empty(0, dtype=np.intp)] +
+                               [np.ravel_multi_index((path.location_array[:, 0], path.location_array[:, 1]),
+                                                     self.shape) for path in paths])
+        path_indices = np.repeat(np.arange(len(paths), dtype=np.int32), [len(path) for path in paths])
+        positions = np.concatenate([np.empty(0, dtype=np.int32)] + [np.arange(len(path)) for path in paths])
+        corners = np.concatenate([np.empty(0, dtype=bool)] +
+                                 [np.isin(np.arange(len(path)), path.corner_index_array) for path in paths])
+        directions = np.concatenate([np.empty(0, dtype=np.uint8)] + [path.direction_codes for path in paths])
+
+        counts = np.bincount(cells, minlength=height * width)
+        self.depth = max(1, int(counts.max(initial=0)))
+        # The slot of an entry is the number of entries of its cell that come before it.
+        order = np.argsort(cells, kind='stable')
+        first_of_cell = np.cumsum(counts) - counts
+        slots = np.empty(len(cells), dtype=np.intp)
+        slots[order] = np.arange(len(cells)) - first_of_cell[cells[order]]
+
+        entries = np.full((height * width, self.depth), np.array(NO_ENTRY, dtype=ENTRY))
+        entries['path'][cells, slots] = path_indices
+        entries['position'][cells, slots] = positions
+        entries['corner'][cells, slots] = corners
+        entries['direction'][cells, slots] = directions
+        self.entries = entries.reshape(height, width, self.depth)
+        self.counts = counts.reshape(self.shape)
+        self.is_on_path = self.counts > 0
+        self.is_corner = self.entries['corner'].any(axis=2)
+
+        # The entries of every cell as tuples, for the lookups of one cell at a time.
+        self._paths_through: list[tuple[tuple[int, int], ...]] = [()] * (height * width)
+        for cell, path, position in zip(cells.tolist(), path_indices.tolist(), positions.tolist()):
+            self._paths_through[cell] += ((path, position),)
+
+    def paths_through(self, location) -> tuple[tuple[int, int], ...]:
+        """
+        :param location: A Point or a tuple (i, j)
+        :return: The index of every path through the location with the position of the location on that path,
+            empty if no path goes through it
+        """
+        return self._paths_through[location[0] * self.shape[1] + location[1]]
+
+    def entries_at(self, location) -> np.ndarray:
+        """
+        The entries of the paths through the location, without padding.
+        """
+        i, j = location[0], location[1]
+        return self.entries[i, j, :self.counts[i, j]]
+
+    def position(self, path_index: int, location) -> int:
+        """
+        The first position of the location on a path, as path.locations.index(location).
+        :raise ValueError: If the path does not go through the location
+        """
+        for path, position in self.paths_through(location):
+            if path == path_index:
+                return position
+        raise ValueError(f"Path {path_index} does not go through {location}")
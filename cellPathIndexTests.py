@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from board import BoardObjective, PathObjective, Point
+from cardinalDirections import SOUTH, WEST
+from cellPathIndex import CellPathIndex
+from defaultLevels import level48
+from encodedBoards import DIRECTION_CODES
+
+
+class TestCellPathIndexMethods(unittest.TestCase):
+    CROSSING_BOARD = BoardObjective.from_string(" s  \n"
+                                                "e+>f\n"
+                                                " v  \n"
+                                                " f  ")
+
+    def test_agrees_with_the_paths(self):
+        objective = level48.objective
+        index = objective.cell_index
+        for path_index, path in enumerate(objective.paths):
+            for position, location in enumerate(path.locations):
+                self.assertIn((path_index, position), index.paths_through(location))
+                self.assertEqual(index.position(path_index, location), path.locations.index(location))
+        on_path = np.zeros(objective.shape, dtype=bool)
+        for location in objective.allowed_plane_locations:
+            on_path[location.coordinates] = True
+        np.testing.assert_array_equal(index.is_on_path, on_path)
+
+    def test_crossing_paths(self):
+        index = CellPathIndex(self.CROSSING_BOARD)
+        self.assertEqual(index.depth, 2)
+        self.assertEqual(index.counts[1, 1], 2)
+        self.assertEqual(index.paths_through(Point((1, 1))), ((0, 1), (1, 1)))
+        entries = index.entries_at((1, 1))
+        self.assertEqual(entries['direction'].tolist(), [DIRECTION_CODES[SOUTH], DIRECTION_CODES[WEST]])
+        self.assertEqual(index.paths_through((0, 0)), ())
+        self.assertEqual(index.entries[0, 0, 0]['path'], -1)
+
+    def test_corners(self):
+        objective = BoardObjective([PathObjective.from_points([Point((0, 1)), Point((0, 3)), Point((2, 3))])],
+                                   shape=(3, 4))
+        index = objective.cell_index
+        self.assertTrue(index.is_corner[0, 3])
+        self.assertEqual(int(index.is_corner.sum()), 1)
+        self.assertEqual(index.entries_at((0, 3))['position'].tolist(), [2])
+
+    def test_position_not_on_path(self):
+        with self.assertRaises(ValueError):
+            self.CROSSING_BOARD.cell_index.position(0, (1, 0))
+
+    def test_without_paths(self):
+        index = CellPathIndex(BoardObjective([], shape=(2, 3)))
+        self.assertEqual(index.entries.shape, (2, 3, 1))
+        self.assertFalse(index.is_on_path.any())
+
+
+if __name__ == '__main__':
+    unittest.main()
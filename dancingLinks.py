@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Callable, Iterator
+
+
+class DancingLinks:
+    def __init__(self, primary_columns: int, secondary_columns: int, rows: list[list[int]]):
+        """
+        Knuth's Algorithm X with dancing links. Every primary column has to be covered exactly once, every
+        secondary column at most once. Nodes are stored in flat lists of integers instead of objects.
+        :param primary_columns: Columns 0 up to primary_columns
+        :param secondary_columns: The columns after the primary columns
+        :param rows: For every row, the columns it covers
+        """
+        number_of_columns = primary_columns + secondary_columns
+        self.rows = rows
+        header_count = number_of_columns + 1
+        self.left = list(range(-1, header_count - 1))
+        self.right = list(range(1, header_count + 1))
+        self.up = list(range(header_count))
+        self.down = list(range(header_count))
+        self.column = list(range(header_count))
+        self.row = [-1] * header_count
+        self.size = [0] * header_count
+
+        # The root (node 0) links only the primary column headers, secondary headers link to themselves.
+        self.left[0] = primary_columns
+        self.right[primary_columns] = 0
+        for header in range(primary_columns + 1, header_count):
+            self.left[header] = self.right[header] = header
+
+        for row_index, columns in enumerate(rows):
+            first = None
+            for column in columns:
+                self._append_node(row_index, column + 1, first)
+                if first is None:
+                    first = len(self.column) - 1
+
+    def _append_node(self, row_index: int, header: int, first: int | None):
+        node = len(self.column)
+        self.column.append(header)
+        self.row.append(row_index)
+        self.up.append(self.up[header])
+        self.down.append(header)
+        self.down[self.up[header]] = node
+        self.up[header] = node
+        self.size[header] += 1
+        if first is None:
+            self.left.append(node)
+            self.right.append(node)
+        else:
+            self.left.append(self.left[first])
+            self.right.append(first)
+            self.right[self.left[first]] = node
+            self.left[first] = node
+
+    def _cover(self, header: int):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, header: int):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def solutions(self, allows: Callable[[int], bool] = None, push: Callable[[int], None] = None,
+                  pop: Callable[[int], None] = None) -> Iterator[list[int]]:
+        """
+        Generate every exact cover as a list of row indices. The optional callbacks filter rows on
+        constraints that are not exact cover constraints.
+        :param allows: Called before choosing a row, the row is skipped if it returns False
+        :param push: Called after a row has been chosen
+        :param pop: Called when a chosen row is taken back
+        """
+        chosen = []
+        yield from self._search(chosen, allows, push, pop)
+
+    def _search(self, chosen, allows, push, pop) -> Iterator[list[int]]:
+        right, down, size = self.right, self.down, self.size
+        if right[0] == 0:
+            yield list(chosen)
+            return
+
+        header = right[0]
+        best = header
+        while header != 0:
+            if size[header] < size[best]:
+                best = header
+            header = right[header]
+        if size[best] == 0:
+            return
+
+        self._cover(best)
+        node = down[best]
+        while node != best:
+            row_index = self.row[node]
+            if allows is None or allows(row_index):
+                chosen.append(row_index)
+                if push is not None:
+                    push(row_index)
+                j = right[node]
+                while j != node:
+                    self._cover(self.column[j])
+                    j = right[j]
+
+                yield from self._search(chosen, allows, push, pop)
+
+                j = self.left[node]
+                while j != node:
+                    self._uncover(self.column[j])
+                    j = self.left[j]
+                if pop is not None:
+                    pop(row_index)
+                chosen.pop()
+            node = down[node]
+        self._uncover(best)
@@ -0,0 +1,39 @@
+import unittest
+
+from dancingLinks import DancingLinks
+
+
+class TestDancingLinksMethods(unittest.TestCase):
+    # Knuth's example from the dancing links paper, with the unique solution rows 0, 3 and 4.
+    KNUTH_ROWS = [[2, 4, 5], [0, 3, 6], [1, 2, 5], [0, 3], [1, 6], [3, 4, 6]]
+
+    def test_knuth_example(self):
+        solutions = list(DancingLinks(7, 0, self.KNUTH_ROWS).solutions())
+        self.assertEqual([sorted(solution) for solution in solutions], [[0, 3, 4]])
+
+    def test_no_solution(self):
+        self.assertEqual(list(DancingLinks(3, 0, [[0, 1], [1, 2]]).solutions()), [])
+
+    def test_secondary_columns_at_most_once(self):
+        rows = [[0, 2], [1, 2], [0], [1]]
+        solutions = {frozenset(solution) for solution in DancingLinks(2, 1, rows).solutions()}
+        self.assertEqual(solutions, {frozenset({0, 3}), frozenset({1, 2}), frozenset({2, 3})})
+
+    def test_all_solutions(self):
+        rows = [[0], [1], [0, 1]]
+        self.assertEqual(len(list(DancingLinks(2, 0, rows).solutions())), 2)
+
+    def test_filter(self):
+        rows = [[0], [1], [0, 1]]
+        solutions = list(DancingLinks(2, 0, rows).solutions(allows=lambda row: row != 2))
+        self.assertEqual([sorted(solution) for solution in solutions], [[0, 1]])
+
+    def test_structure_restored(self):
+        links = DancingLinks(7, 0, self.KNUTH_ROWS)
+        before = (list(links.left), list(links.right), list(links.up), list(links.down), list(links.size))
+        list(links.solutions())
+        self.assertEqual(before, (links.left, links.right, links.up, links.down, links.size))
+
+
+if __name__ == '__main__':
+    unittest.main()
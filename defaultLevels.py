@@ -43,6 +43,6 @@ level7 = Level(objective=BoardObjective([PathObjective(p00, [Segment(SOUTH, 1)],
 level48 = Level(objective=BoardObjective([PathObjective(p00, [Segment(SOUTH, 4)]),
                                           PathObjective(p01, [Segment(SOUTH, 4)]),
                                           PathObjective(p33, [Segment(WEST, 0), Segment(NORTH, 3),
-                                                              Segment(WEST, 1), Segment(SOUTH, 4)])],
+                                                              Segment(EAST, 1), Segment(SOUTH, 4)])],
                                          shape=(4, 4)),
                 tiles=DEFAULT_TILES)
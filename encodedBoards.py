@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from cardinalDirections import *
+from tileComponents import PLANES, UNCOVERED
+from errorsAndExceptions import MissingPlaneException, PlaneLocationException, PlaneDirectionException, \
+    FillingShapeError
+
+# A board filling encoded as int8: UNCOVERED, any other non plane component, or PLANE_CODE + the direction code.
+UNCOVERED_CODE = 0
+COVERED_CODE = 1
+PLANE_CODE = 2
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+
+def encode_filling(board_filling) -> np.ndarray:
+    """
+    Encode a BoardFilling (or a 2d array of tile components) as an int8 array.
+    """
+    filling = np.asarray(getattr(board_filling, "filling", board_filling))
+    encoded = np.full(filling.shape, COVERED_CODE, dtype=np.int8)
+    flat_filling = filling.ravel()
+    flat_encoded = encoded.ravel()
+    for i, component in enumerate(flat_filling):
+        if component is UNCOVERED:
+            flat_encoded[i] = UNCOVERED_CODE
+        elif component in PLANES:
+            flat_encoded[i] = PLANE_CODE + DIRECTION_CODES[component.direction]
+    return encoded
+
+
+def encode_fillings(board_fillings: Iterable) -> np.ndarray:
+    """
+    Encode several fillings of the same shape as one (N, H, W) int8 array.
+    """
+    return np.stack([encode_filling(board_filling) for board_filling in board_fillings])
+
+
+class EncodedPathObjective:
+    def __init__(self, path, shape: tuple[int, int]):
+        """
+        The index arrays of a path objective, for checking int8 encoded fillings of a board with the given shape.
+        """
+        locations = path.location_array
+        self.cells = np.ravel_multi_index((locations[:, 0], locations[:, 1]), shape)
+        self.forward_codes = (PLANE_CODE + path.direction_codes).astype(np.int8)
+        self.backward_codes = PLANE_CODE + (self.forward_codes - PLANE_CODE + 2) % 4
+        self.corner_indices = path.corner_index_array
+        self.mandatory_indices = np.array(path.mandatory_planes, dtype=np.intp)
+        self.path = path
+
+    def failures(self, flat_codes: np.ndarray) -> dict[type, np.ndarray]:
+        """
+        Check a batch of flattened encoded fillings against the path.
+        :param flat_codes: Array of shape (N, H*W)
+        :return: For every exception type the path checks for, a boolean vector of the fillings that fail that check
+        """
+        codes = flat_codes[:, self.cells]
+        is_plane = codes >= PLANE_CODE
+        forward = codes == self.forward_codes
+        backward = codes == self.backward_codes
+
+        missing_plane = ~is_plane[:, self.mandatory_indices].all(axis=1)
+        plane_on_corner = is_plane[:, self.corner_indices].any(axis=1)
+        any_backward = backward.any(axis=1)
+        if self.path.flying_forward_mandatory:
+            wrong_direction = any_backward
+        else:
+            wrong_direction = forward.any(axis=1) & any_backward
+        wrong_direction |= (is_plane & ~forward & ~backward).any(axis=1)
+
+        return {MissingPlaneException: missing_plane,
+                PlaneLocationException: plane_on_corner,
+                PlaneDirectionException: wrong_direction}
+
+
+class EncodedBoardObjective:
+    def __init__(self, objective):
+        """
+        Precomputed index arrays of a BoardObjective for validating int8 encoded fillings with NumPy.
+        """
+        self.shape = tuple(objective.shape)
+        self.allowed_planes = np.zeros(self.shape[0] * self.shape[1], dtype=bool)
+        self.paths = [EncodedPathObjective(path, self.shape) for path in objective.paths]
+        for path in self.paths:
+            self.allowed_planes[path.cells] = True
+
+    def validity(self, encoded_fillings: np.ndarray) -> np.ndarray:
+        """
+        :param encoded_fillings: Array of shape (N, H, W) of encoded fillings
+        :return: Boolean vector that is True for every valid filling
+        """
+        flat_codes = self._flat_codes(encoded_fillings)
+        valid = ~self._planes_off_path(flat_codes)
+        for path in self.paths:
+            for failed in path.failures(flat_codes).values():
+                valid &= ~failed
+        return valid
+
+    def raise_exception_if_filling_invalid(self, encoded_filling: np.ndarray):
+        """
+        Same checks and exceptions as BoardObjective.raise_exception_if_filling_invalid, for one encoded filling.
+        """
+        flat_codes = self._flat_codes(encoded_filling[np.newaxis])
+        if self._planes_off_path(flat_codes)[0]:
+            raise PlaneLocationException("A plane is outside the allowed paths.")
+        for i, path in enumerate(self.paths):
+            for exception, failed in path.failures(flat_codes).items():
+                if failed[0]:
+                    raise exception(f"Filling does not satisfy path {i}.")
+
+    def _flat_codes(self, encoded_fillings: np.ndarray) -> np.ndarray:
+        if encoded_fillings.ndim != 3 or encoded_fillings.shape[1:] != self.shape:
+            raise FillingShapeError("Filling does not have the same shape as the board.")
+        return encoded_fillings.reshape(len(encoded_fillings), -1)
+
+    def _planes_off_path(self, flat_codes: np.ndarray) -> np.ndarray:
+        return ((flat_codes >= PLANE_CODE) & ~self.allowed_planes).any(axis=1)
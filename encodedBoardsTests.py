@@ -0,0 +1,75 @@
+import unittest
+import random
+
+import numpy as np
+
+from board import *
+from encodedBoards import encode_filling, encode_fillings, UNCOVERED_CODE, COVERED_CODE, PLANE_CODE, \
+    DIRECTION_CODES
+from tileComponents import NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE, COVERED, \
+    UNCOVERED
+from errorsAndExceptions import *
+
+
+class TestEncodingMethods(unittest.TestCase):
+    def test_encode_filling(self):
+        filling = BoardFilling([[COVERED, UNCOVERED],
+                                [SOUTH_FACING_PLANE, EAST_FACING_PLANE]])
+        self.assertTrue(np.array_equal(encode_filling(filling),
+                                       [[COVERED_CODE, UNCOVERED_CODE],
+                                        [PLANE_CODE + DIRECTION_CODES[SOUTH], PLANE_CODE + DIRECTION_CODES[EAST]]]))
+        self.assertEqual(encode_filling(filling).dtype, np.int8)
+
+    def test_encode_fillings(self):
+        filling = BoardFilling([[COVERED, UNCOVERED]])
+        self.assertEqual(encode_fillings([filling, filling, filling]).shape, (3, 1, 2))
+
+
+class TestEncodedBoardObjectiveMethods(unittest.TestCase):
+    DEFAULT_BOARD = BoardObjective(
+        [PathObjective.from_points([Point((1, 1)), Point((1, 3)), Point((3, 3))]),
+         PathObjective.from_points([Point((0, 0)), Point((0, 3))], mandatory_planes=(1,)),
+         PathObjective.from_points([Point((3, 2)), Point((0, 2))], flying_forward_mandatory=True)],
+        shape=(4, 4))
+    COMPONENTS = [COVERED, UNCOVERED, NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE]
+
+    def random_fillings(self, number):
+        generator = random.Random(7)
+        fillings = []
+        for _ in range(number):
+            filling = [[COVERED] * 4 for _ in range(4)]
+            for _ in range(generator.randint(0, 3)):
+                filling[generator.randrange(4)][generator.randrange(4)] = generator.choice(self.COMPONENTS)
+            fillings.append(BoardFilling(filling))
+        return fillings
+
+    def verdict(self, filling):
+        try:
+            self.DEFAULT_BOARD.raise_exception_if_filling_invalid(filling)
+        except InvalidFillingException as exception:
+            return type(exception)
+        return None
+
+    def test_validity_matches_filling_validation(self):
+        fillings = self.random_fillings(500)
+        validity = self.DEFAULT_BOARD.encoded.validity(encode_fillings(fillings))
+        self.assertEqual(validity.shape, (500,))
+        self.assertEqual(list(validity), [self.verdict(filling) is None for filling in fillings])
+        self.assertTrue(validity.any() and not validity.all())
+
+    def test_exceptions_match_filling_validation(self):
+        for filling in self.random_fillings(200):
+            expected = self.verdict(filling)
+            if expected is None:
+                self.assertIsNone(self.DEFAULT_BOARD.encoded.raise_exception_if_filling_invalid(encode_filling(filling)))
+            else:
+                with self.assertRaises(expected):
+                    self.DEFAULT_BOARD.encoded.raise_exception_if_filling_invalid(encode_filling(filling))
+
+    def test_wrong_shape(self):
+        with self.assertRaises(FillingShapeError):
+            self.DEFAULT_BOARD.encoded.validity(np.zeros((2, 4, 5), dtype=np.int8))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -29,3 +29,11 @@ class PlaneDirectionException(InvalidFillingException):
 
 class PlaneLocationException(InvalidFillingException):
     pass
+
+
+class BoardFormatError(ValueError):
+    pass
+
+
+class ArchiveFormatError(ValueError):
+    pass
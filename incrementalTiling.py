@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from board import BoardObjective
+from tileComponents import PLANES, UNCOVERED
+from tiling import Tile, Tiling
+
+
+class IncrementalTiling(Tiling):
+    def __init__(self, objective: BoardObjective, top_left_corners: list[tuple[int, int]] = (),
+                 tiles: list[Tile] = ()):
+        """
+        A tiling of the board of an objective that is built and taken apart one tile at a time. It keeps count
+        of the covered cells and keeps a PathState for every path, so its validity is known after every step
+        without looking at the rest of the board. Adding or removing a tile costs time in the size of the tile.
+        """
+        self.objective = objective
+        self.covered_cells = 0
+        self.planes_off_path = 0
+        self.path_states = [path.new_state() for path in objective.paths]
+        self._violations = 0
+        self._cell_index = objective.cell_index
+
+        super().__init__(top_left_corners, tiles, objective.shape)
+
+    def add_tile(self, top_left_corner: tuple[int, int], tile: Tile):
+        super().add_tile(top_left_corner, tile)
+        self._update(top_left_corner, tile, placed=True)
+
+    def remove_tile(self, index: int = -1) -> tuple[tuple[int, int], Tile]:
+        top_left_corner, tile = super().remove_tile(index)
+        self._update(top_left_corner, tile, placed=False)
+        return top_left_corner, tile
+
+    push_tile = add_tile
+
+    def pop_tile(self) -> tuple[tuple[int, int], Tile]:
+        return self.remove_tile()
+
+    @property
+    def violations(self) -> int:
+        """
+        The number of paths (and the board, for planes off the paths) with a broken rule that adding more
+        tiles can not repair.
+        """
+        return self._violations
+
+    def missing_mandatory_planes(self) -> int:
+        return sum(len(state.unfilled_mandatory_planes) for state in self.path_states)
+
+    def is_consistent(self) -> bool:
+        """
+        Whether the tiles placed so far break no rule that more tiles could not repair.
+        """
+        return self._violations == 0
+
+    def is_valid(self) -> bool:
+        """
+        Whether the tiling satisfies the objective, ignoring which tiles the level asks for.
+        """
+        return self._violations == 0 and self.missing_mandatory_planes() == 0
+
+    def _update(self, top_left_corner: tuple[int, int], tile: Tile, placed: bool):
+        sign = 1 if placed else -1
+        for (i, j), component in tile.enumerate_components():
+            if component is UNCOVERED:
+                continue
+            self.covered_cells += sign
+            if component not in PLANES:
+                continue
+
+            paths_through = self._cell_index.paths_through((top_left_corner[0] + i, top_left_corner[1] + j))
+            if not paths_through:
+                self._violations -= self.planes_off_path > 0
+                self.planes_off_path += sign
+                self._violations += self.planes_off_path > 0
+                continue
+
+            for path_index, index in paths_through:
+                state = self.path_states[path_index]
+                self._violations -= state.violation() is not None
+                self._violations += state.set_cell(index, component if placed else None) is not None
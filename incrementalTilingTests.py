@@ -0,0 +1,94 @@
+import random
+import unittest
+
+import numpy as np
+
+from defaultLevels import level7, level48, DEFAULT_TILES
+from board import BoardObjective, PathObjective, Point
+from incrementalTiling import IncrementalTiling
+from tileComponents import COVERED, UNCOVERED, NORTH_FACING_PLANE, WEST_FACING_PLANE
+from tiling import Tile
+from errorsAndExceptions import InvalidFillingException, TileLocationError
+
+
+class TestIncrementalTilingMethods(unittest.TestCase):
+    def objective_accepts(self, tiling):
+        try:
+            tiling.objective.raise_exception_if_filling_invalid(tiling.filling)
+        except InvalidFillingException:
+            return False
+        return True
+
+    def test_solution_is_valid(self):
+        for level in (level7, level48):
+            solution = level.solve()
+            tiling = IncrementalTiling(level.objective, solution.top_left_corners, solution.tiles)
+            self.assertTrue(tiling.is_valid())
+            self.assertEqual(tiling.covered_cells, 16)
+
+    def test_pop_undoes_push(self):
+        solution = level7.solve()
+        tiling = IncrementalTiling(level7.objective)
+        for top_left_corner, tile in zip(solution.top_left_corners, solution.tiles):
+            tiling.push_tile(top_left_corner, tile)
+        while tiling.tiles:
+            tiling.pop_tile()
+        self.assertEqual(tiling.covered_cells, 0)
+        self.assertEqual(tiling.violations, 0)
+        self.assertEqual(tiling.bitboard.covered, 0)
+        self.assertTrue(all(component is UNCOVERED for component in tiling.filling.filling.flat))
+        self.assertEqual([state.direction_class for state in tiling.path_states], [None] * 6)
+
+    def test_mandatory_plane_missing(self):
+        tiling = IncrementalTiling(level7.objective)
+        self.assertTrue(tiling.is_consistent())
+        self.assertFalse(tiling.is_valid())
+        self.assertEqual(tiling.missing_mandatory_planes(), 6)
+
+    def test_plane_off_path(self):
+        objective = BoardObjective([PathObjective.from_points([Point((0, 0)), Point((0, 3))])], shape=(2, 4))
+        tiling = IncrementalTiling(objective)
+        tiling.push_tile((1, 0), Tile([[NORTH_FACING_PLANE]]))
+        self.assertFalse(tiling.is_consistent())
+        tiling.pop_tile()
+        self.assertTrue(tiling.is_valid())
+
+    def test_remove_from_middle(self):
+        objective = BoardObjective([PathObjective.from_points([Point((0, 0)), Point((0, 3))])], shape=(2, 4))
+        tiling = IncrementalTiling(objective)
+        tiling.push_tile((0, 0), Tile([[WEST_FACING_PLANE]]))
+        tiling.push_tile((0, 1), Tile([[NORTH_FACING_PLANE]]))
+        tiling.push_tile((1, 0), Tile([[COVERED]]))
+        self.assertFalse(tiling.is_consistent())
+        tiling.remove_tile(1)
+        self.assertTrue(tiling.is_valid())
+        self.assertEqual(tiling.top_left_corners, [(0, 0), (1, 0)])
+
+    def test_failed_push_changes_nothing(self):
+        tiling = IncrementalTiling(level7.objective)
+        tiling.push_tile((0, 0), DEFAULT_TILES[0])
+        with self.assertRaises(TileLocationError):
+            tiling.push_tile((0, 0), DEFAULT_TILES[1])
+        self.assertEqual(tiling.covered_cells, 2)
+        self.assertEqual(len(tiling.tiles), 1)
+
+    def test_agrees_with_objective_validation(self):
+        generator = random.Random(3)
+        for level in (level7, level48):
+            tiling = IncrementalTiling(level.objective)
+            for _ in range(300):
+                if tiling.tiles and generator.random() < 0.4:
+                    tiling.remove_tile(generator.randrange(len(tiling.tiles)))
+                else:
+                    tile = generator.choice(DEFAULT_TILES).rotation(generator.randrange(4))
+                    corner = (generator.randrange(3), generator.randrange(3))
+                    try:
+                        tiling.push_tile(corner, tile)
+                    except TileLocationError:
+                        continue
+                self.assertEqual(tiling.is_valid(), self.objective_accepts(tiling))
+                self.assertEqual(tiling.covered_cells, int(np.sum(tiling.filling.filling != UNCOVERED)))
+
+
+if __name__ == '__main__':
+    unittest.main()
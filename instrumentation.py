@@ -0,0 +1,168 @@
+"""
+Opt-in counters for the hot paths of validation and tiling.
+
+    import instrumentation
+    with instrumentation.enabled():
+        level.validate_many(tilings)
+    print(instrumentation.prometheus_text())
+
+While enabled, the methods in TARGETS are replaced by wrappers that count calls, add up the time spent in them and
+count the rules that fail, by exception type. Disabling puts the original methods back, so there is no cost at all
+when the instrumentation is off.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from board import BoardObjective, PathObjective, Violation, FillingCheck
+from incrementalTiling import IncrementalTiling
+from level import Level
+from tiling import Tile, Tiling
+
+TARGETS = [
+    (Level, "raise_exception_if_tiling_invalid"),
+    (Level, "validate_many"),
+    (BoardObjective, "raise_exception_if_filling_invalid"),
+    (BoardObjective, "check_filling"),
+    (BoardObjective, "bitboard_violation"),
+    (PathObjective, "raise_exception_if_filling_invalid"),
+    (PathObjective, "check_filling"),
+    (PathObjective, "_missing_plane_violations"),
+    (PathObjective, "_corner_violations"),
+    (PathObjective, "_out_of_path_violations"),
+    (PathObjective, "_backward_violations"),
+    (PathObjective, "_direction_change_violations"),
+    (Tiling, "add_tile"),
+    (IncrementalTiling, "add_tile"),
+    (IncrementalTiling, "push_tile"),
+    (Tile, "rotation"),
+]
+
+
+class Stats:
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.failures: Counter[str] = Counter()
+
+    def as_dict(self) -> dict:
+        return {"calls": self.calls, "seconds": self.seconds, "failures": dict(self.failures)}
+
+
+_stats: dict[str, Stats] = {}
+_originals: dict[tuple[type, str], object] = {}
+
+
+def enable():
+    """
+    Start counting. Counts of an earlier run are kept, see reset.
+    """
+    for owner, attribute in TARGETS:
+        if (owner, attribute) in _originals:
+            continue
+        original = owner.__dict__[attribute]
+        _originals[(owner, attribute)] = original
+        setattr(owner, attribute, _instrumented(original, f"{owner.__name__}.{attribute}"))
+
+
+def disable():
+    for (owner, attribute), original in _originals.items():
+        setattr(owner, attribute, original)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def reset():
+    _stats.clear()
+
+
+@contextmanager
+def enabled():
+    """
+    Count within a with block.
+    """
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot() -> dict[str, dict]:
+    """
+    :return: For every instrumented method that was called, its calls, seconds and failures by reason
+    """
+    return {name: stats.as_dict() for name, stats in sorted(_stats.items())}
+
+
+def prometheus_text(prefix: str = "air_traffic_controller") -> str:
+    """
+    The snapshot in the Prometheus text exposition format.
+    """
+    lines = [f"# HELP {prefix}_calls_total Calls of an instrumented method.",
+             f"# TYPE {prefix}_calls_total counter"]
+    lines += [f'{prefix}_calls_total{{method="{name}"}} {stats.calls}' for name, stats in sorted(_stats.items())]
+    lines += [f"# HELP {prefix}_seconds_total Time spent in an instrumented method.",
+              f"# TYPE {prefix}_seconds_total counter"]
+    lines += [f'{prefix}_seconds_total{{method="{name}"}} {stats.seconds!r}' for name, stats in sorted(_stats.items())]
+    lines += [f"# HELP {prefix}_failures_total Broken rules and errors reported by an instrumented method.",
+              f"# TYPE {prefix}_failures_total counter"]
+    lines += [f'{prefix}_failures_total{{method="{name}",reason="{reason}"}} {count}'
+              for name, stats in sorted(_stats.items()) for reason, count in sorted(stats.failures.items())]
+    return "\n".join(lines) + "\n"
+
+
+def _instrumented(function, name: str):
+    # The stats are looked up on every call, so that reset also works while enabled.
+    if inspect.isgeneratorfunction(function):
+        @functools.wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            # The time of a generator is the time spent producing its items.
+            stats = _stats.setdefault(name, Stats())
+            stats.calls += 1
+            generator = function(*args, **kwargs)
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    stats.seconds += time.perf_counter() - start
+                    return
+                stats.seconds += time.perf_counter() - start
+                _count_failures(stats, item)
+                yield item
+        return generator_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stats = _stats.setdefault(name, Stats())
+        stats.calls += 1
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as exception:
+            stats.failures[type(exception).__name__] += 1
+            raise
+        finally:
+            stats.seconds += time.perf_counter() - start
+        _count_failures(stats, result)
+        return result
+    return wrapper
+
+
+def _count_failures(stats: Stats, result):
+    if isinstance(result, Violation):
+        stats.failures[result.code] += 1
+    elif isinstance(result, FillingCheck):
+        stats.failures.update(violation.code for violation in result.violations)
+    elif isinstance(result, list):
+        stats.failures.update(item.code for item in result if isinstance(item, Violation))
+    elif result is False:
+        stats.failures["invalid"] += 1
@@ -0,0 +1,73 @@
+import unittest
+
+import instrumentation
+from defaultLevels import level7, DEFAULT_TILE_1, DEFAULT_TILE_2, \
+    DEFAULT_TILE_3, DEFAULT_TILE_4, DEFAULT_TILE_5, DEFAULT_TILE_6
+from level import Level
+from tiling import Tile, Tiling
+
+
+class TestInstrumentationMethods(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        self.correct_tiling = Tiling([(0, 0), (0, 1), (0, 2), (2, 0), (2, 1), (2, 3)],
+                                     [DEFAULT_TILE_1.rotation(2), DEFAULT_TILE_6, DEFAULT_TILE_4.rotation(1),
+                                      DEFAULT_TILE_5.rotation(1), DEFAULT_TILE_3.rotation(2),
+                                      DEFAULT_TILE_2.rotation(1)], shape=(4, 4))
+        self.wrong_tiling = Tiling([(0, 0), (0, 1), (0, 3), (2, 0), (2, 1), (2, 2)],
+                                   [DEFAULT_TILE_5.rotation(1), DEFAULT_TILE_3.rotation(2), DEFAULT_TILE_2.rotation(1),
+                                    DEFAULT_TILE_1.rotation(2), DEFAULT_TILE_6, DEFAULT_TILE_4.rotation(1)],
+                                   shape=(4, 4))
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disable_restores_the_methods(self):
+        rotation = Tile.rotation
+        validate_many = Level.validate_many
+        with instrumentation.enabled():
+            self.assertTrue(instrumentation.is_enabled())
+            self.assertIsNot(Tile.rotation, rotation)
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(Tile.rotation, rotation)
+        self.assertIs(Level.validate_many, validate_many)
+
+    def test_nothing_is_counted_while_disabled(self):
+        level7.validate_many([self.correct_tiling])
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_counts_calls_and_failures(self):
+        with instrumentation.enabled():
+            level7.raise_exception_if_tiling_invalid(self.correct_tiling)
+            with self.assertRaises(Exception) as context:
+                level7.raise_exception_if_tiling_invalid(self.wrong_tiling)
+            level7.validate_many([self.correct_tiling, self.wrong_tiling])
+
+        stats = instrumentation.snapshot()
+        reason = type(context.exception).__name__
+        self.assertEqual(stats["Level.raise_exception_if_tiling_invalid"]["calls"], 2)
+        self.assertEqual(stats["Level.raise_exception_if_tiling_invalid"]["failures"], {reason: 1})
+        self.assertEqual(stats["Level.validate_many"]["calls"], 1)
+        self.assertEqual(stats["Level.validate_many"]["failures"], {reason: 1})
+        self.assertGreaterEqual(stats["Level.validate_many"]["seconds"], 0)
+
+    def test_prometheus_text(self):
+        with instrumentation.enabled():
+            DEFAULT_TILE_1.rotation(1)
+            level7.validate_many([self.wrong_tiling])
+        text = instrumentation.prometheus_text()
+        self.assertIn('# TYPE air_traffic_controller_calls_total counter', text)
+        self.assertIn('air_traffic_controller_calls_total{method="Tile.rotation"} 1\n', text)
+        self.assertIn('air_traffic_controller_failures_total{method="Level.validate_many",reason="', text)
+
+    def test_reset(self):
+        with instrumentation.enabled():
+            DEFAULT_TILE_1.rotation(1)
+            instrumentation.reset()
+            DEFAULT_TILE_1.rotation(1)
+        self.assertEqual(instrumentation.snapshot()["Tile.rotation"]["calls"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
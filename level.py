@@ -1,5 +1,7 @@
-from board import BoardObjective
-from tiling import Tile
+from typing import Iterable
+
+from board import BoardObjective, Violation
+from tiling import Tile, Tiling
 from collections import Counter
 
 from errorsAndExceptions import TileTypeError
@@ -7,6 +9,23 @@ class Level:
     def __init__(self, objective: BoardObjective, tiles: list[Tile]):
         self.objective = objective
         self.tiles = tiles
+        self._placement_index = None
+
+    def __getstate__(self):
+        # The placement index is rebuilt when it is needed in another process.
+        state = self.__dict__.copy()
+        state['_placement_index'] = None
+        return state
+
+    @property
+    def placement_index(self):
+        """
+        The placements of the tiles that are allowed on an empty board, built on first use, see placementIndex.py.
+        """
+        if self._placement_index is None:
+            from placementIndex import PlacementIndex
+            self._placement_index = PlacementIndex(self)
+        return self._placement_index
 
     def raise_exception_if_tiling_invalid(self, tiling):
         if Counter(self.tiles) != Counter(tiling.tiles):
@@ -14,3 +33,74 @@ class Level:
 
         self.objective.raise_exception_if_filling_invalid(tiling.filling)
 
+    def validate_many(self, tilings: Iterable[Tiling]) -> list[Violation | None]:
+        """
+        Check many candidate tilings of the level without raising. The tiles of the level are counted once and
+        every tiling is checked with bit operations on its bitboard, see BoardObjective.bitboard_violation.
+        :return: For every tiling in order, the first rule it breaks, or None if it solves the level
+        """
+        tile_counts = Counter(self.tiles)
+        results = []
+        for tiling in tilings:
+            if Counter(tiling.tiles) != tile_counts:
+                results.append(Violation(TileTypeError, "These are not the right tiles for the level."))
+            else:
+                results.append(self.objective.bitboard_violation(tiling.bitboard))
+        return results
+
+    def solve(self, solver_class=None, reduce_symmetry: bool = False) -> Tiling | None:
+        """
+        Search for a tiling that solves the level.
+        :param solver_class: One of the solvers in solver.py, the exact cover solver by default
+        :param reduce_symmetry: Skip parts of the search that are rotations or reflections of other parts,
+            see boardTransforms.level_symmetries
+        :return: A valid tiling, or None if there is none.
+        """
+        return self._solver(solver_class, reduce_symmetry).solve()
+
+    def solve_within(self, seconds: float | None = None, nodes: int | None = None, token=None, on_progress=None):
+        """
+        Search for a tiling that solves the level, but stop after the given time or number of search nodes or when
+        the token is cancelled, see anytimeSolving.py.
+        :return: A SolveResult: the solution, the level is unsolvable, or unknown with the best partial tiling
+        """
+        from anytimeSolving import Budget, solve_within
+        return solve_within(self, Budget(seconds, nodes), token, on_progress)
+
+    async def solve_async(self, seconds: float | None = None, nodes: int | None = None, token=None,
+                          on_progress=None):
+        """
+        solve_within on an event loop, which runs other tasks while the search goes on.
+        """
+        from anytimeSolving import Budget, solve_async
+        return await solve_async(self, Budget(seconds, nodes), token, on_progress)
+
+    def solutions(self, solver_class=None, reduce_symmetry: bool = False):
+        """
+        Generate every tiling that solves the level.
+        """
+        return self._solver(solver_class, reduce_symmetry).solutions()
+
+    def canonical_solutions(self, solver_class=None):
+        """
+        Generate one tiling of every class of solutions that are rotations or reflections of each other.
+        """
+        return self._solver(solver_class, True).canonical_solutions()
+
+    def count_solutions(self, solver_class=None, reduce_symmetry: bool = False) -> int:
+        return self._solver(solver_class, reduce_symmetry).count()
+
+    def fingerprint(self) -> str:
+        """
+        A hash of the level that is the same for rotated and reflected copies and in every process,
+        see solutionCache.py.
+        """
+        from solutionCache import level_fingerprint
+        return level_fingerprint(self)[0]
+
+    def _solver(self, solver_class, reduce_symmetry: bool = False):
+        if solver_class is None:
+            from solver import ExactCoverSolver
+            solver_class = ExactCoverSolver
+        return solver_class(self, reduce_symmetry=reduce_symmetry)
+
@@ -0,0 +1,215 @@
+"""
+A compact, versioned binary format for levels and their solutions.
+
+An archive is a header followed by flat arrays of fixed size records, so it can be memory mapped and a level or
+a solution is only decoded when it is asked for. Paths are stored as their start and run-length encoded segments
+(a direction code in the low two bits, the length above them), tiles once in a table of distinct tiles, and the
+tiles of levels and solutions as an index into that table with a rotation.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from board import BoardObjective, PathObjective, Segment, Point
+from cardinalDirections import DIRECTIONS
+from errorsAndExceptions import ArchiveFormatError
+from level import Level
+from tileComponents import COVERED, UNCOVERED, plane_facing
+from tiling import Tile, Tiling, content_key
+
+MAGIC = b"ATCA"
+VERSION = 1
+
+# The components of a tile by code: UNCOVERED, COVERED and the planes in the order of DIRECTIONS.
+COMPONENTS = (UNCOVERED, COVERED) + tuple(plane_facing(direction) for direction in DIRECTIONS)
+COMPONENT_CODES = {component: code for code, component in enumerate(COMPONENTS)}
+
+FORWARD_ONLY = 1
+
+TILE = np.dtype([('height', 'u1'), ('width', 'u1'), ('first_component', '<u4')])
+LEVEL = np.dtype([('height', '<u2'), ('width', '<u2'), ('first_path', '<u4'), ('path_count', '<u4'),
+                  ('first_tile', '<u4'), ('tile_count', '<u4')])
+PATH = np.dtype([('row', '<u2'), ('column', '<u2'), ('flags', 'u1'), ('first_segment', '<u4'),
+                 ('segment_count', '<u4'), ('first_mandatory', '<u4'), ('mandatory_count', '<u4')])
+SOLUTION = np.dtype([('level', '<u4'), ('first_placement', '<u4'), ('placement_count', '<u4')])
+PLACEMENT = np.dtype([('tile', '<u2'), ('rotation', 'u1'), ('row', '<u2'), ('column', '<u2')])
+
+# The sections of an archive in the order they are written, with the type of their records.
+SECTIONS = {'tiles': TILE, 'components': np.dtype('u1'), 'levels': LEVEL, 'paths': PATH,
+            'segments': np.dtype('<u4'), 'mandatory': np.dtype('<u4'), 'level_tiles': np.dtype('<u2'),
+            'solutions': SOLUTION, 'placements': PLACEMENT}
+HEADER = np.dtype([('magic', 'S4'), ('version', '<u2'), ('reserved', '<u2'),
+                   ('sections', '<u8', (len(SECTIONS), 2))])
+ALIGNMENT = 8
+
+
+def write_archive(file_name: str, levels: Iterable[Level], solutions: Iterable[Iterable[Tiling]] | None = None):
+    """
+    :param solutions: For every level in order, the tilings to store with it
+    """
+    with open(file_name, 'wb') as archive_file:
+        archive_file.write(dumps(levels, solutions))
+
+
+def dumps(levels: Iterable[Level], solutions: Iterable[Iterable[Tiling]] | None = None) -> bytes:
+    writer = _ArchiveWriter()
+    levels = list(levels)
+    for level in levels:
+        writer.add_level(level)
+    if solutions is not None:
+        for level_index, tilings in zip(range(len(levels)), solutions):
+            for tiling in tilings:
+                writer.add_solution(level_index, tiling)
+    return writer.to_bytes()
+
+
+class _ArchiveWriter:
+    def __init__(self):
+        self.records = {name: [] for name in SECTIONS}
+        self.tile_ids: dict[tuple, int] = {}
+
+    def add_level(self, level: Level):
+        objective = level.objective
+        self.records['levels'].append((objective.shape[0], objective.shape[1], len(self.records['paths']),
+                                       len(objective.paths), len(self.records['level_tiles']), len(level.tiles)))
+        for path in objective.paths:
+            start = path.location_array[0]
+            self.records['paths'].append((start[0], start[1], FORWARD_ONLY if path.flying_forward_mandatory else 0,
+                                          len(self.records['segments']), len(path.segments),
+                                          len(self.records['mandatory']), len(path.mandatory_planes)))
+            self.records['segments'] += [segment.direction.code | segment.length << 2 for segment in path.segments]
+            self.records['mandatory'] += [int(i) for i in path.mandatory_planes]
+        for tile in level.tiles:
+            self.records['level_tiles'].append(self._tile_id(tile))
+
+    def add_solution(self, level_index: int, tiling: Tiling):
+        self.records['solutions'].append((level_index, len(self.records['placements']), len(tiling.tiles)))
+        for top_left_corner, tile in zip(tiling.top_left_corners, tiling.tiles):
+            self.records['placements'].append((self._tile_id(tile), tile.has_been_rotated_by,
+                                               top_left_corner[0], top_left_corner[1]))
+
+    def _tile_id(self, tile: Tile) -> int:
+        unrotated_content = tile.rotation(-tile.has_been_rotated_by).content
+        key = content_key(unrotated_content)
+        if key not in self.tile_ids:
+            self.tile_ids[key] = len(self.records['tiles'])
+            height, width = unrotated_content.shape
+            self.records['tiles'].append((height, width, len(self.records['components'])))
+            try:
+                self.records['components'] += [COMPONENT_CODES[component] for component in unrotated_content.flat]
+            except KeyError as error:
+                raise ArchiveFormatError(f"The component {error.args[0]} can not be stored.") from None
+        return self.tile_ids[key]
+
+    def to_bytes(self) -> bytes:
+        header = np.zeros((), dtype=HEADER)
+        header['magic'] = MAGIC
+        header['version'] = VERSION
+        parts = []
+        offset = _aligned(HEADER.itemsize)
+        for i, (name, dtype) in enumerate(SECTIONS.items()):
+            array = np.array(self.records[name], dtype=dtype)
+            header['sections'][i] = (offset, len(array))
+            data = array.tobytes()
+            parts.append(data + bytes(_aligned(len(data)) - len(data)))
+            offset += _aligned(len(data))
+        header_bytes = header.tobytes()
+        return header_bytes + bytes(_aligned(len(header_bytes)) - len(header_bytes)) + b"".join(parts)
+
+
+def _aligned(size: int) -> int:
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+class LevelArchive:
+    def __init__(self, buffer):
+        """
+        The levels and solutions in an archive. Only the header is read here, the records are read from the
+        buffer when a level or solution is asked for.
+        :param buffer: The bytes of the archive, or a memory map of them, see open
+        """
+        self.buffer = buffer
+        if len(buffer) < HEADER.itemsize:
+            raise ArchiveFormatError("The archive is too short.")
+        header = np.frombuffer(buffer, dtype=HEADER, count=1)[0]
+        if header['magic'] != MAGIC:
+            raise ArchiveFormatError("This is not a level archive.")
+        if header['version'] != VERSION:
+            raise ArchiveFormatError(f"Archive version {header['version']} is not supported, only {VERSION}.")
+        self.sections = {}
+        for (name, dtype), (offset, count) in zip(SECTIONS.items(), header['sections']):
+            if offset + count * dtype.itemsize > len(buffer):
+                raise ArchiveFormatError(f"The {name} section runs past the end of the archive.")
+            self.sections[name] = np.frombuffer(buffer, dtype=dtype, count=int(count), offset=int(offset))
+        self._tiles: dict[int, Tile] = {}
+
+    @classmethod
+    def open(cls, file_name: str) -> LevelArchive:
+        """
+        Memory map an archive file, which takes the same time for any number of levels.
+        """
+        return cls(np.memmap(file_name, dtype=np.uint8, mode='r'))
+
+    def __len__(self):
+        return len(self.sections['levels'])
+
+    def __getitem__(self, index: int) -> Level:
+        return self.level(index)
+
+    def __iter__(self) -> Iterator[Level]:
+        return (self.level(i) for i in range(len(self)))
+
+    def level(self, index: int) -> Level:
+        record = self.sections['levels'][index]
+        paths = []
+        for path in self.sections['paths'][record['first_path']:record['first_path'] + record['path_count']]:
+            segments = self.sections['segments'][path['first_segment']:path['first_segment'] + path['segment_count']]
+            mandatory = self.sections['mandatory'][path['first_mandatory']:
+                                                   path['first_mandatory'] + path['mandatory_count']]
+            paths.append(PathObjective(Point((int(path['row']), int(path['column']))),
+                                       [Segment(DIRECTIONS[code & 3], code >> 2) for code in segments.tolist()],
+                                       bool(path['flags'] & FORWARD_ONLY), tuple(mandatory.tolist())))
+        tile_ids = self.sections['level_tiles'][record['first_tile']:record['first_tile'] + record['tile_count']]
+        return Level(BoardObjective(paths, shape=(int(record['height']), int(record['width']))),
+                     [self._tile(tile_id) for tile_id in tile_ids.tolist()])
+
+    def number_of_solutions(self, level_index: int) -> int:
+        start, end = self._solution_range(level_index)
+        return end - start
+
+    def solutions(self, level_index: int) -> list[Tiling]:
+        """
+        The tilings stored with the level.
+        """
+        start, end = self._solution_range(level_index)
+        level_record = self.sections['levels'][level_index]
+        shape = (int(level_record['height']), int(level_record['width']))
+        tilings = []
+        for solution in self.sections['solutions'][start:end]:
+            first = solution['first_placement']
+            placements = self.sections['placements'][first:first + solution['placement_count']]
+            tilings.append(Tiling([(int(placement['row']), int(placement['column'])) for placement in placements],
+                                  [self._tile(int(placement['tile'])).rotation(int(placement['rotation']))
+                                   for placement in placements], shape=shape))
+        return tilings
+
+    def _solution_range(self, level_index: int) -> tuple[int, int]:
+        # The solutions are written in the order of their levels.
+        levels = self.sections['solutions']['level']
+        return (int(np.searchsorted(levels, level_index, side='left')),
+                int(np.searchsorted(levels, level_index, side='right')))
+
+    def _tile(self, tile_id: int) -> Tile:
+        if tile_id not in self._tiles:
+            record = self.sections['tiles'][tile_id]
+            first = int(record['first_component'])
+            codes = self.sections['components'][first:first + int(record['height']) * int(record['width'])]
+            self._tiles[tile_id] = Tile(np.array([COMPONENTS[code] for code in codes.tolist()], dtype=object)
+                                        .reshape(int(record['height']), int(record['width'])))
+        return self._tiles[tile_id]
+
+
+def loads(data: bytes) -> LevelArchive:
+    return LevelArchive(data)
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from defaultLevels import level7, level48
+from errorsAndExceptions import ArchiveFormatError
+from levelArchive import LevelArchive, dumps, loads, write_archive
+from tileComponents import UNCOVERED
+from cardinalDirections import SOUTH
+
+
+class TestLevelArchiveMethods(unittest.TestCase):
+    def test_levels_round_trip(self):
+        archive = loads(dumps([level7, level48]))
+        self.assertEqual(len(archive), 2)
+        for level, loaded in zip((level7, level48), archive):
+            self.assertEqual(loaded.objective, level.objective)
+            self.assertEqual(loaded.objective.shape, level.objective.shape)
+            self.assertEqual([path.mandatory_planes for path in loaded.objective.paths],
+                             [path.mandatory_planes for path in level.objective.paths])
+            self.assertEqual([path.flying_forward_mandatory for path in loaded.objective.paths],
+                             [path.flying_forward_mandatory for path in level.objective.paths])
+            self.assertEqual(loaded.tiles, level.tiles)
+
+    def test_loaded_components_are_singletons(self):
+        level = loads(dumps([level7]))[0]
+        self.assertIs(level.tiles[2].content[1, 1], UNCOVERED)
+        self.assertIs(level.objective.paths[0].directions[0], SOUTH)
+
+    def test_solutions_round_trip(self):
+        solutions = [list(level7.solutions()), [], list(level48.solutions())]
+        archive = loads(dumps([level7, level7, level48], solutions))
+        self.assertEqual([archive.number_of_solutions(i) for i in range(3)], [4, 0, 1])
+        for i, level in enumerate((level7, level7, level48)):
+            for tiling, stored in zip(archive.solutions(i), solutions[i]):
+                self.assertIsNone(level.raise_exception_if_tiling_invalid(tiling))
+                self.assertEqual(tiling.top_left_corners, stored.top_left_corners)
+                self.assertEqual([tile.has_been_rotated_by for tile in tiling.tiles],
+                                 [tile.has_been_rotated_by for tile in stored.tiles])
+
+    def test_memory_mapped_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "levels.atca")
+            write_archive(file_name, [level48] * 100, [list(level48.solutions())] * 100)
+            archive = LevelArchive.open(file_name)
+            self.assertEqual(len(archive), 100)
+            self.assertEqual(archive[99].count_solutions(), 1)
+            self.assertEqual(len(archive.solutions(50)), 1)
+            del archive
+
+    def test_invalid_archives(self):
+        data = dumps([level7])
+        with self.assertRaises(ArchiveFormatError):
+            loads(b"XXXX" + data[4:])
+        with self.assertRaises(ArchiveFormatError):
+            loads(data[:4] + b"\x02\x00" + data[6:])
+        with self.assertRaises(ArchiveFormatError):
+            loads(data[:len(data) // 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+"""
+Generate random levels that have exactly one solution.
+
+    python levelGenerator.py 1000 levels.jsonl.gz --processes 8 --seed 0
+
+Every level is built around a random arrangement of random tiles, so it has at least one solution. A path is drawn
+through every plane of the arrangement and the level is kept only if the search finds no second solution.
+The accepted levels are written one per line in the format of encode_level, gzipped if the file name ends in .gz.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import itertools
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Iterator
+
+import numpy as np
+
+from board import BoardObjective, PathObjective, Segment, Point
+from cardinalDirections import DIRECTIONS
+from defaultLevels import DEFAULT_TILES
+from errorsAndExceptions import TileLocationError
+from level import Level
+from tiling import Tile, Tiling, content_key, content_from_key
+
+BATCH_SIZE = 64
+
+
+def random_level(rng: np.random.Generator, shape: tuple[int, int] = (4, 4), number_of_tiles: int = 6,
+                 tiles: list[Tile] = DEFAULT_TILES, mandatory_probability: float = 0.5,
+                 forward_probability: float = 0.5) -> Level | None:
+    """
+    A random level that has at least one solution.
+    :param tiles: The tiles to draw the tiles of the level from, with replacement
+    :param mandatory_probability: Chance that the plane a path is drawn through is mandatory
+    :param forward_probability: Chance that a path only allows planes flying forward
+    :return: The level, or None if the drawn tiles did not fit on the board
+    """
+    level_tiles = [tiles[i] for i in rng.integers(len(tiles), size=number_of_tiles)]
+    tiling = _random_arrangement(rng, shape, level_tiles)
+    if tiling is None:
+        return None
+
+    paths = []
+    filling = tiling.filling
+    for location, plane in filling.enumerate_just_the_planes():
+        path = _random_path_through(rng, filling, location, plane.direction, mandatory_probability,
+                                    forward_probability)
+        paths.append(path)
+    return Level(BoardObjective(paths, shape=shape), level_tiles)
+
+
+def _random_arrangement(rng: np.random.Generator, shape: tuple[int, int], tiles: list[Tile],
+                        attempts_per_tile: int = 20) -> Tiling | None:
+    tiling = Tiling([], [], shape=shape)
+    for tile in tiles:
+        for _ in range(attempts_per_tile):
+            rotated_tile = tile.rotation(int(rng.integers(4)))
+            height, width = rotated_tile.content.shape
+            if height > shape[0] or width > shape[1]:
+                continue
+            top_left_corner = (int(rng.integers(shape[0] - height + 1)), int(rng.integers(shape[1] - width + 1)))
+            try:
+                tiling.add_tile(top_left_corner, rotated_tile)
+                break
+            except TileLocationError:
+                continue
+        else:
+            return None
+    return tiling
+
+
+def _random_path_through(rng: np.random.Generator, filling, location: Point, direction,
+                         mandatory_probability: float, forward_probability: float,
+                         attempts: int = 10) -> PathObjective:
+    """
+    A path that the arrangement satisfies, with the plane at location flying forward along a straight stretch.
+    It may turn once after that stretch. Falls back to a path of just the plane.
+    """
+    flying_forward_mandatory = bool(rng.random() < forward_probability)
+    for _ in range(attempts):
+        before = _random_length(rng, filling.shape, location, direction.opposite_direction())
+        after = _random_length(rng, filling.shape, location, direction)
+        step = np.array(direction.unit_step)
+        start = Point(tuple(int(c) for c in np.array(location.coordinates) - before * step))
+        segments = [Segment(direction, before + after + 1)]
+        turn = direction.rotate(int(rng.choice((1, 3))))
+        end = Point(tuple(int(c) for c in np.array(location.coordinates) + after * step))
+        turn_length = _random_length(rng, filling.shape, end, turn)
+        if after and turn_length and rng.random() < 0.5:
+            segments[0].length -= 1
+            segments.append(Segment(turn, turn_length + 1))
+        mandatory_planes = (before,) if rng.random() < mandatory_probability else ()
+        path = PathObjective(start, segments, flying_forward_mandatory, mandatory_planes)
+        if path.check_filling(filling.restrict_to_path(path), fast=True):
+            return path
+    mandatory_planes = (0,) if rng.random() < mandatory_probability else ()
+    return PathObjective(location, [Segment(direction, 1)], flying_forward_mandatory, mandatory_planes)
+
+
+def _random_length(rng: np.random.Generator, shape: tuple[int, int], location: Point, direction) -> int:
+    """
+    A random number of cells to go from the location in the direction without leaving the board.
+    """
+    di, dj = direction.unit_step
+    room = [shape[0] - 1 - location[0], shape[1] - 1 - location[1], location[0], location[1]]
+    maximum = room[0] if di > 0 else room[2] if di < 0 else room[1] if dj > 0 else room[3]
+    return int(rng.integers(maximum + 1))
+
+
+def has_unique_solution(level: Level, solver_class=None) -> bool:
+    """
+    Whether the level has exactly one solution. The search stops as soon as a second solution is found.
+    """
+    return sum(1 for _ in itertools.islice(level.solutions(solver_class), 2)) == 1
+
+
+def encode_level(level: Level) -> str:
+    """
+    A single line of compact JSON: the board shape, every path as its start, segments (direction code and
+    length), mandatory planes and forward flag, and the content key of every tile.
+    """
+    paths = [[list(path.locations[0].coordinates),
+              [[segment.direction.code, segment.length] for segment in path.segments],
+              [int(i) for i in path.mandatory_planes], int(path.flying_forward_mandatory)]
+             for path in level.objective.paths]
+    tiles = [[list(shape), list(names)] for shape, names in (content_key(tile.content) for tile in level.tiles)]
+    return json.dumps([list(level.objective.shape), paths, tiles], separators=(',', ':'))
+
+
+def decode_level(line: str) -> Level:
+    shape, paths, tiles = json.loads(line)
+    path_objectives = [PathObjective(Point(tuple(start)),
+                                     [Segment(DIRECTIONS[code], length) for code, length in segments],
+                                     bool(forward), tuple(mandatory_planes))
+                       for start, segments, mandatory_planes, forward in paths]
+    return Level(BoardObjective(path_objectives, shape=tuple(shape)), [Tile(content_from_key(key)) for key in tiles])
+
+
+def read_levels(file_name: str) -> Iterator[Level]:
+    """
+    Read the levels written by generate_levels one line at a time.
+    """
+    with _open(file_name, 'rt') as level_file:
+        for line in level_file:
+            if line.strip():
+                yield decode_level(line)
+
+
+def generate_levels(number: int, file_name: str, processes: int | None = None, seed: int = 0,
+                    **level_options) -> int:
+    """
+    Generate levels with exactly one solution on a pool of processes and stream them to a file.
+    Every batch of attempts has its own seed, so the file only depends on the seed and not on the number of
+    processes.
+    :param number: The number of levels to write
+    :param level_options: Passed on to random_level
+    :return: The number of attempts it took
+    """
+    processes = processes or cpu_count() or 1
+    written = 0
+    batches = 0
+    with _open(file_name, 'wt') as level_file, ProcessPoolExecutor(max_workers=processes) as executor:
+        batch_seeds = itertools.count(seed * 2 ** 32)
+        in_flight = [executor.submit(_generate_batch, next(batch_seeds), level_options) for _ in range(2 * processes)]
+        while written < number:
+            lines = in_flight.pop(0).result()
+            in_flight.append(executor.submit(_generate_batch, next(batch_seeds), level_options))
+            batches += 1
+            for line in lines[:number - written]:
+                level_file.write(line + '\n')
+                written += 1
+        for future in in_flight:
+            future.cancel()
+    return batches * BATCH_SIZE
+
+
+def _generate_batch(batch_seed: int, level_options: dict) -> list[str]:
+    rng = np.random.default_rng(batch_seed)
+    lines = []
+    for _ in range(BATCH_SIZE):
+        level = random_level(rng, **level_options)
+        if level is not None and has_unique_solution(level):
+            lines.append(encode_level(level))
+    return lines
+
+
+def _open(file_name: str, mode: str):
+    if file_name.endswith('.gz'):
+        return gzip.open(file_name, mode)
+    return open(file_name, mode)
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("number", type=int, help="Number of levels to generate")
+    parser.add_argument("output", help="File to write the levels to")
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", type=int, nargs=2, default=(4, 4), metavar=("HEIGHT", "WIDTH"))
+    parser.add_argument("--tiles", type=int, default=6, help="Number of tiles per level")
+    arguments = parser.parse_args(arguments)
+
+    attempts = generate_levels(arguments.number, arguments.output, arguments.processes, arguments.seed,
+                               shape=tuple(arguments.size), number_of_tiles=arguments.tiles)
+    print(f"Wrote {arguments.number} levels to {arguments.output} in {attempts} attempts", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from defaultLevels import level7, level48
+from levelGenerator import random_level, has_unique_solution, encode_level, decode_level, generate_levels, \
+    read_levels
+
+
+class TestLevelGeneratorMethods(unittest.TestCase):
+    def test_random_levels_are_solvable(self):
+        rng = np.random.default_rng(0)
+        levels = [level for level in (random_level(rng) for _ in range(50)) if level is not None]
+        self.assertTrue(levels)
+        for level in levels:
+            self.assertIsNotNone(level.solve())
+
+    def test_has_unique_solution(self):
+        self.assertFalse(has_unique_solution(level7))
+        self.assertTrue(has_unique_solution(level48))
+
+    def test_encode_decode(self):
+        for level in (level7, level48):
+            decoded = decode_level(encode_level(level))
+            self.assertEqual(decoded.objective, level.objective)
+            self.assertEqual(decoded.tiles, level.tiles)
+            self.assertEqual([path.mandatory_planes for path in decoded.objective.paths],
+                             [path.mandatory_planes for path in level.objective.paths])
+            self.assertEqual(decoded.count_solutions(), level.count_solutions())
+
+    def test_generate_levels(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "levels.jsonl.gz")
+            generate_levels(3, file_name, processes=1, seed=1)
+            levels = list(read_levels(file_name))
+        self.assertEqual(len(levels), 3)
+        for level in levels:
+            self.assertEqual(level.count_solutions(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,6 +34,26 @@ class TestLevelMethods(unittest.TestCase):
         with self.assertRaises(InvalidFillingError):
             level.raise_exception_if_tiling_invalid(wrong_tiles_tiling)
 
+    def test_validate_many(self):
+        level = level7
+        correct_tiling = Tiling([(0, 0), (0, 1), (0, 2), (2, 0), (2, 1), (2, 3)],
+                                [DEFAULT_TILE_1.rotation(2), DEFAULT_TILE_6, DEFAULT_TILE_4.rotation(1),
+                                 DEFAULT_TILE_5.rotation(1), DEFAULT_TILE_3.rotation(2), DEFAULT_TILE_2.rotation(1)], shape=(4,4))
+        wrong_tiling = Tiling([(0, 0), (0, 1), (0, 3), (2, 0), (2, 1), (2, 2)],
+                              [DEFAULT_TILE_5.rotation(1), DEFAULT_TILE_3.rotation(2), DEFAULT_TILE_2.rotation(1),
+                               DEFAULT_TILE_1.rotation(2), DEFAULT_TILE_6, DEFAULT_TILE_4.rotation(1)],
+                              shape=(4, 4))
+        wrong_tiles_tiling = Tiling([(0, 0)], [DEFAULT_TILE_1], shape=(4, 4))
+
+        results = level.validate_many([correct_tiling, wrong_tiling, wrong_tiles_tiling])
+        self.assertIsNone(results[0])
+        self.assertTrue(issubclass(results[1].error, InvalidFillingException))
+        self.assertIsNotNone(results[1].location)
+        self.assertEqual(results[2].code, "TileTypeError")
+        for tiling, result in zip([wrong_tiling, wrong_tiles_tiling], results[1:]):
+            with self.assertRaises(result.error):
+                level.raise_exception_if_tiling_invalid(tiling)
+
 
 if __name__ == '__main__':
     unittest.main()
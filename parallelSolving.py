@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from os import cpu_count
+
+from level import Level
+from solver import ExactCoverSolver
+from tiling import Tiling
+from transpositionTable import TranspositionTable
+
+
+@dataclass
+class LevelResult:
+    name: str
+    count: int = 0
+    solutions: list[Tiling] = field(default_factory=list)
+
+
+def solve_levels(levels: dict[str, Level], processes: int | None = None, solver_class=ExactCoverSolver,
+                 count_only: bool = False, table_entries: int = 0) -> dict[str, LevelResult]:
+    """
+    Solve a catalog of levels on a pool of processes. Every level is split into one task per candidate
+    placement of its first tile, so a single hard level also keeps every process busy.
+    The results do not depend on the number of processes: the solutions of a level are in the order of the
+    placements of its first tile, which is the order a serial search finds them in.
+    :param levels: The levels by name
+    :param processes: Number of worker processes, all cores by default
+    :param solver_class: The solver from solver.py that solves each part
+    :param count_only: Only count the solutions instead of sending them back to this process
+    :param table_entries: With PropagatingSolver, share a transposition table of this many entries per level
+        between the processes, so no process searches a dead end another one already found, see
+        transpositionTable.py
+    :return: The result of every level, by name, in the order of the given levels
+    """
+    results = {name: LevelResult(name) for name in levels}
+    with ExitStack() as tables, ProcessPoolExecutor(max_workers=processes) as executor:
+        tasks = []
+        for name, level in levels.items():
+            table = tables.enter_context(TranspositionTable(table_entries)) if table_entries else None
+            for first_placement in range(solver_class(level).number_of_first_placements()):
+                tasks.append((name, level, solver_class, first_placement, count_only, table))
+
+        for name, count, solutions in executor.map(_solve_part, tasks, chunksize=_chunk_size(len(tasks), processes)):
+            results[name].count += count
+            results[name].solutions += solutions
+    return results
+
+
+def _solve_part(task) -> tuple[str, int, list[Tiling]]:
+    name, level, solver_class, first_placement, count_only, table = task
+    if table is None:
+        solver = solver_class(level, first_placement)
+    else:
+        solver = solver_class(level, first_placement, table=table)
+    if count_only:
+        return name, solver.count(), []
+    solutions = list(solver.solutions())
+    return name, len(solutions), solutions
+
+
+def _chunk_size(number_of_tasks: int, processes: int | None) -> int:
+    # A few chunks per process keeps the overhead of sending tasks low while still balancing the load.
+    return max(1, number_of_tasks // (4 * (processes or cpu_count() or 1)))
@@ -0,0 +1,39 @@
+import pickle
+import unittest
+
+from defaultLevels import level7, level48
+from parallelSolving import solve_levels
+from solver import BacktrackingSolver
+from cardinalDirections import SOUTH
+from tileComponents import COVERED
+
+
+class TestParallelSolving(unittest.TestCase):
+    def test_level_pickles_to_singletons(self):
+        level = pickle.loads(pickle.dumps(level48))
+        self.assertIs(level.objective.paths[0].directions[0], SOUTH)
+        self.assertIs(level.tiles[0].content[0, 0], COVERED)
+        self.assertEqual(level.tiles, level48.tiles)
+
+    def test_same_results_as_serial(self):
+        results = solve_levels({"level7": level7, "level48": level48}, processes=2)
+        self.assertEqual(list(results), ["level7", "level48"])
+        self.assertEqual(results["level7"].count, level7.count_solutions())
+        self.assertEqual(results["level48"].count, 1)
+        for tiling in results["level7"].solutions:
+            self.assertIsNone(level7.raise_exception_if_tiling_invalid(tiling))
+
+    def test_deterministic_order(self):
+        serial = [tiling.top_left_corners for tiling in BacktrackingSolver(level7).solutions()]
+        for processes in (1, 3):
+            results = solve_levels({"level7": level7}, processes=processes, solver_class=BacktrackingSolver)
+            self.assertEqual([tiling.top_left_corners for tiling in results["level7"].solutions], serial)
+
+    def test_count_only(self):
+        results = solve_levels({"level7": level7}, processes=2, count_only=True)
+        self.assertEqual(results["level7"].count, 4)
+        self.assertEqual(results["level7"].solutions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
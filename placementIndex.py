@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from board import BoardObjective, PathObjective, Point
+from tileComponents import TileComponent, Plane, UNCOVERED
+from tiling import Tile
+
+
+class Placement:
+    def __init__(self, tile: Tile, top_left_corner: tuple[int, int]):
+        """
+        A tile in a fixed orientation at a fixed top left corner, together with the board cells it covers.
+        """
+        self.tile = tile
+        self.top_left_corner = top_left_corner
+        self.cells: list[tuple[Point, TileComponent]] = []
+        for relative_location, component in tile.enumerate_components():
+            if component is UNCOVERED:
+                continue
+            location = Point((top_left_corner[0] + relative_location[0], top_left_corner[1] + relative_location[1]))
+            self.cells.append((location, component))
+        self.path_cells: list[tuple[int, int, Plane]] = []
+        # Set by PlacementIndex: the number of the placement, the cells it covers as bits i * width + j and the
+        # placements that cover one of those cells as bits of their numbers, including this placement.
+        self.number = -1
+        self.mask = 0
+        self.conflicts = 0
+
+    def __repr__(self):
+        return f"Placement({self.tile.has_been_rotated_by}, {self.top_left_corner})"
+
+
+class PlacementIndex:
+    def __init__(self, level):
+        """
+        Every placement of every rotation of the tiles of a level that is allowed on an empty board, by tile and by
+        covered cell. A placement is left out if it puts a plane outside the allowed plane locations, on a corner
+        of a path or flying out of a path, or covers a cell that needs a plane with something else.
+        Build it once per level, see Level.placement_index.
+        """
+        self.objective: BoardObjective = level.objective
+        self.shape = self.objective.shape
+        self.corners = {corner for path in self.objective.paths for corner in path.corners}
+        self.mandatory_locations = {path.locations[i] for path in self.objective.paths
+                                    for i in path.mandatory_planes}
+        self._cell_index = self.objective.cell_index
+
+        self.placements: list[Placement] = []
+        self._by_tile: dict[Tile, list[Placement]] = {}
+        for tile in level.tiles:
+            if tile not in self._by_tile:
+                self._by_tile[tile] = self._allowed_placements(tile)
+
+        self._by_cell: list[list[Placement]] = [[] for _ in range(self.shape[0] * self.shape[1])]
+        self.cell_masks = [0] * len(self._by_cell)
+        for placement in self.placements:
+            for location, _ in placement.cells:
+                cell = self.cell_number(location)
+                self._by_cell[cell].append(placement)
+                self.cell_masks[cell] |= 1 << placement.number
+                placement.mask |= 1 << cell
+        for placement in self.placements:
+            for location, _ in placement.cells:
+                placement.conflicts |= self.cell_masks[self.cell_number(location)]
+
+    def cell_number(self, location: Point) -> int:
+        return location[0] * self.shape[1] + location[1]
+
+    def candidates(self, tile: Tile) -> list[Placement]:
+        """
+        The allowed placements of a tile of the level, for every distinct rotation in turn.
+        """
+        return self._by_tile[tile]
+
+    def tile_mask(self, tile: Tile) -> int:
+        return sum(1 << placement.number for placement in self._by_tile[tile])
+
+    def covering(self, location: Point) -> list[Placement]:
+        """
+        The allowed placements of any tile that cover the location.
+        """
+        return self._by_cell[self.cell_number(location)]
+
+    def cell_mask(self, location: Point) -> int:
+        """
+        The numbers of the placements that cover the location, as bits.
+        """
+        return self.cell_masks[self.cell_number(location)]
+
+    def mask_of(self, locations: Iterable[Point]) -> int:
+        """
+        The locations as bits i * width + j, as in Placement.mask.
+        """
+        mask = 0
+        for location in locations:
+            mask |= 1 << self.cell_number(location)
+        return mask
+
+    def most_constrained_cell(self, locations: Iterable[Point], available: int) -> tuple[Point | None, int]:
+        """
+        :param available: The numbers of the placements that are still possible, as bits
+        :return: The location covered by the fewest available placements, and their number
+        """
+        best, fewest = None, None
+        for location in locations:
+            count = (self.cell_masks[self.cell_number(location)] & available).bit_count()
+            if fewest is None or count < fewest:
+                best, fewest = location, count
+                if count == 0:
+                    break
+        return best, fewest or 0
+
+    def _allowed_placements(self, tile: Tile) -> list[Placement]:
+        placements = []
+        for rotated_tile in tile.distinct_rotations():
+            height, width = rotated_tile.content.shape
+            for i in range(self.shape[0] - height + 1):
+                for j in range(self.shape[1] - width + 1):
+                    placement = Placement(rotated_tile, (i, j))
+                    if self._allowed_on_empty_board(placement):
+                        placement.path_cells = [(path_index, index, component)
+                                                for location, component in placement.cells
+                                                if isinstance(component, Plane)
+                                                for path_index, index in self._cell_index.paths_through(location)]
+                        placement.number = len(self.placements)
+                        self.placements.append(placement)
+                        placements.append(placement)
+        return placements
+
+    def _allowed_on_empty_board(self, placement: Placement) -> bool:
+        for location, component in placement.cells:
+            if isinstance(component, Plane):
+                if not self._cell_index.is_on_path[location.coordinates] or location in self.corners:
+                    return False
+                for path_index, i in self._cell_index.paths_through(location):
+                    if self._direction_class(path_index, i, component) == PathObjective.OUT:
+                        return False
+            elif location in self.mandatory_locations:
+                return False
+        return True
+
+    def _direction_class(self, path_index: int, i: int, plane: Plane) -> str:
+        path = self.objective.paths[path_index]
+        direction_class = path._forward_backward_or_out(i, plane.direction)
+        if path.flying_forward_mandatory and direction_class != PathObjective.FORWARD:
+            return PathObjective.OUT
+        return direction_class
@@ -0,0 +1,60 @@
+import unittest
+
+from board import Point
+from defaultLevels import level7, level48
+from placementIndex import PlacementIndex
+from tileComponents import Plane
+
+
+class TestPlacementIndexMethods(unittest.TestCase):
+    def test_built_once_per_level(self):
+        self.assertIs(level7.placement_index, level7.placement_index)
+
+    def test_candidates_of_every_tile(self):
+        index = PlacementIndex(level48)
+        for tile in level48.tiles:
+            candidates = index.candidates(tile)
+            self.assertTrue(candidates)
+            for placement in candidates:
+                self.assertIs(index.placements[placement.number], placement)
+                self.assertEqual(placement.tile, tile.rotation(placement.tile.has_been_rotated_by))
+
+    def test_no_plane_outside_the_paths_or_on_a_corner(self):
+        index = PlacementIndex(level48)
+        for placement in index.placements:
+            for location, component in placement.cells:
+                if isinstance(component, Plane):
+                    self.assertIn(location, level48.objective.allowed_plane_locations)
+                    self.assertNotIn(location, index.corners)
+
+    def test_cells_and_masks_agree(self):
+        index = PlacementIndex(level7)
+        height, width = level7.objective.shape
+        for i in range(height):
+            for j in range(width):
+                location = Point((i, j))
+                covering = index.covering(location)
+                self.assertEqual(index.cell_mask(location), sum(1 << placement.number for placement in covering))
+                for placement in covering:
+                    self.assertIn(location, [cell for cell, _ in placement.cells])
+                    self.assertTrue(placement.mask & 1 << (i * width + j))
+        for placement in index.placements:
+            self.assertEqual(placement.mask, index.mask_of(location for location, _ in placement.cells))
+            self.assertTrue(placement.conflicts & 1 << placement.number)
+
+    def test_most_constrained_cell(self):
+        index = PlacementIndex(level7)
+        locations = [Point((i, j)) for i in range(4) for j in range(4)]
+        all_placements = (1 << len(index.placements)) - 1
+        location, count = index.most_constrained_cell(locations, all_placements)
+        self.assertEqual(count, min(len(index.covering(other)) for other in locations))
+        self.assertEqual(count, len(index.covering(location)))
+
+        first = index.placements[0]
+        location, count = index.most_constrained_cell([location for location, _ in first.cells],
+                                                      all_placements & ~first.conflicts)
+        self.assertEqual(count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
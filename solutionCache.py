@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+
+import numpy as np
+
+from boardTransforms import BoardTransform, D4
+from level import Level
+from tiling import Tile, Tiling, content_key, content_from_key
+from errorsAndExceptions import InvalidFillingError, InvalidFillingException
+
+
+def level_fingerprint(level: Level) -> tuple[str, BoardTransform]:
+    """
+    A hash of everything that decides the solutions of a level: the paths with their mandatory planes and
+    flying_forward_mandatory, and the multiset of tiles. Levels that are rotations or reflections of each other
+    (with their tiles transformed along) get the same fingerprint. The hash only depends on names and
+    coordinates, so it is the same in every process.
+    :return: The fingerprint and the transform that turns the level into the canonical form it describes
+    """
+    description, transform = min(((_describe(transform, level), transform) for transform in D4),
+                                 key=lambda described: described[0])
+    return hashlib.sha256(description.encode()).hexdigest(), transform
+
+
+def _describe(transform: BoardTransform, level: Level) -> str:
+    objective = level.objective
+    paths = []
+    for path in objective.paths:
+        first_index = {}
+        for i, location in enumerate(path.locations):
+            first_index.setdefault(location, i)
+        paths.append([[list(transform.location(location, objective.shape)) for location in path.locations],
+                      [transform.direction(direction).direction for direction in path.directions],
+                      [first_index[corner] for corner in path.corners],
+                      [int(i) for i in path.mandatory_planes],
+                      bool(path.flying_forward_mandatory)])
+    tiles = [min(_json_key(rotated_tile.content)
+                 for rotated_tile in Tile(transform.tile_content(tile.content)).distinct_rotations())
+             for tile in level.tiles]
+    description = [list(transform.shape(objective.shape)), sorted(paths), sorted(tiles)]
+    return json.dumps(description, separators=(',', ':'))
+
+
+def _json_key(content: np.ndarray) -> list:
+    shape, names = content_key(content)
+    return [list(shape), list(names)]
+
+
+class SolutionCache:
+    def __init__(self, path: str, max_bytes: int = 64 * 2 ** 20, max_entries: int | None = None):
+        """
+        A persistent cache of the solutions of levels, stored in an SQLite database and keyed by
+        level_fingerprint. The solutions are stored in the canonical orientation of the level, so a rotated or
+        reflected level reuses them. When the cache grows past max_bytes of stored solutions or max_entries
+        levels, the least recently used levels are evicted.
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._connection = sqlite3.connect(path, timeout=30)
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS solutions (fingerprint TEXT PRIMARY KEY, "
+                                     "solutions TEXT NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS solutions_by_last_use ON solutions (last_used)")
+
+    def get(self, level: Level) -> list[Tiling] | None:
+        """
+        :return: The cached solutions of the level, or None if the level is not in the cache
+        """
+        fingerprint, transform = level_fingerprint(level)
+        with self._connection:
+            row = self._connection.execute("SELECT solutions FROM solutions WHERE fingerprint = ?",
+                                           (fingerprint,)).fetchone()
+            if row is None:
+                return None
+            self._touch(fingerprint)
+
+        try:
+            return [self._tiling_from_canonical(level, transform, placements) for placements in json.loads(row[0])]
+        except (InvalidFillingError, InvalidFillingException, KeyError):
+            # Stored by an incompatible version, or a fingerprint collision. Solve again instead.
+            self.discard(level)
+            return None
+
+    def put(self, level: Level, solutions: list[Tiling]):
+        fingerprint, transform = level_fingerprint(level)
+        canonical_solutions = [self._canonical_placements(transform, tiling) for tiling in solutions]
+        serialized = json.dumps(canonical_solutions, separators=(',', ':'))
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, "
+                "(SELECT COALESCE(MAX(last_used), 0) + 1 FROM solutions))",
+                (fingerprint, serialized, len(serialized)))
+            self._evict()
+
+    def solutions(self, level: Level, solver_class=None) -> list[Tiling]:
+        """
+        The solutions of the level, from the cache or else solved and stored.
+        """
+        solutions = self.get(level)
+        if solutions is None:
+            solutions = list(level.solutions(solver_class))
+            self.put(level, solutions)
+        return solutions
+
+    def discard(self, level: Level):
+        with self._connection:
+            self._connection.execute("DELETE FROM solutions WHERE fingerprint = ?", (level_fingerprint(level)[0],))
+
+    def clear(self):
+        with self._connection:
+            self._connection.execute("DELETE FROM solutions")
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def __contains__(self, level: Level):
+        fingerprint = level_fingerprint(level)[0]
+        return self._connection.execute("SELECT 1 FROM solutions WHERE fingerprint = ?",
+                                        (fingerprint,)).fetchone() is not None
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception_info):
+        self.close()
+
+    def _touch(self, fingerprint: str):
+        self._connection.execute("UPDATE solutions SET last_used = (SELECT MAX(last_used) + 1 FROM solutions) "
+                                 "WHERE fingerprint = ?", (fingerprint,))
+
+    def _evict(self):
+        total_bytes = 0
+        rows = self._connection.execute("SELECT fingerprint, size FROM solutions ORDER BY last_used DESC")
+        evicted = []
+        for number, (fingerprint, size) in enumerate(rows):
+            total_bytes += size
+            too_many = self.max_entries is not None and number >= self.max_entries
+            # The most recently used level is kept even when it is larger than max_bytes on its own.
+            if number > 0 and (total_bytes > self.max_bytes or too_many):
+                evicted.append((fingerprint,))
+        self._connection.executemany("DELETE FROM solutions WHERE fingerprint = ?", evicted)
+
+    @staticmethod
+    def _canonical_placements(transform: BoardTransform, tiling: Tiling) -> list:
+        placements = []
+        for top_left_corner, tile in zip(tiling.top_left_corners, tiling.tiles):
+            new_top_left_corner, content = transform.placement(top_left_corner, tile.content, tiling.shape)
+            placements.append([_json_key(content), list(new_top_left_corner)])
+        return placements
+
+    @staticmethod
+    def _tiling_from_canonical(level: Level, transform: BoardTransform, placements: list) -> Tiling:
+        inverse = transform.inverse()
+        canonical_shape = transform.shape(level.objective.shape)
+        oriented_tiles = {content_key(rotated_tile.content): rotated_tile
+                          for tile in level.tiles for rotated_tile in tile.distinct_rotations()}
+        top_left_corners, tiles = [], []
+        for key, top_left_corner in placements:
+            new_top_left_corner, content = inverse.placement(tuple(top_left_corner), content_from_key(key),
+                                                             canonical_shape)
+            top_left_corners.append(new_top_left_corner)
+            tiles.append(oriented_tiles[content_key(content)])
+        tiling = Tiling(top_left_corners, tiles, shape=level.objective.shape)
+        level.raise_exception_if_tiling_invalid(tiling)
+        return tiling
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from defaultLevels import level7, level48, DEFAULT_TILES, DEFAULT_TILE_1
+from board import BoardObjective, PathObjective, Segment, Point
+from boardTransforms import D4
+from cardinalDirections import SOUTH
+from level import Level
+from solutionCache import SolutionCache, level_fingerprint
+
+
+class TestLevelFingerprint(unittest.TestCase):
+    def test_invariant_under_rotation_and_reflection(self):
+        for level in (level7, level48):
+            fingerprints = {transform.level(level).fingerprint() for transform in D4}
+            self.assertEqual(fingerprints, {level.fingerprint()})
+
+    def test_different_levels(self):
+        self.assertNotEqual(level7.fingerprint(), level48.fingerprint())
+
+    def test_depends_on_mandatory_planes_and_direction(self):
+        def level(flying_forward_mandatory, mandatory_planes):
+            return Level(BoardObjective([PathObjective(Point((0, 0)), [Segment(SOUTH, 3)],
+                                                       flying_forward_mandatory, mandatory_planes)],
+                                        shape=(4, 4)), DEFAULT_TILES)
+        fingerprints = {level(False, ()).fingerprint(), level(True, ()).fingerprint(),
+                        level(False, (1,)).fingerprint()}
+        self.assertEqual(len(fingerprints), 3)
+
+    def test_depends_on_tiles(self):
+        fewer_tiles = Level(level7.objective, DEFAULT_TILES[1:])
+        more_tiles = Level(level7.objective, DEFAULT_TILES + [DEFAULT_TILE_1])
+        self.assertEqual(len({level7.fingerprint(), fewer_tiles.fingerprint(), more_tiles.fingerprint()}), 3)
+
+    def test_independent_of_tile_order_and_rotation(self):
+        tiles = [tile.rotation(1) for tile in reversed(DEFAULT_TILES)]
+        self.assertEqual(Level(level7.objective, tiles).fingerprint(), level7.fingerprint())
+
+    def test_same_in_other_process(self):
+        environment = dict(os.environ, PYTHONHASHSEED="12345")
+        output = subprocess.run([sys.executable, "-c", "from defaultLevels import level48; print(level48.fingerprint())"],
+                                capture_output=True, text=True, env=environment,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+        self.assertEqual(output.strip(), level48.fingerprint())
+
+
+class TestSolutionCacheMethods(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "solutions.sqlite")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_miss(self):
+        with SolutionCache(self.path) as cache:
+            self.assertIsNone(cache.get(level7))
+
+    def test_solutions_persist(self):
+        with SolutionCache(self.path) as cache:
+            solutions = cache.solutions(level7)
+        with SolutionCache(self.path) as cache:
+            cached = cache.get(level7)
+        self.assertEqual(len(cached), len(solutions))
+        for tiling in cached:
+            self.assertIsNone(level7.raise_exception_if_tiling_invalid(tiling))
+
+    def test_transformed_level_hits(self):
+        with SolutionCache(self.path) as cache:
+            cache.put(level48, list(level48.solutions()))
+            for transform in D4:
+                transformed_level = transform.level(level48)
+                cached = cache.get(transformed_level)
+                self.assertEqual(len(cached), 1)
+                self.assertIsNone(transformed_level.raise_exception_if_tiling_invalid(cached[0]))
+
+    def test_unsolvable_level_is_cached(self):
+        level = Level(BoardObjective([], shape=(1, 1)), [DEFAULT_TILE_1])
+        with SolutionCache(self.path) as cache:
+            self.assertEqual(cache.solutions(level), [])
+            self.assertEqual(cache.get(level), [])
+
+    def test_least_recently_used_evicted(self):
+        with SolutionCache(self.path, max_entries=2) as cache:
+            cache.put(level7, [])
+            cache.put(level48, [])
+            cache.get(level7)
+            cache.put(Level(BoardObjective([], shape=(1, 1)), [DEFAULT_TILE_1]), [])
+            self.assertEqual(len(cache), 2)
+            self.assertIn(level7, cache)
+            self.assertNotIn(level48, cache)
+
+    def test_evicted_by_size(self):
+        with SolutionCache(self.path, max_bytes=1) as cache:
+            cache.solutions(level7)
+            cache.solutions(level48)
+            self.assertEqual(len(cache), 1)
+            self.assertIn(level48, cache)
+
+    def test_fingerprint_transform(self):
+        fingerprint, transform = level_fingerprint(level48)
+        self.assertEqual(transform.level(level48).fingerprint(), fingerprint)
+
+
+if __name__ == '__main__':
+    unittest.main()
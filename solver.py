@@ -0,0 +1,607 @@
+from __future__ import annotations
+
+from typing import Iterator, NamedTuple
+
+from board import BoardObjective, PathObjective, Point
+from tiling import Tile, Tiling, content_key
+from dancingLinks import DancingLinks
+from placementIndex import Placement, PlacementIndex
+from boardTransforms import BoardTransform, IDENTITY, level_symmetries
+from transpositionTable import TranspositionTable, zobrist_key
+
+
+class LevelSearch:
+    def __init__(self, level, first_placement: int | None = None, reduce_symmetry: bool = False):
+        """
+        The parts shared by the solvers: the candidate placements of every tile that are allowed on an empty
+        board, and the bookkeeping of the direction in which the planes fly along each path.
+        :param first_placement: Only search the solutions in which the first tile is placed at this candidate,
+            see number_of_first_placements. This splits a search into independent parts.
+        :param reduce_symmetry: Search one solution of every class of solutions that the symmetries of the level
+            map onto each other, see canonical_solutions. solutions still generates all of them.
+        """
+        self.level = level
+        self.first_placement = first_placement
+        self.objective: BoardObjective = level.objective
+        self.shape = self.objective.shape
+        self.placement_index: PlacementIndex = level.placement_index
+        self._mandatory_locations = self.placement_index.mandatory_locations
+
+        self.symmetries: list[BoardTransform] = level_symmetries(level) if reduce_symmetry else [IDENTITY]
+        self.tiles = self._group_identical_tiles(level.tiles)
+        if len(self.symmetries) > 1:
+            self.tiles = self._unique_tile_first(self.tiles)
+        self._is_repeat = [i > 0 and self.tiles[i] == self.tiles[i - 1] for i in range(len(self.tiles))]
+        self._candidates = [self.placement_index.candidates(tile) for tile in self.tiles]
+
+        # Stabilizers of the candidates of the first tile, when only one placement per orbit is searched.
+        self._stabilizers: dict[tuple, list[BoardTransform]] | None = None
+        if len(self.symmetries) > 1 and self.tiles and not (len(self.tiles) > 1 and self._is_repeat[1]):
+            self._candidates[0] = self._orbit_representatives(self._candidates[0])
+
+    @staticmethod
+    def _group_identical_tiles(tiles: list[Tile]) -> list[Tile]:
+        grouped = []
+        for tile in tiles:
+            for i in range(len(grouped) - 1, -1, -1):
+                if grouped[i] == tile:
+                    grouped.insert(i + 1, tile)
+                    break
+            else:
+                grouped.append(tile)
+        return grouped
+
+    @staticmethod
+    def _unique_tile_first(tiles: list[Tile]) -> list[Tile]:
+        for i, tile in enumerate(tiles):
+            if tiles.count(tile) == 1:
+                return [tile] + tiles[:i] + tiles[i + 1:]
+        return tiles
+
+    def _orbit_representatives(self, candidates: list[Placement]) -> list[Placement]:
+        """
+        Keep one placement of every orbit of the symmetries, and remember which symmetries fix it.
+        """
+        index = {_placement_key(placement.top_left_corner, placement.tile.content): i
+                 for i, placement in enumerate(candidates)}
+        seen = set()
+        representatives = []
+        self._stabilizers = {}
+        for i, placement in enumerate(candidates):
+            if i in seen:
+                continue
+            images = [index[_placement_key(*transform.placement(placement.top_left_corner, placement.tile.content,
+                                                                self.shape))] for transform in self.symmetries]
+            seen.update(images)
+            representatives.append(placement)
+            self._stabilizers[_placement_key(placement.top_left_corner, placement.tile.content)] = \
+                [transform for transform, image in zip(self.symmetries, images) if image == i]
+        return representatives
+
+    def number_of_first_placements(self) -> int:
+        return len(self._candidates[0]) if self.tiles else 0
+
+    def _first_tile_candidates(self) -> range:
+        if self.first_placement is None:
+            return range(self.number_of_first_placements())
+        return range(self.first_placement, self.first_placement + 1)
+
+    def solutions(self) -> Iterator[Tiling]:
+        """
+        Generate every valid tiling of the level.
+        """
+        if len(self.symmetries) == 1:
+            yield from self._solutions()
+            return
+        for tiling in self.canonical_solutions():
+            yield from self.expand(tiling)
+
+    def canonical_solutions(self) -> Iterator[Tiling]:
+        """
+        Generate one valid tiling of every class of tilings that the symmetries of the level map onto each other.
+        Without reduce_symmetry these are all the valid tilings.
+        """
+        for tiling in self._solutions():
+            if self._is_canonical(tiling):
+                yield tiling
+
+    def expand(self, tiling: Tiling) -> list[Tiling]:
+        """
+        The distinct images of a valid tiling under the symmetries of the level, starting with the tiling itself.
+        """
+        oriented_tiles = {content_key(rotated_tile.content): rotated_tile
+                          for tile in self.tiles for rotated_tile in tile.distinct_rotations()}
+        images = {}
+        for transform in self.symmetries:
+            placements = self._transformed_placements(transform, tiling)
+            key = tuple(sorted(_placement_key(*placement) for placement in placements))
+            if key not in images:
+                images[key] = Tiling([top_left_corner for top_left_corner, _ in placements],
+                                     [oriented_tiles[content_key(content)] for _, content in placements],
+                                     shape=self.shape)
+        return list(images.values())
+
+    def _solutions(self) -> Iterator[Tiling]:
+        """
+        Generate the valid tilings that the search finds, the solvers implement this.
+        """
+        raise NotImplementedError
+
+    def _is_canonical(self, tiling: Tiling) -> bool:
+        # The first tile is at an orbit representative, so two tilings of one class can only both be found if a
+        # symmetry fixing that placement maps one onto the other. Of those, the one with the smallest key is kept.
+        if len(self.symmetries) == 1:
+            return True
+        if self._stabilizers is None:
+            symmetries = self.symmetries
+        else:
+            first = tiling.tiles.index(self.tiles[0])
+            symmetries = self._stabilizers[_placement_key(tiling.top_left_corners[first], tiling.tiles[first].content)]
+        key = _tiling_key(self._transformed_placements(IDENTITY, tiling))
+        return all(key <= _tiling_key(self._transformed_placements(transform, tiling)) for transform in symmetries)
+
+    def _transformed_placements(self, transform: BoardTransform, tiling: Tiling) -> list[tuple[tuple, object]]:
+        return [transform.placement(top_left_corner, tile.content, self.shape)
+                for top_left_corner, tile in zip(tiling.top_left_corners, tiling.tiles)]
+
+    def solve(self) -> Tiling | None:
+        """
+        :return: The first valid tiling found, or None if the level can not be solved.
+        """
+        return next(self.solutions(), None)
+
+    def count(self) -> int:
+        return sum(1 for _ in self.solutions())
+
+    def _reset_directions(self):
+        self._path_states = [path.new_state() for path in self.objective.paths]
+
+    def _directions_allow(self, placement: Placement) -> bool:
+        allowed = self._record_directions(placement)
+        self._forget_directions(placement)
+        return allowed
+
+    def _record_directions(self, placement: Placement) -> bool:
+        """
+        Put the planes of the placement on the paths.
+        :return: Whether no path breaks a rule afterwards
+        """
+        allowed = True
+        for path_index, i, plane in placement.path_cells:
+            if self._path_states[path_index].set_cell(i, plane) is not None:
+                allowed = False
+        return allowed
+
+    def _forget_directions(self, placement: Placement):
+        for path_index, i, _ in placement.path_cells:
+            self._path_states[path_index].set_cell(i, None)
+
+    def _tiling_if_valid(self, placements: list[Placement]) -> Tiling | None:
+        tiling = Tiling([placement.top_left_corner for placement in placements],
+                        [placement.tile for placement in placements], shape=self.shape)
+        if self.objective.bitboard_violation(tiling.bitboard) is not None:
+            return None
+        return tiling
+
+
+def _placement_key(top_left_corner, content) -> tuple:
+    return content_key(content), tuple(int(i) for i in top_left_corner)
+
+
+def _tiling_key(placements: list[tuple[tuple, object]]) -> tuple:
+    return tuple(sorted(_placement_key(*placement) for placement in placements))
+
+
+class BacktrackingSolver(LevelSearch):
+    def __init__(self, level, first_placement: int | None = None, reduce_symmetry: bool = False):
+        """
+        Places the tiles of a level one at a time and backtracks as soon as a partial placement
+        violates the board objective.
+        """
+        super().__init__(level, first_placement, reduce_symmetry)
+        self._remaining_cells = [sum(len(self._candidates[j][0].cells) if self._candidates[j] else 0
+                                     for j in range(i, len(self.tiles))) for i in range(len(self.tiles) + 1)]
+        self._mandatory_mask = self.placement_index.mask_of(self._mandatory_locations)
+
+    def _solutions(self) -> Iterator[Tiling]:
+        # The occupied cells as bits, see Placement.mask.
+        self._occupied = 0
+        self._chosen: list[Placement] = []
+        self._reset_directions()
+        yield from self._search(0, 0)
+
+    def _search(self, tile_index: int, first_candidate: int) -> Iterator[Tiling]:
+        if tile_index == len(self.tiles):
+            if self._mandatory_mask & ~self._occupied:
+                return
+            tiling = self._tiling_if_valid(self._chosen)
+            if tiling is not None:
+                yield tiling
+            return
+
+        if self._some_mandatory_plane_unreachable(tile_index):
+            return
+
+        candidates = self._candidates[tile_index]
+        candidate_indices = self._first_tile_candidates() if tile_index == 0 else range(first_candidate, len(candidates))
+        for candidate_index in candidate_indices:
+            placement = candidates[candidate_index]
+            if not self._fits(placement):
+                continue
+            self._place(placement)
+            next_tile_index = tile_index + 1
+            repeat = next_tile_index < len(self.tiles) and self._is_repeat[next_tile_index]
+            yield from self._search(next_tile_index, candidate_index + 1 if repeat else 0)
+            self._remove(placement)
+
+    def _some_mandatory_plane_unreachable(self, tile_index: int) -> bool:
+        missing = (self._mandatory_mask & ~self._occupied).bit_count()
+        return missing > self._remaining_cells[tile_index]
+
+    def _fits(self, placement: Placement) -> bool:
+        if placement.mask & self._occupied:
+            return False
+        return self._directions_allow(placement)
+
+    def _place(self, placement: Placement):
+        self._occupied |= placement.mask
+        self._record_directions(placement)
+        self._chosen.append(placement)
+
+    def _remove(self, placement: Placement):
+        self._chosen.pop()
+        self._occupied &= ~placement.mask
+        self._forget_directions(placement)
+
+
+class ExactCoverSolver(LevelSearch):
+    def __init__(self, level, first_placement: int | None = None, reduce_symmetry: bool = False):
+        """
+        Solves a level as an exact cover problem with dancing links. The rows are the candidate placements of
+        each tile, the columns are the tiles and the cells of the board. Every tile has to be used once and
+        every cell can be covered at most once; the cells with a mandatory plane, or all cells when the tiles
+        exactly fill the board, have to be covered. The direction rules of the paths filter the rows during
+        the search.
+        """
+        super().__init__(level, first_placement, reduce_symmetry)
+        cells = [Point((i, j)) for i in range(self.shape[0]) for j in range(self.shape[1])]
+        tiles_fill_board = sum(len(candidates[0].cells) if candidates else 0
+                               for candidates in self._candidates) == len(cells)
+        primary_cells = [cell for cell in cells if tiles_fill_board or cell in self._mandatory_locations]
+        secondary_cells = [cell for cell in cells if not tiles_fill_board and cell not in self._mandatory_locations]
+        cell_columns = {cell: len(self.tiles) + i for i, cell in enumerate(primary_cells + secondary_cells)}
+
+        self._rows: list[tuple[int, int]] = []
+        rows = []
+        for tile_index, candidates in enumerate(self._candidates):
+            candidate_indices = self._first_tile_candidates() if tile_index == 0 else range(len(candidates))
+            for candidate_index in candidate_indices:
+                self._rows.append((tile_index, candidate_index))
+                rows.append([tile_index] + [cell_columns[location] for location, _ in candidates[candidate_index].cells])
+        self._dancing_links = DancingLinks(len(self.tiles) + len(primary_cells), len(secondary_cells), rows)
+
+    def _solutions(self) -> Iterator[Tiling]:
+        for placements in self._placement_sets():
+            tiling = self._tiling_if_valid(placements)
+            if tiling is not None:
+                yield tiling
+
+    def count(self) -> int:
+        if len(self.symmetries) > 1:
+            return super().count()
+        return sum(1 for _ in self._placement_sets())
+
+    def _placement_sets(self) -> Iterator[list[Placement]]:
+        self._reset_directions()
+        self._chosen_candidates: list[int | None] = [None] * len(self.tiles)
+        for rows in self._dancing_links.solutions(allows=self._allows, push=self._push, pop=self._pop):
+            yield [self._placement(row) for row in rows]
+
+    def _placement(self, row: int) -> Placement:
+        tile_index, candidate_index = self._rows[row]
+        return self._candidates[tile_index][candidate_index]
+
+    def _allows(self, row: int) -> bool:
+        return self._in_order_with_identical_tiles(*self._rows[row]) and self._directions_allow(self._placement(row))
+
+    def _in_order_with_identical_tiles(self, tile_index: int, candidate_index: int) -> bool:
+        # Identical tiles have their own columns. Their candidates have to be chosen in increasing order,
+        # otherwise every solution would be found once per permutation of the identical tiles.
+        if self._is_repeat[tile_index]:
+            previous = self._chosen_candidates[tile_index - 1]
+            if previous is not None and previous >= candidate_index:
+                return False
+        if tile_index + 1 < len(self.tiles) and self._is_repeat[tile_index + 1]:
+            following = self._chosen_candidates[tile_index + 1]
+            if following is not None and following <= candidate_index:
+                return False
+        return True
+
+    def _push(self, row: int):
+        tile_index, candidate_index = self._rows[row]
+        self._chosen_candidates[tile_index] = candidate_index
+        self._record_directions(self._placement(row))
+
+    def _pop(self, row: int):
+        tile_index, _ = self._rows[row]
+        self._chosen_candidates[tile_index] = None
+        self._forget_directions(self._placement(row))
+
+
+class SearchState(NamedTuple):
+    """
+    A node of the search of PropagatingSolver. It is immutable, so going back to a node costs nothing.
+    """
+    # The numbers of the placements that are still possible, and the covered cells, as bits.
+    available: int
+    covered: int
+    # For every group of identical tiles, the number still to place and the lowest placement number they may use.
+    remaining: tuple[int, ...]
+    lowest: tuple[int, ...]
+    # For every path, the direction class of its planes so far: NO_PLANES, FORWARD or BACKWARD.
+    classes: tuple[int, ...]
+    # The Zobrist key of what is left to solve, see PropagatingSolver.
+    key: int
+
+
+NO_PLANES, FORWARD, BACKWARD = 0, 1, 2
+
+
+class PropagatingSolver(LevelSearch):
+    def __init__(self, level, first_placement: int | None = None, reduce_symmetry: bool = False,
+                 table: TranspositionTable | None = None):
+        """
+        Keeps the placements of the placement index that are still possible as a bit mask, the domain of every
+        tile and cell is that mask intersected with the placements of the tile or the cell. Placing a tile removes
+        the placements that overlap it and the placements that put planes on one of its paths in the other
+        direction. The search backtracks as soon as a tile, or a cell that has to be covered, has too few possible
+        placements left, and branches on the tile or cell with the fewest.
+        Identical tiles are placed in increasing order of their placement numbers, so every solution is found once.
+        :param table: Remembers the finished subproblems, see transpositionTable.py. What is left to solve only
+            depends on the covered cells, the direction classes of the paths and the tiles left with their lowest
+            placement numbers, so the key of a subproblem is the xor of the Zobrist keys of those. Different
+            partial tilings that leave the same subproblem, also in other processes, share an entry. A table
+            holds the subproblems of one level.
+        """
+        super().__init__(level, first_placement, reduce_symmetry)
+        self.table = table
+        index = self.placement_index
+        self._group_tiles: list[Tile] = []
+        for tile in self.tiles:
+            if not self._group_tiles or tile != self._group_tiles[-1]:
+                self._group_tiles.append(tile)
+        self._group_sizes = tuple(self.tiles.count(tile) for tile in self._group_tiles)
+        self._group_masks = [index.tile_mask(tile) for tile in self._group_tiles]
+        self._group_of = {placement.number: group for group, tile in enumerate(self._group_tiles)
+                          for placement in index.candidates(tile)}
+
+        # The placements with planes flying forward and backward along every path.
+        forward = [0] * len(self.objective.paths)
+        backward = [0] * len(self.objective.paths)
+        self._placement_classes: list[dict[int, int]] = []
+        for placement in index.placements:
+            classes = {}
+            for path_index, i, plane in placement.path_cells:
+                path = self.objective.paths[path_index]
+                if path._forward_backward_or_out(i, plane.direction) == PathObjective.FORWARD:
+                    forward[path_index] |= 1 << placement.number
+                    classes[path_index] = FORWARD
+                else:
+                    backward[path_index] |= 1 << placement.number
+                    classes[path_index] = BACKWARD
+            self._placement_classes.append(classes)
+        self._excludes = []
+        self._available = 0
+        for placement in index.placements:
+            direction_excludes = 0
+            for path_index in self._placement_classes[placement.number]:
+                if forward[path_index] >> placement.number & 1:
+                    direction_excludes |= backward[path_index]
+                if backward[path_index] >> placement.number & 1:
+                    direction_excludes |= forward[path_index]
+            self._excludes.append(placement.conflicts | direction_excludes)
+            # A placement with planes going both ways along one path excludes itself.
+            if placement.number in self._group_of and not direction_excludes >> placement.number & 1:
+                self._available |= 1 << placement.number
+
+        tiles_fill_board = sum(len(candidates[0].cells) if candidates else 0
+                               for candidates in self._candidates) == self.shape[0] * self.shape[1]
+        self._required_cells = [index.cell_number(Point((i, j)))
+                                for i in range(self.shape[0]) for j in range(self.shape[1])
+                                if tiles_fill_board or Point((i, j)) in self._mandatory_locations]
+        # A state without tiles left is a solution only if its tiles cover every required cell together.
+        self._required_mask = sum(1 << cell for cell in self._required_cells)
+
+        cell_keys = [zobrist_key('cell', cell) for cell in range(self.shape[0] * self.shape[1])]
+        self._cell_keys = [0] * len(index.placements)
+        for placement in index.placements:
+            for location, _ in placement.cells:
+                self._cell_keys[placement.number] ^= cell_keys[index.cell_number(location)]
+        self._class_keys = [(0, zobrist_key('path', path_index, FORWARD), zobrist_key('path', path_index, BACKWARD))
+                            for path_index in range(len(self.objective.paths))]
+        self._remaining_keys = [[zobrist_key('remaining', group, remaining) for remaining in range(size + 1)]
+                                for group, size in enumerate(self._group_sizes)]
+        self._lowest_keys: dict[tuple[int, int], int] = {}
+        self.nodes = 0
+
+    def _initial_state(self) -> SearchState | None:
+        self._chosen: list[Placement] = []
+        lowest = (0,) * len(self._group_tiles)
+        state = SearchState(self._available, 0, self._group_sizes, lowest, (NO_PLANES,) * len(self.objective.paths),
+                            zobrist_key('symmetries', len(self.symmetries) > 1))
+        state = state._replace(key=state.key ^ self._groups_key(state, range(len(self._group_tiles))))
+        if not self.tiles:
+            return state
+        # The first tile is in the first group, its candidates may be pruned by the symmetries of the level.
+        state = state._replace(available=state.available & (~self._group_masks[0] | sum(
+            1 << placement.number for placement in self._candidates[0])))
+        if self.first_placement is None:
+            return state
+        placement = self._candidates[0][self.first_placement]
+        if not state.available >> placement.number & 1:
+            return None
+        self._chosen.append(placement)
+        return self._place(self._with_lowest(state, 0, placement.number), placement)
+
+    def _solutions(self) -> Iterator[Tiling]:
+        self.nodes = 0
+        state = self._initial_state()
+        if state is not None:
+            yield from self._search(state)
+
+    def count(self) -> int:
+        if len(self.symmetries) > 1:
+            return super().count()
+        self.nodes = 0
+        state = self._initial_state()
+        return 0 if state is None else self._count(state)
+
+    def walk(self) -> Iterator[tuple[SearchState, float, Tiling | None]]:
+        """
+        The search of solutions one node at a time, with an explicit stack so the caller can stop after any node,
+        see anytimeSolving.py. While a node is yielded, partial_tiling holds its tiles.
+        :return: For every node: its state, the estimated part of the search tree that is finished after it,
+            and the solution if the node is one. A node has an equal share of the part of its parent.
+        """
+        self.nodes = 0
+        state = self._initial_state()
+        if state is None:
+            return
+        finished = 0.0
+        # Every frame holds the children of a node that are left, their share and the placement of the node.
+        stack = [(iter([(None, state)]), 1.0, None)]
+        while stack:
+            children, share, node_placement = stack[-1]
+            placement, state = next(children, (None, None))
+            if state is None:
+                stack.pop()
+                if node_placement is not None:
+                    self._chosen.pop()
+                continue
+
+            self.nodes += 1
+            if placement is not None:
+                self._chosen.append(placement)
+            grandchildren = [] if not any(state.remaining) else list(self._children(state))
+            if grandchildren:
+                yield state, finished, None
+                stack.append((iter(grandchildren), share / len(grandchildren), placement))
+                continue
+            finished += share
+            yield state, finished, self._tiling_if_valid(self._chosen) if not any(state.remaining) else None
+            if placement is not None:
+                self._chosen.pop()
+
+    def partial_tiling(self) -> Tiling:
+        """
+        The tiles placed at the current node of the search.
+        """
+        return Tiling([placement.top_left_corner for placement in self._chosen],
+                      [placement.tile for placement in self._chosen], shape=self.shape)
+
+    def _search(self, state: SearchState) -> Iterator[Tiling]:
+        self.nodes += 1
+        if not any(state.remaining):
+            tiling = self._tiling_if_valid(self._chosen)
+            if tiling is not None:
+                yield tiling
+            return
+        if self.table is not None and self.table.lookup(state.key) == 0:
+            return
+
+        found = 0
+        for placement, child in self._children(state):
+            self._chosen.append(placement)
+            for tiling in self._search(child):
+                found += 1
+                yield tiling
+            self._chosen.pop()
+        if self.table is not None:
+            self.table.store(state.key, found, sum(state.remaining))
+
+    def _count(self, state: SearchState) -> int:
+        self.nodes += 1
+        if not any(state.remaining):
+            return int(state.covered & self._required_mask == self._required_mask)
+        if self.table is not None:
+            count = self.table.lookup(state.key)
+            if count is not None:
+                return count
+
+        count = sum(self._count(child) for _, child in self._children(state))
+        if self.table is not None:
+            self.table.store(state.key, count, sum(state.remaining))
+        return count
+
+    def _children(self, state: SearchState) -> Iterator[tuple[Placement, SearchState]]:
+        """
+        The placements to branch on with the states after them, nothing if the state is a dead end.
+        """
+        available, remaining = state.available, state.remaining
+        branch_group, branch_domain = None, None
+        for group, count in enumerate(remaining):
+            if count:
+                domain = available & self._group_masks[group]
+                if domain.bit_count() < count:
+                    return
+                if branch_domain is None or domain.bit_count() < branch_domain.bit_count():
+                    branch_group, branch_domain = group, domain
+        cell_masks = self.placement_index.cell_masks
+        for cell in self._required_cells:
+            if state.covered >> cell & 1:
+                continue
+            domain = available & cell_masks[cell]
+            if not domain:
+                return
+            if domain.bit_count() < branch_domain.bit_count():
+                branch_group, branch_domain = None, domain
+
+        placements = self.placement_index.placements
+        for number in _bit_numbers(branch_domain):
+            placement = placements[number]
+            child = state
+            if branch_group is not None:
+                # The placement is the lowest of the remaining tiles of its group.
+                child = self._with_lowest(state, branch_group, number)
+            yield placement, self._place(child, placement)
+
+    def _with_lowest(self, state: SearchState, group: int, number: int) -> SearchState:
+        key = state.key ^ self._groups_key(state, (group,))
+        state = state._replace(available=state.available & ~(self._group_masks[group] & ((1 << number) - 1)),
+                               lowest=state.lowest[:group] + (number,) + state.lowest[group + 1:])
+        return state._replace(key=key ^ self._groups_key(state, (group,)))
+
+    def _place(self, state: SearchState, placement: Placement) -> SearchState:
+        group = self._group_of[placement.number]
+        available = state.available & ~self._excludes[placement.number]
+        if state.remaining[group] == 1:
+            available &= ~self._group_masks[group]
+        key = state.key ^ self._cell_keys[placement.number] ^ self._groups_key(state, (group,))
+        classes = state.classes
+        for path_index, direction_class in self._placement_classes[placement.number].items():
+            if classes[path_index] == NO_PLANES:
+                classes = classes[:path_index] + (direction_class,) + classes[path_index + 1:]
+                key ^= self._class_keys[path_index][direction_class]
+        state = SearchState(available, state.covered | placement.mask,
+                            state.remaining[:group] + (state.remaining[group] - 1,) + state.remaining[group + 1:],
+                            state.lowest, classes, key)
+        return state._replace(key=key ^ self._groups_key(state, (group,)))
+
+    def _groups_key(self, state: SearchState, groups) -> int:
+        # The lowest placement number of a group only matters while it has tiles left.
+        key = 0
+        for group in groups:
+            remaining, lowest = state.remaining[group], state.lowest[group]
+            key ^= self._remaining_keys[group][remaining]
+            if remaining and lowest:
+                if (group, lowest) not in self._lowest_keys:
+                    self._lowest_keys[(group, lowest)] = zobrist_key('lowest', group, lowest)
+                key ^= self._lowest_keys[(group, lowest)]
+        return key
+
+
+def _bit_numbers(mask: int) -> Iterator[int]:
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
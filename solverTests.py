@@ -0,0 +1,171 @@
+import unittest
+
+from defaultLevels import level7, level48, DEFAULT_TILE_1, DEFAULT_TILE_2
+from board import BoardObjective, PathObjective, Point, Segment
+from level import Level
+from solver import BacktrackingSolver, ExactCoverSolver, PropagatingSolver
+from tileComponents import COVERED, UNCOVERED, Plane, NORTH
+from benchmarks import row_level
+from tiling import Tile
+
+
+class TestBacktrackingSolverMethods(unittest.TestCase):
+    def test_level_7_solved(self):
+        tiling = level7.solve()
+        self.assertIsNotNone(tiling)
+        self.assertIsNone(level7.raise_exception_if_tiling_invalid(tiling))
+
+    def test_level_48_solved(self):
+        tiling = level48.solve()
+        self.assertIsNotNone(tiling)
+        self.assertIsNone(level48.raise_exception_if_tiling_invalid(tiling))
+
+    def test_all_solutions_valid(self):
+        for tiling in level7.solutions():
+            self.assertIsNone(level7.raise_exception_if_tiling_invalid(tiling))
+
+    def test_unsolvable_level(self):
+        level = Level(BoardObjective([PathObjective.from_points([Point((0, 0)), Point((0, 1))],
+                                                               mandatory_planes=(0, 1))], shape=(2, 2)),
+                      [DEFAULT_TILE_1])
+        self.assertIsNone(level.solve())
+
+    def test_identical_tiles_not_permuted(self):
+        level = Level(BoardObjective([], shape=(1, 4)), [Tile([[COVERED, COVERED]]), Tile([[COVERED, COVERED]])])
+        self.assertEqual(len(list(BacktrackingSolver(level).solutions())), 1)
+
+    def test_plane_on_corner_pruned(self):
+        solver = BacktrackingSolver(level48)
+        for candidates in solver._candidates:
+            for placement in candidates:
+                for location, component in placement.cells:
+                    if isinstance(component, Plane):
+                        self.assertNotIn(location, solver.placement_index.corners)
+
+
+class TestExactCoverSolverMethods(unittest.TestCase):
+    def test_same_solutions_as_backtracking(self):
+        for level in (level7, level48):
+            def placements(tiling):
+                return {(tile.content.tobytes(), tuple(corner)) for tile, corner in
+                        zip(tiling.tiles, tiling.top_left_corners)}
+            exact_cover = [placements(tiling) for tiling in ExactCoverSolver(level).solutions()]
+            backtracking = [placements(tiling) for tiling in BacktrackingSolver(level).solutions()]
+            self.assertEqual(len(exact_cover), len(backtracking))
+            for solution in exact_cover:
+                self.assertIn(solution, backtracking)
+
+    def test_count(self):
+        self.assertEqual(ExactCoverSolver(level7).count(), len(list(ExactCoverSolver(level7).solutions())))
+        self.assertEqual(level48.count_solutions(), 1)
+
+    def test_identical_tiles_counted_once(self):
+        level = Level(BoardObjective([], shape=(2, 2)), [Tile([[COVERED, COVERED]]), Tile([[COVERED, COVERED]])])
+        self.assertEqual(ExactCoverSolver(level).count(), 2)
+        self.assertEqual(len(list(ExactCoverSolver(level).solutions())), 2)
+
+    def test_partial_cover(self):
+        level = Level(BoardObjective([], shape=(2, 2)), [Tile([[COVERED]])])
+        self.assertEqual(ExactCoverSolver(level).count(), 4)
+
+    def test_unsolvable_level(self):
+        level = Level(BoardObjective([PathObjective.from_points([Point((0, 0)), Point((0, 1))],
+                                                               mandatory_planes=(0, 1))], shape=(2, 2)),
+                      [DEFAULT_TILE_1])
+        self.assertIsNone(ExactCoverSolver(level).solve())
+
+
+class TestPropagatingSolverMethods(unittest.TestCase):
+    @staticmethod
+    def placements(tiling):
+        return frozenset((tile.content.tobytes(), tuple(corner))
+                         for tile, corner in zip(tiling.tiles, tiling.top_left_corners))
+
+    def test_same_solutions_as_exact_cover(self):
+        for level in (level7, level48, row_level(4), TestSymmetryReductionMethods.SQUARE_LEVEL):
+            propagating = [self.placements(tiling) for tiling in PropagatingSolver(level).solutions()]
+            exact_cover = [self.placements(tiling) for tiling in ExactCoverSolver(level).solutions()]
+            self.assertEqual(len(propagating), len(exact_cover))
+            self.assertEqual(set(propagating), set(exact_cover))
+
+    def test_first_placements_split_the_search(self):
+        solver = PropagatingSolver(row_level(4))
+        parts = [self.placements(tiling) for first_placement in range(solver.number_of_first_placements())
+                 for tiling in PropagatingSolver(row_level(4), first_placement).solutions()]
+        self.assertEqual(set(parts), {self.placements(tiling) for tiling in solver.solutions()})
+        self.assertEqual(len(parts), solver.count())
+
+    def test_identical_tiles_counted_once(self):
+        level = Level(BoardObjective([], shape=(2, 2)), [Tile([[COVERED, COVERED]]), Tile([[COVERED, COVERED]])])
+        self.assertEqual(PropagatingSolver(level).count(), 2)
+        level = Level(BoardObjective([], shape=(2, 2)), [Tile([[COVERED]])])
+        self.assertEqual(PropagatingSolver(level).count(), 4)
+
+    def test_mandatory_cells_covered_by_every_solution(self):
+        # Either mandatory cell can get the plane, but the one tile cannot cover both.
+        level = Level(BoardObjective([PathObjective(Point((0, 1)), [Segment(NORTH, 1)], mandatory_planes=(0,)),
+                                      PathObjective(Point((0, 3)), [Segment(NORTH, 1)], mandatory_planes=(0,))],
+                                     shape=(1, 4)),
+                      [DEFAULT_TILE_2])
+        solver = PropagatingSolver(level)
+        self.assertEqual(solver.count(), 0)
+        self.assertEqual(sum(PropagatingSolver(level, first_placement).count()
+                             for first_placement in range(solver.number_of_first_placements())), 0)
+        self.assertEqual(list(solver.solutions()), [])
+
+    def test_dead_end_found_before_placing_tiles(self):
+        level = Level(BoardObjective([PathObjective.from_points([Point((0, 0)), Point((0, 1))],
+                                                               mandatory_planes=(0, 1))], shape=(2, 2)),
+                      [DEFAULT_TILE_1])
+        solver = PropagatingSolver(level)
+        self.assertIsNone(solver.solve())
+        self.assertEqual(solver.nodes, 1)
+
+    def test_few_nodes(self):
+        solver = PropagatingSolver(level48)
+        self.assertEqual(solver.count(), 1)
+        self.assertLess(solver.nodes, sum(len(candidates) for candidates in solver._candidates))
+
+    def test_symmetry_reduction(self):
+        level = TestSymmetryReductionMethods.SQUARE_LEVEL
+        full = {self.placements(tiling) for tiling in PropagatingSolver(level).solutions()}
+        reduced = [self.placements(tiling) for tiling in PropagatingSolver(level, reduce_symmetry=True).solutions()]
+        self.assertEqual(len(reduced), len(full))
+        self.assertEqual(set(reduced), full)
+
+
+class TestSymmetryReductionMethods(unittest.TestCase):
+    SQUARE_LEVEL = Level(BoardObjective([], shape=(3, 3)),
+                         [Tile([[COVERED, COVERED], [COVERED, UNCOVERED]]), Tile([[COVERED, COVERED]]),
+                          Tile([[COVERED, COVERED, COVERED]]), Tile([[COVERED]])])
+
+    @staticmethod
+    def placements(tiling):
+        return frozenset((tile.content.tobytes(), tuple(corner))
+                         for tile, corner in zip(tiling.tiles, tiling.top_left_corners))
+
+    def test_same_solutions_as_full_search(self):
+        for level in (self.SQUARE_LEVEL, row_level(4), level7):
+            for solver_class in (BacktrackingSolver, ExactCoverSolver):
+                full = [self.placements(tiling) for tiling in solver_class(level).solutions()]
+                reduced = [self.placements(tiling) for tiling in solver_class(level, reduce_symmetry=True).solutions()]
+                self.assertEqual(len(reduced), len(full))
+                self.assertEqual(set(reduced), set(full))
+                self.assertEqual(solver_class(level, reduce_symmetry=True).count(), len(full))
+
+    def test_one_canonical_solution_per_class(self):
+        canonical = list(self.SQUARE_LEVEL.canonical_solutions())
+        self.assertEqual(len(canonical), 6)
+        solver = ExactCoverSolver(self.SQUARE_LEVEL, reduce_symmetry=True)
+        self.assertEqual(sum(len(solver.expand(tiling)) for tiling in canonical), 48)
+        for tiling in canonical:
+            for image in solver.expand(tiling):
+                self.assertIsNone(self.SQUARE_LEVEL.raise_exception_if_tiling_invalid(image))
+
+    def test_first_tile_placements_pruned(self):
+        self.assertLess(ExactCoverSolver(self.SQUARE_LEVEL, reduce_symmetry=True).number_of_first_placements(),
+                        ExactCoverSolver(self.SQUARE_LEVEL).number_of_first_placements())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@ from cardinalDirections import *
 
 
 class TileComponent(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __repr__(self):
         pass
@@ -16,9 +18,19 @@ class TileComponent(ABC):
 
 
 class Plane(TileComponent):
+    __slots__ = ("direction", "_rotations")
     _PLANES_ORDERED_COUNTERCLOCKWISE: tuple[Plane, Plane, Plane, Plane]
-    def __init__(self, direction: CardinalDirection, symbol: str):
-        self.direction = direction
+    _instances: dict[CardinalDirection, Plane] = {}
+
+    def __new__(cls, direction: CardinalDirection, symbol: str = None):
+        """
+        There is one plane per direction, Plane(NORTH, '^') is NORTH_FACING_PLANE.
+        """
+        if direction not in cls._instances:
+            self = super().__new__(cls)
+            self.direction = direction
+            cls._instances[direction] = self
+        return cls._instances[direction]
 
     def __repr__(self):
         return {NORTH: '^', WEST: '>', SOUTH: 'v', EAST: '>'}[self.direction]
@@ -27,12 +39,22 @@ class Plane(TileComponent):
         return self.__repr__()
 
     def rotate(self, k):
-        i = self._PLANES_ORDERED_COUNTERCLOCKWISE.index(self)
-        return self._PLANES_ORDERED_COUNTERCLOCKWISE[(i + k) % 4]
+        return self._rotations[k % 4]
+
+    def __reduce__(self):
+        # Unpickle to the module level singleton, the code compares components with `is`.
+        return plane_facing, (self.direction,)
 
 class RotationInvariantTileComponent(TileComponent):
-    def __init__(self, symbol:str):
-        self.symbol = symbol
+    __slots__ = ("symbol",)
+    _instances: dict[str, RotationInvariantTileComponent] = {}
+
+    def __new__(cls, symbol: str):
+        if symbol not in cls._instances:
+            self = super().__new__(cls)
+            self.symbol = symbol
+            cls._instances[symbol] = self
+        return cls._instances[symbol]
 
     def __repr__(self):
         return self.symbol
@@ -40,12 +62,27 @@ class RotationInvariantTileComponent(TileComponent):
     def rotate(self, k):
         return self
 
+    def __reduce__(self):
+        return rotation_invariant_component, (self.symbol,)
+
 
 NORTH_FACING_PLANE = Plane(NORTH, '^')
 WEST_FACING_PLANE = Plane(WEST, '>')
 SOUTH_FACING_PLANE = Plane(SOUTH, 'v')
 EAST_FACING_PLANE = Plane(EAST, '<')
 
-Plane._PLANES_ORDERED_COUNTERCLOCKWISE = [NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE]
+Plane._PLANES_ORDERED_COUNTERCLOCKWISE = (NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE)
+# Membership of this set is a cheaper isinstance(component, Plane), which goes through ABCMeta.
+PLANES = frozenset(Plane._PLANES_ORDERED_COUNTERCLOCKWISE)
+for _plane in Plane._PLANES_ORDERED_COUNTERCLOCKWISE:
+    _plane._rotations = tuple(Plane(_plane.direction.rotate(k)) for k in range(4))
 COVERED = RotationInvariantTileComponent('C')
 UNCOVERED = RotationInvariantTileComponent('U')
+
+
+def plane_facing(direction: CardinalDirection) -> Plane:
+    return Plane._PLANES_ORDERED_COUNTERCLOCKWISE[direction.code]
+
+
+def rotation_invariant_component(symbol: str) -> RotationInvariantTileComponent:
+    return RotationInvariantTileComponent(symbol)
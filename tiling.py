@@ -2,27 +2,119 @@ from __future__ import annotations
 
 import numpy as np
 
-from tileComponents import TileComponent, UNCOVERED
+from cardinalDirections import DIRECTIONS, direction_named
+from tileComponents import TileComponent, Plane, UNCOVERED, plane_facing, rotation_invariant_component
 from board import BoardFilling
-from errorsAndExceptions import TileLocationError
+from bitboard import Bitboard, TileMasks, tile_masks
 
 TileContentType = list[list[TileComponent]]
 
+class RotationTable:
+    _interned: dict[tuple, RotationTable] = {}
+
+    def __init__(self, content: np.ndarray):
+        """
+        The four orientations of a tile, computed once and shared by every tile with the same unrotated content.
+        Orientations that look the same, as for symmetric tiles, share their content array.
+        :param content: The content of the unrotated tile
+        """
+        self.key = content_key(content)
+        self.hash = hash(self.key)
+        self.tiles: list[Tile] = []
+        self.distinct_tiles: list[Tile] = []
+
+        contents_by_key = {}
+        for k in range(4):
+            rotated_content = np.array(Tile.rotate_components(np.rot90(content, k), k))
+            rotated_key = content_key(rotated_content)
+            is_new_orientation = rotated_key not in contents_by_key
+            rotated_content = contents_by_key.setdefault(rotated_key, rotated_content)
+            tile = Tile._from_table(rotated_content, self, k)
+            self.tiles.append(tile)
+            if is_new_orientation:
+                self.distinct_tiles.append(tile)
+
+    @classmethod
+    def of(cls, content: np.ndarray, has_been_rotated_by: int) -> RotationTable:
+        """
+        The interned rotation table of a tile with the given content and rotation.
+        """
+        if has_been_rotated_by:
+            content = np.array(Tile.rotate_components(np.rot90(content, -has_been_rotated_by), -has_been_rotated_by))
+        key = content_key(content)
+        if key not in cls._interned:
+            cls._interned[key] = cls(content)
+        return cls._interned[key]
+
+
+def content_key(content: np.ndarray) -> tuple:
+    """
+    A hashable description of the content of a tile that does not depend on object identities.
+    """
+    return content.shape, tuple(component.direction.direction if isinstance(component, Plane) else component.symbol
+                                for component in content.flat)
+
+
+def content_from_key(key: tuple) -> np.ndarray:
+    """
+    The content of a tile from its content_key, also when the key went through JSON as lists.
+    """
+    shape, names = key
+    direction_names = {direction.direction for direction in DIRECTIONS}
+    components = [plane_facing(direction_named(name)) if name in direction_names
+                  else rotation_invariant_component(name) for name in names]
+    content = np.empty(len(components), dtype=object)
+    content[:] = components
+    return content.reshape(tuple(shape))
+
+
 class Tile:
     def __init__(self, content: TileContentType):
         self.content = np.array(content)
+        self._bit_masks: dict[int, TileMasks] = {}
+        self._plane_cells: list[tuple[tuple[int, int], Plane]] | None = None
         self.has_been_rotated_by = 0
 
+    @classmethod
+    def _from_table(cls, content: np.ndarray, rotations: RotationTable, has_been_rotated_by: int) -> Tile:
+        tile = cls.__new__(cls)
+        tile.content = content
+        tile._bit_masks = {}
+        tile._plane_cells = None
+        tile._has_been_rotated_by = has_been_rotated_by
+        tile._rotations = rotations
+        return tile
+
+    @property
+    def has_been_rotated_by(self) -> int:
+        return self._has_been_rotated_by
+
+    @has_been_rotated_by.setter
+    def has_been_rotated_by(self, k: int):
+        self._has_been_rotated_by = k % 4
+        self._rotations = RotationTable.of(self.content, self._has_been_rotated_by)
+
     def rotation(self, k: int):
         """
-        Rotate the tile by a multiple of 90 degrees.
+        Rotate the tile by a multiple of 90 degrees. The rotated tiles come from a shared table and should not
+        be modified.
         :param k: The number of times the tile is rotated by 90 degrees
         :return: A tile with the same contents but rotated by k*90 degrees counterclockwise
         """
-        new_content = self.rotate_components(np.rot90(self.content, k), k)
-        new_tile = Tile(new_content)
-        new_tile.has_been_rotated_by = (self.has_been_rotated_by+k)%4
-        return new_tile
+        return self._rotations.tiles[(self._has_been_rotated_by + k) % 4]
+
+    def distinct_rotations(self) -> list[Tile]:
+        """
+        The rotations of the tile that differ from each other, e.g. a single rotation for a rotation invariant tile.
+        """
+        return self._rotations.distinct_tiles
+
+    def rotation_symmetries(self) -> list[int]:
+        """
+        The rotations k for which the tile rotated by k looks the same as the tile, always including 0.
+        """
+        # Orientations that look the same share their content array, see RotationTable.
+        return [k for k in range(4) if self.rotation(k).content is self.rotation(0).content]
 
     @staticmethod
     def rotate_components(content, k) -> TileContentType:
@@ -35,38 +127,101 @@ class Tile:
         return new_content
 
     def __eq__(self, other: Tile):
-        return np.array_equal(self.rotation(-self.has_been_rotated_by+other.has_been_rotated_by).content, other.content)
+        return self._rotations is other._rotations
 
     def __repr__(self):
         return repr(self.content)
 
     def __hash__(self):
-        unrotated_tile = self.rotation(-self.has_been_rotated_by)
-        return hash(unrotated_tile.content.tostring())
+        return self._rotations.hash
+
+    def __reduce__(self):
+        # The rotation table and the bit masks are rebuilt (and interned again) when unpickling.
+        return rotated_tile, (self.content, self._has_been_rotated_by)
 
     def enumerate_components(self):
         return np.ndenumerate(self.content)
 
+    def plane_cells(self) -> list[tuple[tuple[int, int], Plane]]:
+        """
+        The location of every plane of the tile relative to its top left corner, with the plane.
+        """
+        if self._plane_cells is None:
+            self._plane_cells = [((int(i), int(j)), component) for (i, j), component in np.ndenumerate(self.content)
+                                 if isinstance(component, Plane)]
+        return self._plane_cells
+
+    def bit_masks(self, width: int) -> TileMasks:
+        """
+        The bit masks of the tile on a board of the given width, see bitboard.py.
+        """
+        if width not in self._bit_masks:
+            self._bit_masks[width] = tile_masks(self, width)
+        return self._bit_masks[width]
+
+def rotated_tile(content: TileContentType, has_been_rotated_by: int) -> Tile:
+    tile = Tile(content)
+    tile.has_been_rotated_by = has_been_rotated_by
+    return tile
+
+
 class Tiling:
     def __init__(self, top_left_corners: list[tuple[int, int]], tiles: list[Tile], shape: tuple[int, int]):
-        self.tiles = tiles
+        self.tiles = []
+        self.top_left_corners = []
+        self.shape = shape
+        self.bitboard = Bitboard(shape)
         self._filling = np.full(shape, UNCOVERED)
+        # The plane of every cell that has one, by (i, j), so the planes are found without looking at every cell.
+        self._planes: dict[tuple[int, int], Plane] = {}
+        self._filling_view = BoardFilling.view(self._filling, self._planes)
 
         for top_left_corner, tile in zip(top_left_corners, tiles):
             self.add_tile(top_left_corner, tile)
 
     @property
     def filling(self) -> BoardFilling:
-        return BoardFilling(self._filling)
+        """
+        A read-only view of the board that is not copied, so it also shows the tiles added or removed later.
+        Use BoardFilling(tiling.filling.filling) for a copy.
+        """
+        return self._filling_view
+
+    def __getstate__(self):
+        # The view is made again around the unpickled array, a pickled view would be a copy.
+        state = self.__dict__.copy()
+        del state['_filling_view']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._filling_view = BoardFilling.view(self._filling, self._planes)
 
     def add_tile(self, top_left_corner: tuple[int, int], tile: Tile):
-        for relative_location, component in tile.enumerate_components():
-            if component is UNCOVERED:
-                continue
-            absolute_location = tuple(top_left_corner + np.array(relative_location))
-            try:
-                if self._filling[absolute_location] is not UNCOVERED:
-                    raise TileLocationError(f"The tiles overlap at location {absolute_location}.")
-            except IndexError:
-                raise TileLocationError("Tile lies outside the board.")
-            self._filling[absolute_location] = component
+        self.bitboard.add_tile(top_left_corner, tile)
+
+        i, j = top_left_corner
+        height, width = tile.content.shape
+        covered = tile.content != UNCOVERED
+        self._filling[i:i + height, j:j + width][covered] = tile.content[covered]
+        for (di, dj), plane in tile.plane_cells():
+            self._planes[(i + di, j + dj)] = plane
+        self.tiles.append(tile)
+        self.top_left_corners.append(top_left_corner)
+
+    def remove_tile(self, index: int = -1) -> tuple[tuple[int, int], Tile]:
+        """
+        Take a tile off the board again, the last added tile by default. Only the cells of the tile are touched.
+        :return: The top left corner and the tile that were removed
+        """
+        top_left_corner = self.top_left_corners.pop(index)
+        tile = self.tiles.pop(index)
+        self.bitboard.remove_tile(top_left_corner, tile)
+
+        i, j = top_left_corner
+        height, width = tile.content.shape
+        covered = tile.content != UNCOVERED
+        self._filling[i:i + height, j:j + width][covered] = UNCOVERED
+        for (di, dj), _ in tile.plane_cells():
+            del self._planes[(i + di, j + dj)]
+        return top_left_corner, tile
@@ -1,10 +1,20 @@
+import pickle
 import unittest
 
 from tileComponents import NORTH_FACING_PLANE, WEST_FACING_PLANE, SOUTH_FACING_PLANE, EAST_FACING_PLANE, COVERED, UNCOVERED
 from tiling import *
+from board import Point
 from errorsAndExceptions import TileLocationError
 
 class TestTileMethods(unittest.TestCase):
+    def test_components_are_interned(self):
+        from tileComponents import Plane, RotationInvariantTileComponent, plane_facing, NORTH, EAST
+        self.assertIs(Plane(NORTH, '^'), NORTH_FACING_PLANE)
+        self.assertIs(RotationInvariantTileComponent('C'), COVERED)
+        self.assertIs(plane_facing(EAST), EAST_FACING_PLANE)
+        self.assertIs(NORTH_FACING_PLANE.rotate(1), WEST_FACING_PLANE)
+        self.assertIs(NORTH_FACING_PLANE.rotate(-1), EAST_FACING_PLANE)
+
     def test_rotate(self):
         tile = Tile([[WEST_FACING_PLANE, COVERED],
                      [UNCOVERED, COVERED],
@@ -47,6 +57,49 @@ class TestTileMethods(unittest.TestCase):
         self.assertEqual(hash(tile.rotation(3)), hash(tile))
         self.assertEqual(hash(tile.rotation(4)), hash(tile))
 
+    def test_rotation_is_cached(self):
+        tile = Tile([[WEST_FACING_PLANE, COVERED],
+                     [UNCOVERED, COVERED]])
+        self.assertIs(tile.rotation(1), tile.rotation(1))
+        self.assertIs(tile.rotation(1).rotation(2), tile.rotation(3))
+
+    def test_identical_tiles_share_rotations(self):
+        tile = Tile([[NORTH_FACING_PLANE, COVERED]])
+        self.assertIs(tile.rotation(1), Tile([[NORTH_FACING_PLANE, COVERED]]).rotation(1))
+
+    def test_manually_rotated_tile(self):
+        tile = Tile([[NORTH_FACING_PLANE, COVERED]])
+        rotated_tile = Tile(tile.rotation(3).content)
+        self.assertNotEqual(rotated_tile, tile)
+        rotated_tile.has_been_rotated_by = 3
+        self.assertEqual(rotated_tile, tile)
+        self.assertEqual(hash(rotated_tile), hash(tile))
+
+    def test_distinct_rotations(self):
+        self.assertEqual(len(Tile([[NORTH_FACING_PLANE, COVERED]]).distinct_rotations()), 4)
+        self.assertEqual(len(Tile([[COVERED, COVERED]]).distinct_rotations()), 2)
+        self.assertEqual(len(Tile([[COVERED, COVERED], [COVERED, COVERED]]).distinct_rotations()), 1)
+
+    def test_rotation_symmetries(self):
+        self.assertEqual(Tile([[NORTH_FACING_PLANE, COVERED]]).rotation_symmetries(), [0])
+        self.assertEqual(Tile([[COVERED, COVERED]]).rotation(1).rotation_symmetries(), [0, 2])
+        self.assertEqual(Tile([[COVERED]]).rotation_symmetries(), [0, 1, 2, 3])
+
+    def test_symmetric_rotations_share_content(self):
+        tile = Tile([[COVERED, COVERED]])
+        self.assertIs(tile.rotation(2).content, tile.rotation(0).content)
+        self.assertEqual(tile.rotation(2).has_been_rotated_by, 2)
+
+    def test_pickle(self):
+        tile = Tile([[WEST_FACING_PLANE, COVERED],
+                     [UNCOVERED, COVERED]]).rotation(3)
+        unpickled_tile = pickle.loads(pickle.dumps(tile))
+        self.assertEqual(unpickled_tile, tile)
+        self.assertEqual(unpickled_tile.has_been_rotated_by, 3)
+        self.assertIs(unpickled_tile.rotation(1), tile.rotation(1))
+        self.assertIs(unpickled_tile.content[0, 0], tile.content[0, 0])
+
+
 class TestTilingMethods(unittest.TestCase):
     DEFAULT_TILE_1 = Tile([[COVERED, UNCOVERED],
                                [COVERED, UNCOVERED],
@@ -71,6 +124,40 @@ class TestTilingMethods(unittest.TestCase):
         with self.assertRaises(TileLocationError):
             tiling.add_tile((0, 0), self.DEFAULT_TILE_2)
 
+    def test_remove_tile(self):
+        tiling = Tiling([(0, 0), (0, 1)], [self.DEFAULT_TILE_1, self.DEFAULT_TILE_2], shape=(4, 4))
+        self.assertEqual(tiling.remove_tile(), ((0, 1), self.DEFAULT_TILE_2))
+        self.assertTrue(np.array_equal(tiling.filling.filling,
+                                       [[COVERED, UNCOVERED, UNCOVERED, UNCOVERED],
+                                        [COVERED, UNCOVERED, UNCOVERED, UNCOVERED],
+                                        [COVERED, EAST_FACING_PLANE, UNCOVERED, UNCOVERED],
+                                        [UNCOVERED, UNCOVERED, UNCOVERED, UNCOVERED]]))
+        tiling.add_tile((0, 1), self.DEFAULT_TILE_2)
+        self.assertEqual(tiling.tiles, [self.DEFAULT_TILE_1, self.DEFAULT_TILE_2])
+
+    def test_filling_is_a_read_only_view(self):
+        tiling = Tiling([(0, 0)], [self.DEFAULT_TILE_1], shape=(4, 4))
+        filling = tiling.filling
+        self.assertIs(tiling.filling, filling)
+        with self.assertRaises(ValueError):
+            filling.filling[3, 3] = COVERED
+        tiling.add_tile((0, 1), self.DEFAULT_TILE_2)
+        self.assertIs(filling[Point((0, 1))], NORTH_FACING_PLANE)
+
+    def test_planes_are_indexed(self):
+        tiling = Tiling([(0, 0), (0, 1)], [self.DEFAULT_TILE_1, self.DEFAULT_TILE_2], shape=(4, 4))
+        planes = [(Point((0, 1)), NORTH_FACING_PLANE), (Point((2, 1)), EAST_FACING_PLANE)]
+        self.assertEqual(list(tiling.filling.enumerate_just_the_planes()), planes)
+        self.assertEqual(list(BoardFilling(tiling.filling.filling).enumerate_just_the_planes()), planes)
+        tiling.remove_tile()
+        self.assertEqual(list(tiling.filling.enumerate_just_the_planes()), planes[1:])
+
+    def test_pickled_filling_is_still_a_view(self):
+        tiling = pickle.loads(pickle.dumps(Tiling([(0, 0)], [self.DEFAULT_TILE_1], shape=(4, 4))))
+        tiling.add_tile((0, 1), self.DEFAULT_TILE_2)
+        self.assertIs(tiling.filling[Point((0, 1))], NORTH_FACING_PLANE)
+        self.assertEqual(len(list(tiling.filling.enumerate_just_the_planes())), 2)
+
     def test_tile_outside_grid(self):
         with self.assertRaises(TileLocationError):
             Tiling([(0, 3)], [self.DEFAULT_TILE_1], shape=(4, 4))
@@ -0,0 +1,116 @@
+"""
+A bounded table of the subproblems a search has finished, with their number of solutions (0 for a dead end).
+The table lives in shared memory: pickling it, for example to send it to a worker process, attaches the other
+process to the same memory, so parallel searches skip each other's dead ends.
+
+    with TranspositionTable(1 << 20) as table:
+        PropagatingSolver(level, table=table).count()
+
+Every bucket has two entries. The first keeps the subproblem with the most tiles left, which saves the most work
+when it is found again, the second always takes the latest one. The entries are written without locks; an entry
+stores its key xor its data, so an entry that is half written by another process does not match any key.
+"""
+from __future__ import annotations
+
+import hashlib
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+ENTRY = np.dtype([('check', '<u8'), ('data', '<u8')])
+ENTRIES_PER_BUCKET = 2
+DEPTH_BITS = 16
+MAX_DEPTH = (1 << DEPTH_BITS) - 1
+MAX_COUNT = (1 << (64 - DEPTH_BITS)) - 1
+
+
+def zobrist_key(*parts) -> int:
+    """
+    A random 64 bit key for the parts, the same in every process. Keys of the parts of a state are combined
+    with xor, so the key of a state is updated in constant time when one part changes.
+    """
+    return int.from_bytes(hashlib.blake2b(repr(parts).encode(), digest_size=8).digest(), 'little')
+
+
+class TranspositionTable:
+    def __init__(self, number_of_entries: int = 1 << 16, name: str | None = None):
+        """
+        :param number_of_entries: Rounded up to a power of two
+        :param name: The name of the shared memory of an existing table to attach to, instead of creating a table
+        """
+        number_of_buckets = 1 << max(0, (number_of_entries - 1) // ENTRIES_PER_BUCKET).bit_length()
+        size = number_of_buckets * ENTRIES_PER_BUCKET * ENTRY.itemsize
+        self._owner = name is None
+        if self._owner:
+            self._memory = SharedMemory(create=True, size=size)
+        else:
+            # Worker processes share the resource tracker of the process that created the memory, which removes
+            # it if that process does not.
+            self._memory = SharedMemory(name=name)
+        self.entries = np.ndarray((number_of_buckets, ENTRIES_PER_BUCKET), dtype=ENTRY, buffer=self._memory.buf)
+        if self._owner:
+            self.entries[:] = 0
+        self._bucket_mask = number_of_buckets - 1
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def __len__(self):
+        return self.entries.size
+
+    def __reduce__(self):
+        return _attach, (len(self), self.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception_info):
+        self.close()
+
+    def close(self):
+        """
+        Detach from the shared memory, and remove it if this process created the table.
+        """
+        del self.entries
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def lookup(self, key: int) -> int | None:
+        """
+        :return: The number of solutions of the subproblem with this key, or None if it is not in the table
+        """
+        key = key or 1
+        for check, data in self.entries[key & self._bucket_mask].tolist():
+            if check ^ data == key:
+                self.hits += 1
+                return data >> DEPTH_BITS
+        self.misses += 1
+        return None
+
+    def store(self, key: int, count: int, depth: int):
+        """
+        :param count: The number of solutions of the subproblem
+        :param depth: The size of the subproblem, such as the number of tiles left to place
+        """
+        key = key or 1
+        bucket = self.entries[key & self._bucket_mask]
+        data = min(count, MAX_COUNT) << DEPTH_BITS | min(depth, MAX_DEPTH)
+        check, stored_data = bucket[0].tolist()
+        if check ^ stored_data == key or depth >= stored_data & MAX_DEPTH:
+            bucket[0] = (key ^ data, data)
+        else:
+            bucket[1] = (key ^ data, data)
+
+
+_attached: dict[str, TranspositionTable] = {}
+
+
+def _attach(number_of_entries: int, name: str) -> TranspositionTable:
+    # Every process attaches to a table once, however many tasks it gets it with.
+    if name not in _attached:
+        _attached[name] = TranspositionTable(number_of_entries, name)
+    return _attached[name]
@@ -0,0 +1,91 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from board import BoardObjective, PathObjective, Point, Segment
+from defaultLevels import level7, level48, DEFAULT_TILE_2
+from level import Level
+from parallelSolving import solve_levels
+from solver import BacktrackingSolver, PropagatingSolver
+from tileComponents import COVERED, UNCOVERED, NORTH
+from tiling import Tile
+from transpositionTable import TranspositionTable, zobrist_key
+
+
+def _store_in(table, key, count):
+    table.store(key, count, 1)
+    return table.lookup(key)
+
+
+class TestTranspositionTableMethods(unittest.TestCase):
+    SMALL_TILES_LEVEL = Level(BoardObjective([], shape=(3, 3)),
+                              [Tile([[COVERED, COVERED]]), Tile([[COVERED]]),
+                               Tile([[COVERED, COVERED], [COVERED, UNCOVERED]]), Tile([[COVERED]])])
+    # The tiles do not fill the board and cannot cover both mandatory cells.
+    MANDATORY_CELLS_LEVEL = Level(BoardObjective([PathObjective(Point((0, 1)), [Segment(NORTH, 1)],
+                                                                mandatory_planes=(0,)),
+                                                  PathObjective(Point((0, 3)), [Segment(NORTH, 1)],
+                                                                mandatory_planes=(0,))], shape=(1, 4)),
+                                  [DEFAULT_TILE_2])
+
+    def test_zobrist_key(self):
+        self.assertEqual(zobrist_key('cell', 3), zobrist_key('cell', 3))
+        self.assertNotEqual(zobrist_key('cell', 3), zobrist_key('cell', 4))
+        self.assertLess(zobrist_key('cell', 3), 1 << 64)
+
+    def test_store_and_lookup(self):
+        with TranspositionTable(16) as table:
+            self.assertEqual(len(table), 16)
+            self.assertIsNone(table.lookup(12345))
+            table.store(12345, 7, 3)
+            self.assertEqual(table.lookup(12345), 7)
+            table.store(12345, 0, 3)
+            self.assertEqual(table.lookup(12345), 0)
+            self.assertEqual((table.hits, table.misses), (2, 1))
+
+    def test_replacement_keeps_the_deepest(self):
+        with TranspositionTable(2) as table:
+            table.store(1, 10, 5)
+            table.store(2, 20, 1)
+            table.store(3, 30, 2)
+            self.assertEqual(table.lookup(1), 10)
+            self.assertIsNone(table.lookup(2))
+            self.assertEqual(table.lookup(3), 30)
+            table.store(4, 40, 6)
+            self.assertEqual(table.lookup(4), 40)
+            self.assertIsNone(table.lookup(1))
+
+    def test_shared_with_other_processes(self):
+        with TranspositionTable(64) as table, ProcessPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(executor.submit(_store_in, table, 987654321, 42).result(), 42)
+            self.assertEqual(table.lookup(987654321), 42)
+
+    def test_same_counts_with_a_table(self):
+        for level in (level7, level48, self.SMALL_TILES_LEVEL, self.MANDATORY_CELLS_LEVEL):
+            with TranspositionTable(1 << 12) as table:
+                solver = PropagatingSolver(level, table=table)
+                self.assertEqual(solver.count(), BacktrackingSolver(level).count())
+                self.assertEqual(len(list(PropagatingSolver(level, table=table).solutions())), solver.count())
+
+    def test_fewer_nodes_with_a_table(self):
+        without_table = PropagatingSolver(self.SMALL_TILES_LEVEL)
+        without_table.count()
+        with TranspositionTable(1 << 12) as table:
+            with_table = PropagatingSolver(self.SMALL_TILES_LEVEL, table=table)
+            with_table.count()
+            self.assertLess(with_table.nodes, without_table.nodes)
+            self.assertGreater(table.hits, 0)
+
+    def test_parallel_solving_with_a_shared_table(self):
+        results = solve_levels({"level7": level7, "level48": level48}, processes=2, solver_class=PropagatingSolver,
+                               table_entries=1 << 12)
+        self.assertEqual(results["level7"].count, level7.count_solutions())
+        self.assertEqual(results["level48"].count, 1)
+
+    def test_parallel_count_with_mandatory_cells(self):
+        results = solve_levels({"level": self.MANDATORY_CELLS_LEVEL}, processes=2, solver_class=PropagatingSolver,
+                               count_only=True, table_entries=1 << 12)
+        self.assertEqual(results["level"].count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()